@@ -0,0 +1 @@
+"""Benchmarks for the performance of dragonfly-schema."""
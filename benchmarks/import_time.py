@@ -0,0 +1,115 @@
+"""Benchmark the time to import dragonfly_schema.model and validate a first Model.
+
+The import time is measured with `python -X importtime` in a fresh process so
+that it reflects the cost paid by every CLI call or serverless cold start.
+
+Usage:
+
+.. code-block:: console
+
+    python ./benchmarks/import_time.py --runs 5 --output ./import_time.json
+"""
+import os
+import sys
+import json
+import argparse
+import statistics
+import subprocess
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SAMPLE = os.path.join(ROOT, 'samples', 'model_complete_simple.dfjson')
+
+FIRST_USE_SCRIPT = '''
+import time
+start = time.perf_counter()
+import dragonfly_schema.model
+imported = time.perf_counter()
+with open({sample!r}) as f:
+    dragonfly_schema.model.Model.model_validate_json(f.read())
+validated = time.perf_counter()
+print(imported - start, validated - imported)
+'''
+
+
+def _env():
+    """Get an environment where the dragonfly_schema of this repository is imported."""
+    env = dict(os.environ)
+    env['PYTHONPATH'] = os.pathsep.join(
+        p for p in (ROOT, env.get('PYTHONPATH')) if p)
+    return env
+
+
+def import_times(module='dragonfly_schema.model'):
+    """Get a dictionary of the cumulative import time in milliseconds of each module.
+
+    Args:
+        module: Text for the module to be imported in a fresh process.
+    """
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        capture_output=True, text=True, env=_env(), check=True
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        times[name.strip()] = int(cumulative) / 1000
+    return times
+
+
+def first_use_times():
+    """Get a tuple of (import, first validation) times in milliseconds."""
+    result = subprocess.run(
+        [sys.executable, '-c', FIRST_USE_SCRIPT.format(sample=SAMPLE)],
+        capture_output=True, text=True, env=_env(), check=True
+    )
+    imp, val = result.stdout.split()
+    return float(imp) * 1000, float(val) * 1000
+
+
+def main(runs=5, top=10, output=None, max_import_ms=None):
+    module_times, first_use = [], []
+    for _ in range(runs):
+        module_times.append(import_times())
+        first_use.append(first_use_times())
+
+    model_import = statistics.median(t['dragonfly_schema.model'] for t in module_times)
+    first_import = statistics.median(t[0] for t in first_use)
+    first_validate = statistics.median(t[1] for t in first_use)
+    slowest = sorted(module_times[-1].items(), key=lambda x: x[1], reverse=True)[:top]
+
+    print(f'dragonfly_schema.model import (-X importtime): {model_import:8.1f} ms')
+    print(f'dragonfly_schema.model import (wall clock):   {first_import:8.1f} ms')
+    print(f'first Model validation (builds validators):   {first_validate:8.1f} ms')
+    print(f'\nslowest {top} imports (cumulative ms):')
+    for name, ms in slowest:
+        print(f'  {ms:8.1f}  {name}')
+
+    results = {
+        'runs': runs,
+        'import_ms': model_import,
+        'import_wall_ms': first_import,
+        'first_validation_ms': first_validate,
+        'slowest_imports': dict(slowest)
+    }
+    if output:
+        with open(output, 'w') as f:
+            json.dump(results, f, indent=2)
+    if max_import_ms is not None and model_import > max_import_ms:
+        print(f'\nImport time {model_import:.1f} ms exceeds {max_import_ms} ms.')
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('--runs', type=int, default=5,
+                        help='Number of fresh processes to take the median over.')
+    parser.add_argument('--top', type=int, default=10,
+                        help='Number of the slowest imported modules to report.')
+    parser.add_argument('--output', help='Optional path to a JSON file for results.')
+    parser.add_argument('--max-import-ms', type=float, default=None,
+                        help='Exit with an error if the import takes longer.')
+    args = parser.parse_args()
+    sys.exit(main(args.runs, args.top, args.output, args.max_import_ms))
@@ -0,0 +1,213 @@
+"""Benchmark the memory used to validate, dump and round-trip Models of increasing size.
+
+The peak and the retained memory of each operation are measured with
+tracemalloc for each sample Model and for synthetic Models that repeat the
+Buildings of the largest sample several times. The retained memory is what is
+still allocated after the operation while its result is kept (eg. the
+validated Model), and the peak is the most memory in use at once during the
+operation. Both are divided by the number of Room2Ds in the Model and compared
+to a stored baseline so that the benchmark fails when the memory per Room2D
+grows beyond the baseline by more than a tolerance.
+
+The baseline depends on the versions of Python and pydantic and it should be
+updated with --update-baseline when these change or when an increase in
+memory is intended. The memory job of the CI runs this benchmark with
+--scales 1 2 on the version of Python of the stored baseline (3.11) and it
+fails the build when the memory per Room2D exceeds the baseline.
+
+Usage:
+
+.. code-block:: console
+
+    python ./benchmarks/memory_regression.py
+    python ./benchmarks/memory_regression.py --scales 1 4 16 --tolerance 0.05
+    python ./benchmarks/memory_regression.py --update-baseline
+"""
+import os
+import gc
+import sys
+import json
+import glob
+import copy
+import argparse
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from dragonfly_schema.model import Model  # noqa: E402
+
+BASELINE = os.path.join(ROOT, 'benchmarks', 'memory_baseline.json')
+SCALED_SAMPLE = os.path.join(ROOT, 'samples', 'model_multiple_buildings.dfjson')
+OPERATIONS = ('validate', 'dump', 'round_trip')
+
+
+def scaled_model_json(path, scale):
+    """Get the JSON of a Model with its Buildings repeated a number of times.
+
+    The identifiers of the Buildings, Stories and Room2Ds of each copy (and the
+    boundary conditions that refer to them) get a suffix so that they stay unique.
+
+    Args:
+        path: Path to a DFJSON file of a Model.
+        scale: Integer for the number of copies of each Building.
+    """
+    with open(path) as f:
+        model_dict = json.load(f)
+    buildings = model_dict['buildings']
+    model_dict['buildings'] = []
+    for i in range(scale):
+        for bldg in copy.deepcopy(buildings):
+            _rename(bldg, f'_{i}')
+            model_dict['buildings'].append(bldg)
+    return json.dumps(model_dict)
+
+
+def _rename(obj, suffix):
+    """Add a suffix to the identifiers within a Building dictionary."""
+    if isinstance(obj, dict):
+        if obj.get('type') in ('Building', 'Story', 'Room2D'):
+            obj['identifier'] += suffix
+        if obj.get('type') == 'Surface':
+            obj['boundary_condition_objects'] = [
+                o + suffix for o in obj['boundary_condition_objects']]
+        for value in obj.values():
+            _rename(value, suffix)
+    elif isinstance(obj, list):
+        for value in obj:
+            _rename(value, suffix)
+
+
+def room_count(model):
+    """Get the number of Room2Ds in a Model."""
+    return sum(len(story.room_2ds) for bldg in model.buildings
+               for story in bldg.unique_stories)
+
+
+def measure(function, *args):
+    """Get a tuple of (result, peak bytes, retained bytes) of a function call."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        start = tracemalloc.get_traced_memory()[0]
+        result = function(*args)
+        gc.collect()
+        current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return result, peak - start, current - start
+
+
+def _round_trip(model):
+    """Dump a Model to JSON and validate the JSON back to a Model."""
+    return Model.model_validate_json(model.model_dump_json())
+
+
+def measure_model(model_json):
+    """Get a dictionary of the memory used by each operation on a Model JSON.
+
+    Args:
+        model_json: Text for the JSON of a Model.
+
+    Returns:
+        A dictionary with the number of Room2Ds and, for each operation, the
+        peak and retained bytes as well as these bytes per Room2D.
+    """
+    _round_trip(Model.model_validate_json(model_json))  # build validators first
+    model, val_peak, val_retained = measure(Model.model_validate_json, model_json)
+    _, dump_peak, dump_retained = measure(model.model_dump_json)
+    _, rt_peak, rt_retained = measure(_round_trip, model)
+    rooms = max(room_count(model), 1)
+    results = {'rooms': rooms}
+    for operation, peak, retained in (
+            ('validate', val_peak, val_retained), ('dump', dump_peak, dump_retained),
+            ('round_trip', rt_peak, rt_retained)):
+        results[operation] = {
+            'peak': peak, 'retained': retained,
+            'peak_per_room': peak / rooms, 'retained_per_room': retained / rooms
+        }
+    return results
+
+
+def cases(scales):
+    """Get a list of (name, JSON) tuples for the sample and the scaled Models."""
+    models = []
+    for f_path in sorted(glob.glob(os.path.join(ROOT, 'samples', '*.dfjson'))):
+        with open(f_path) as f:
+            models.append((os.path.basename(f_path), f.read()))
+    for scale in scales:
+        models.append((f'scaled_x{scale}', scaled_model_json(SCALED_SAMPLE, scale)))
+    return models
+
+
+def regressions(results, baseline, tolerance):
+    """Get a list of text for each memory per Room2D that exceeds the baseline."""
+    failures = []
+    for name, result in results.items():
+        for operation in OPERATIONS:
+            base = baseline.get(name, {}).get(operation)
+            if base is None:
+                continue
+            for key in ('peak_per_room', 'retained_per_room'):
+                limit = base[key] * (1 + tolerance)
+                if result[operation][key] > limit:
+                    failures.append(
+                        f'{name} {operation} {key}: {result[operation][key]:.0f} bytes '
+                        f'exceeds the baseline {base[key]:.0f} bytes by more than '
+                        f'{tolerance:.0%}'
+                    )
+    return failures
+
+
+def main(scales=(1, 2, 4, 8), tolerance=0.1, baseline=BASELINE, update_baseline=False,
+         output=None):
+    results = {}
+    print(f'{"model":40} {"rooms":>6} ' + ' '.join(
+        f'{op + " peak/ret kB/room":>26}' for op in OPERATIONS))
+    for name, model_json in cases(scales):
+        res = results[name] = measure_model(model_json)
+        print(f'{name:40} {res["rooms"]:>6} ' + ' '.join(
+            '{:>18.1f} / {:5.1f}'.format(
+                res[op]['peak_per_room'] / 1000, res[op]['retained_per_room'] / 1000)
+            for op in OPERATIONS))
+    if output:
+        with open(output, 'w') as f:
+            json.dump(results, f, indent=2)
+
+    if update_baseline:
+        stored = {
+            name: {op: {k: round(res[op][k]) for k in ('peak_per_room', 'retained_per_room')}
+                   for op in OPERATIONS}
+            for name, res in results.items()
+        }
+        with open(baseline, 'w') as f:
+            json.dump(stored, f, indent=2)
+            f.write('\n')
+        print(f'\nUpdated the baseline at {baseline}')
+        return 0
+    if not os.path.isfile(baseline):
+        print(f'\nNo baseline was found at {baseline}. Run with --update-baseline.')
+        return 1
+    with open(baseline) as f:
+        failures = regressions(results, json.load(f), tolerance)
+    if failures:
+        print('\nMemory regressions:\n  ' + '\n  '.join(failures))
+        return 1
+    print(f'\nThe memory per Room2D of all models is within {tolerance:.0%} of the baseline.')
+    return 0
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('--scales', type=int, nargs='+', default=[1, 2, 4, 8],
+                        help='Number of copies of the Buildings of each scaled Model.')
+    parser.add_argument('--tolerance', type=float, default=0.1,
+                        help='Fraction by which the memory may exceed the baseline.')
+    parser.add_argument('--baseline', default=BASELINE,
+                        help='Path to the JSON file of the baseline.')
+    parser.add_argument('--update-baseline', action='store_true',
+                        help='Write the results as the new baseline instead of checking.')
+    parser.add_argument('--output', help='Optional path to a JSON file for results.')
+    args = parser.parse_args()
+    sys.exit(main(args.scales, args.tolerance, args.baseline, args.update_baseline,
+                  args.output))
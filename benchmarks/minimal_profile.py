@@ -0,0 +1,64 @@
+"""Benchmark the size and parse time of the minimal (exclude-defaults) DFJSON profile.
+
+Each sample Model is written with the default and the minimal profile and the
+size of each JSON along with the median time to validate it is reported.
+
+Usage:
+
+.. code-block:: console
+
+    python ./benchmarks/minimal_profile.py --runs 20 --output ./minimal_profile.json
+"""
+import os
+import sys
+import json
+import glob
+import argparse
+import statistics
+import timeit
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from dragonfly_schema.model import Model  # noqa: E402
+
+
+def parse_ms(model_json, runs):
+    """Get the median time in milliseconds to validate a Model JSON string."""
+    Model.model_validate_json(model_json)  # build the validators before timing
+    times = timeit.repeat(
+        lambda: Model.model_validate_json(model_json), number=1, repeat=runs)
+    return statistics.median(times) * 1000
+
+
+def main(runs=20, output=None):
+    results = {}
+    print(f'{"sample":40} {"size kB":>16} {"parse ms":>16}')
+    for f_path in sorted(glob.glob(os.path.join(ROOT, 'samples', '*.dfjson'))):
+        with open(f_path, 'rb') as f:
+            model = Model.model_validate_json(f.read())
+        full_json = model.model_dump_json()
+        minimal_json = model.model_dump_json(minimal=True)
+        assert Model.model_validate_json(minimal_json) == model
+        name = os.path.basename(f_path)
+        results[name] = {
+            'size': len(full_json), 'minimal_size': len(minimal_json),
+            'parse_ms': parse_ms(full_json, runs),
+            'minimal_parse_ms': parse_ms(minimal_json, runs)
+        }
+        res = results[name]
+        print(f'{name:40} {res["size"] / 1000:7.1f} -> {res["minimal_size"] / 1000:6.1f}'
+              f' {res["parse_ms"]:7.2f} -> {res["minimal_parse_ms"]:6.2f}')
+    if output:
+        with open(output, 'w') as f:
+            json.dump(results, f, indent=2)
+    return 0
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('--runs', type=int, default=20,
+                        help='Number of times to validate each JSON.')
+    parser.add_argument('--output', help='Optional path to a JSON file for results.')
+    args = parser.parse_args()
+    sys.exit(main(args.runs, args.output))
@@ -0,0 +1,152 @@
+"""Load test the validation server with many concurrent requests.
+
+A number of clients send the same DFJSON to the /validate endpoint of the
+server over keep-alive connections and the throughput, the latency
+percentiles and the count of each response status are reported. Requests that
+are rejected by the back-pressure of the server (503) are retried after a
+short delay and their latency includes the retries. If no port or socket is
+given, a server is started within this process for the test.
+
+Usage:
+
+.. code-block:: console
+
+    python ./benchmarks/server_load.py --requests 500 --concurrency 16 --gzip
+    python ./benchmarks/server_load.py --port 8080 --file ./model.dfjson
+"""
+import os
+import sys
+import gzip
+import json
+import time
+import asyncio
+import argparse
+import statistics
+from collections import Counter
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from dragonfly_schema.server import ValidationServer  # noqa: E402
+
+SAMPLE = os.path.join(ROOT, 'samples', 'model_multiple_buildings.dfjson')
+# seconds to wait before a request that was rejected with a 503 is sent again
+RETRY_DELAY = 0.01
+
+
+async def _request(reader, writer, head, body):
+    """Send a request over an open connection and get its status and response body."""
+    writer.write(head + body)
+    await writer.drain()
+    status_line = await reader.readline()
+    headers = {}
+    while True:
+        line = await reader.readline()
+        if line in (b'\r\n', b''):
+            break
+        key, value = line.decode('latin-1').split(':', 1)
+        headers[key.strip().lower()] = value.strip()
+    content = await reader.readexactly(int(headers.get('content-length', 0)))
+    close = headers.get('connection', '').lower() == 'close'
+    return int(status_line.split()[1]), content, close
+
+
+async def _client(connect, head, body, count, latencies, statuses):
+    """Send several requests one after another over a keep-alive connection."""
+    reader, writer = await connect()
+    for _ in range(count):
+        start = time.perf_counter()
+        while True:
+            status, _, close = await _request(reader, writer, head, body)
+            statuses[status] += 1
+            if close:
+                writer.close()
+                reader, writer = await connect()
+            if status != 503:
+                break
+            await asyncio.sleep(RETRY_DELAY)
+        latencies.append(time.perf_counter() - start)
+    writer.close()
+
+
+async def run(host, port, path, body, requests, concurrency, use_gzip):
+    """Run the load test and get a dictionary of results."""
+    if use_gzip:
+        body = gzip.compress(body)
+    head = (
+        'POST /validate HTTP/1.1\r\nHost: {}\r\nContent-Type: application/json\r\n'
+        'Content-Length: {}\r\n{}\r\n'.format(
+            host, len(body), 'Content-Encoding: gzip\r\n' if use_gzip else '')
+    ).encode('latin-1')
+    if path is not None:
+        def connect():
+            return asyncio.open_unix_connection(path)
+    else:
+        def connect():
+            return asyncio.open_connection(host, port)
+
+    latencies, statuses = [], Counter()
+    counts = [requests // concurrency + (i < requests % concurrency)
+              for i in range(concurrency)]
+    start = time.perf_counter()
+    await asyncio.gather(*(
+        _client(connect, head, body, c, latencies, statuses) for c in counts if c))
+    total = time.perf_counter() - start
+    latencies.sort()
+    return {
+        'requests': requests, 'concurrency': concurrency, 'body_size': len(body),
+        'total_time': total, 'throughput': requests / total,
+        'latency_p50': statistics.median(latencies),
+        'latency_p95': latencies[int(0.95 * (len(latencies) - 1))],
+        'latency_p99': latencies[int(0.99 * (len(latencies) - 1))],
+        'statuses': {str(k): v for k, v in sorted(statuses.items())}
+    }
+
+
+async def _run_local(body, requests, concurrency, use_gzip, processes):
+    """Start a server in this process and run the load test against it."""
+    async with ValidationServer(processes=processes) as server:
+        await server.start(port=0)
+        host, port = server.address[:2]
+        return await run(host, port, None, body, requests, concurrency, use_gzip)
+
+
+def main(file=SAMPLE, requests=200, concurrency=8, use_gzip=False, host='127.0.0.1',
+         port=None, socket=None, processes=None, output=None):
+    with open(file, 'rb') as f:
+        body = f.read()
+    if port is None and socket is None:
+        results = asyncio.run(_run_local(body, requests, concurrency, use_gzip, processes))
+    else:
+        results = asyncio.run(
+            run(host, port, socket, body, requests, concurrency, use_gzip))
+    print(f'{requests} requests of {results["body_size"] / 1000:.1f} kB with '
+          f'{concurrency} concurrent clients in {results["total_time"]:.2f} s')
+    print(f'throughput: {results["throughput"]:.1f} requests/s')
+    print('latency ms: p50 {:.2f}  p95 {:.2f}  p99 {:.2f}'.format(
+        *(results[k] * 1000 for k in ('latency_p50', 'latency_p95', 'latency_p99'))))
+    print(f'statuses: {results["statuses"]}')
+    if output:
+        with open(output, 'w') as f:
+            json.dump(results, f, indent=2)
+    return 0
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('--file', default=SAMPLE, help='Path to the DFJSON to send.')
+    parser.add_argument('--requests', type=int, default=200,
+                        help='Total number of requests to send.')
+    parser.add_argument('--concurrency', type=int, default=8,
+                        help='Number of clients sending requests at once.')
+    parser.add_argument('--gzip', action='store_true',
+                        help='Compress the request bodies with gzip.')
+    parser.add_argument('--host', default='127.0.0.1', help='Host of the server.')
+    parser.add_argument('--port', type=int, help='Port of a running server.')
+    parser.add_argument('--socket', help='Unix socket of a running server.')
+    parser.add_argument('--processes', type=int,
+                        help='Number of worker processes of the local server.')
+    parser.add_argument('--output', help='Optional path to a JSON file for results.')
+    args = parser.parse_args()
+    sys.exit(main(args.file, args.requests, args.concurrency, args.gzip, args.host,
+                  args.port, args.socket, args.processes, args.output))
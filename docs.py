@@ -5,7 +5,7 @@ from pkg_resources import get_distribution
 
 from pydantic_openapi_helper.core import get_openapi
 from pydantic_openapi_helper.inheritance import class_mapper
-from dragonfly_schema.model import Model
+from dragonfly_schema.model import Model, build_models
 
 parser = argparse.ArgumentParser(description='Generate OpenAPI JSON schemas')
 
@@ -13,6 +13,9 @@ parser.add_argument('--version', help='Set the version of the new OpenAPI Schema
 
 args = parser.parse_args()
 
+# import the extension properties and resolve all references before documenting
+build_models()
+
 if args.version:
     VERSION = args.version.replace('v', '')
 else:
@@ -0,0 +1,4 @@
+from dragonfly_schema.cli import main
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,166 @@
+"""Build schema objects from JSON dictionaries without validating them.
+
+This is a recursive version of the pydantic model_construct method that builds
+all of the nested objects of a dictionary using the annotations of each field.
+Union fields are resolved using the type key of each dictionary. It is only
+intended for data that is already known to be valid since no validators are
+run and so any transformation that they perform (eg. interning) is skipped.
+Objects that must be transformed to work correctly (eg. schedules that store
+their values in arrays) can register a finalizer that is run on each object
+of their class after it is built.
+"""
+import copy
+from enum import Enum
+from typing import Union, Annotated, get_args, get_origin
+
+from pydantic import BaseModel
+from pydantic_core import PydanticUndefined
+
+_UNION_TYPES = (Union, getattr(__import__('types'), 'UnionType', Union))
+# default values that can be shared between objects without a copy
+_IMMUTABLE = (type(None), str, int, float, bool, tuple, frozenset, Enum)
+
+# converter of each annotation (None if values of the annotation are used as they are)
+_CONVERTERS = {}
+# fields, defaults and private attributes of each object class
+_PLANS = {}
+# functions to finish each object of a class after it is built
+_FINALIZERS = {}
+
+_object_new = object.__new__
+_object_setattr = object.__setattr__
+
+
+def register_finalizer(model_cls, finalizer):
+    """Register a function to be run on each object of a class after it is built.
+
+    Args:
+        model_cls: A pydantic class.
+        finalizer: A function that takes an object of the class, which should
+            transform its values in place in the same way as its validators.
+    """
+    _FINALIZERS[model_cls] = finalizer
+
+
+def _converter(annotation):
+    """Get a function to convert JSON values of an annotation (or None for no change).
+    """
+    try:
+        return _CONVERTERS[annotation]
+    except KeyError:
+        pass
+    except TypeError:  # unhashable annotation
+        return _make_converter(annotation)
+    _CONVERTERS[annotation] = None  # break recursion of self-referencing objects
+    converter = _make_converter(annotation)
+    _CONVERTERS[annotation] = converter
+    return converter
+
+
+def _make_converter(annotation):
+    """Create the function to convert JSON values of an annotation."""
+    origin = get_origin(annotation)
+    if origin is Annotated:
+        return _converter(get_args(annotation)[0])
+    if origin in _UNION_TYPES:
+        return _union_converter(get_args(annotation))
+    if origin is list:
+        args = get_args(annotation)
+        item_converter = _converter(args[0]) if args else None
+        if item_converter is None:
+            return None
+        return lambda values: [item_converter(v) for v in values]
+    if isinstance(annotation, type):
+        if issubclass(annotation, BaseModel):
+            return lambda value: construct(annotation, value) \
+                if isinstance(value, dict) else value
+        if issubclass(annotation, Enum):
+            return annotation
+    return None
+
+
+def _union_converter(options):
+    """Create the function to convert JSON values of a union of several types."""
+    by_type, list_options, enums = {}, [], []
+    for option in options:
+        if isinstance(option, type) and issubclass(option, BaseModel):
+            type_field = option.model_fields.get('type')
+            by_type[type_field.default if type_field is not None else None] = option
+        elif get_origin(option) is list:
+            list_options.append(option)
+        elif isinstance(option, type) and issubclass(option, Enum):
+            enums.append(option)
+    if not by_type and not list_options and not enums:
+        return None
+
+    def convert(value):
+        if isinstance(value, dict):
+            model_cls = by_type.get(value.get('type')) or by_type.get(None)
+            return construct(model_cls, value) if model_cls is not None else value
+        if isinstance(value, list) and list_options:
+            list_converter = _converter(list_options[0])
+            return list_converter(value) if list_converter is not None else value
+        if isinstance(value, str):
+            for enum in enums:
+                try:
+                    return enum(value)
+                except ValueError:
+                    pass
+        return value
+    return convert
+
+
+def _plan(model_cls):
+    """Get the converters, defaults and private attributes of an object class."""
+    try:
+        return _PLANS[model_cls]
+    except KeyError:
+        pass
+    converters, defaults = {}, {}
+    for name, field in model_cls.model_fields.items():
+        converter = _converter(field.annotation)
+        converters[name] = converter
+        if field.default_factory is not None:
+            defaults[name] = (field.default_factory, None)
+        elif field.default is not PydanticUndefined:
+            value = field.default
+            if field.validate_default and converter is not None:
+                value = converter(value)
+            defaults[name] = (None, value)
+    plan = (converters, defaults, model_cls.__private_attributes__)
+    _PLANS[model_cls] = plan
+    return plan
+
+
+def construct(model_cls, data):
+    """Build an object and all of its nested objects from a dictionary without validation.
+
+    Args:
+        model_cls: The pydantic class of the object to be built.
+        data: A JSON dictionary of the object, which should be valid.
+    """
+    converters, defaults, private = _plan(model_cls)
+    values = {}
+    for name, converter in converters.items():
+        if name in data:
+            value = data[name]
+            values[name] = value if converter is None or value is None \
+                else converter(value)
+        else:
+            factory, value = defaults[name]
+            if factory is not None:
+                values[name] = factory()
+            else:
+                values[name] = value if isinstance(value, _IMMUTABLE) \
+                    else copy.deepcopy(value)
+    obj = _object_new(model_cls)
+    _object_setattr(obj, '__dict__', values)
+    _object_setattr(obj, '__pydantic_fields_set__', set(data).intersection(converters))
+    _object_setattr(obj, '__pydantic_extra__', None)
+    _object_setattr(
+        obj, '__pydantic_private__',
+        {k: v.get_default() for k, v in private.items()} if private else None)
+    finalizer = _FINALIZERS.get(model_cls)
+    if finalizer is not None:
+        finalizer(obj)
+    return obj
@@ -0,0 +1,51 @@
+"""Utilities shared by the checks that run over the Buildings and Stories of objects."""
+from honeybee_schema.validation import ValidationParent
+
+
+def buildings(obj):
+    """Get a list of the Buildings of a Model or a Building."""
+    if hasattr(obj, 'buildings'):  # it's a Model
+        return list(obj.buildings or ())
+    return [obj]
+
+
+def stories(obj):
+    """Get a list of (Building, Story) tuples for a Model, Building or Story.
+
+    The Building is None when obj is a Story.
+    """
+    if hasattr(obj, 'buildings'):  # it's a Model
+        return [(bldg, story) for bldg in obj.buildings or ()
+                for story in bldg.unique_stories or ()]
+    if hasattr(obj, 'unique_stories'):  # it's a Building
+        return [(obj, story) for story in obj.unique_stories or ()]
+    return [(None, obj)]
+
+
+def model_tolerance(obj, tolerance, attribute='tolerance', default=0.01):
+    """Get a tolerance for a check, falling back to the Model tolerance.
+
+    Args:
+        obj: A dragonfly Model, Building or Story object.
+        tolerance: The tolerance input to the check, which is returned if
+            it is not None.
+        attribute: The name of the Model attribute to use when tolerance is
+            None and obj is a Model. (Default: tolerance).
+        default: The value to use when tolerance is None and obj is not
+            a Model. (Default: 0.01).
+    """
+    if tolerance is None and hasattr(obj, 'buildings'):  # it's a Model
+        tolerance = getattr(obj, attribute)
+    return default if tolerance is None else tolerance
+
+
+def parents(building, story):
+    """Get a list of ValidationParents for a Story and its Building.
+
+    Either of the two can be None, in which case it is excluded.
+    """
+    return [
+        ValidationParent(parent_type=obj.type, id=obj.identifier,
+                         name=obj.display_name or obj.identifier)
+        for obj in (story, building) if obj is not None
+    ]
@@ -0,0 +1,112 @@
+"""Utilities for rounding coordinates to the Model tolerance upon serialization."""
+import math
+
+# keys of serialized geometry objects (eg. Face3D, Mesh3D) that hold coordinates
+_GEOMETRY_KEYS = ('boundary', 'holes', 'vertices')
+
+
+def coordinate_decimals(tolerance):
+    """Get the number of decimal places to which coordinates should be rounded.
+
+    The number of decimal places is the smallest one for which the rounding
+    step is not larger than the tolerance, meaning that no vertex moves by
+    more than half of the tolerance.
+
+    Args:
+        tolerance: The Model tolerance.
+
+    Returns:
+        An integer for the number of decimals. None if the tolerance is zero,
+        in which case no rounding should happen.
+    """
+    if not tolerance or tolerance <= 0:
+        return None
+    return max(0, math.ceil(-math.log10(tolerance) - 1e-9))
+
+
+def round_coordinates(values, decimals):
+    """Round a nested list of coordinate values in place.
+
+    Args:
+        values: A list of numbers or a (nested) list of lists of numbers.
+        decimals: An integer for the number of decimal places.
+
+    Returns:
+        The input list with all numbers rounded.
+    """
+    for i, val in enumerate(values):
+        if isinstance(val, list):
+            round_coordinates(val, decimals)
+        elif isinstance(val, float):
+            values[i] = round(val, decimals)
+    return values
+
+
+def round_geometry(geometries, decimals):
+    """Round the coordinates of a list of serialized Face3D or Mesh3D dictionaries.
+
+    Args:
+        geometries: A list of dictionaries for serialized geometry objects.
+        decimals: An integer for the number of decimal places.
+
+    Returns:
+        The input list with the coordinates of each geometry rounded in place.
+    """
+    for geo in geometries:
+        for key in _GEOMETRY_KEYS:
+            coords = geo.get(key)
+            if coords is not None:
+                round_coordinates(coords, decimals)
+    return geometries
+
+
+def round_model_dict(model_dict, decimals):
+    """Round all of the coordinates of a serialized dragonfly Model in place.
+
+    This includes Room2D floor_boundary and floor_holes, DetailedWindows and
+    DetailedSkylights polygons, RoofSpecification geometry along with
+    DetailedClearstory base_line and polygons, and ContextShade geometry.
+
+    Args:
+        model_dict: A dictionary of a dragonfly Model (eg. from model_dump).
+        decimals: An integer for the number of decimal places.
+
+    Returns:
+        The input dictionary with all coordinates rounded.
+    """
+    for bldg in model_dict.get('buildings') or ():
+        _round_roof(bldg.get('roof'), decimals)
+        for story in bldg.get('unique_stories') or ():
+            _round_roof(story.get('roof'), decimals)
+            for room in story.get('room_2ds') or ():
+                _round_room_2d(room, decimals)
+    for shade in model_dict.get('context_shades') or ():
+        round_geometry(shade.get('geometry') or (), decimals)
+    return model_dict
+
+
+def _round_room_2d(room, decimals):
+    """Round the coordinates of a serialized Room2D in place."""
+    for key in ('floor_boundary', 'floor_holes'):
+        coords = room.get(key)
+        if coords is not None:
+            round_coordinates(coords, decimals)
+    win_pars = room.get('window_parameters')
+    if isinstance(win_pars, dict):  # compact segment parameters
+        win_pars = [win_pars.get('default')] + (win_pars.get('values') or [])
+    for win_par in win_pars or ():
+        if win_par is not None and win_par.get('type') == 'DetailedWindows':
+            round_coordinates(win_par['polygons'], decimals)
+    sky_par = room.get('skylight_parameters')
+    if sky_par is not None and sky_par.get('type') == 'DetailedSkylights':
+        round_coordinates(sky_par['polygons'], decimals)
+
+
+def _round_roof(roof, decimals):
+    """Round the coordinates of a serialized RoofSpecification in place."""
+    if roof is None:
+        return
+    round_geometry(roof.get('geometry') or (), decimals)
+    for clear_par in roof.get('clearstory_parameters') or ():
+        round_coordinates(clear_par['base_line'], decimals)
+        round_coordinates(clear_par['polygons'], decimals)
@@ -0,0 +1,218 @@
+"""Validate many DFJSON files in parallel with a report of each file.
+
+Starting a new Python process for each file pays the cost of importing and
+building the schema validators every time. The validate_files function in
+this module instead builds them once in each worker of a process pool and
+validates all of the files across the pool. The top-level object of each file
+(eg. Model, Building, Story, Room2D) is detected from its type key within the
+same validation pass.
+
+Each file gets a report dictionary with its path, its top-level type, a status
+(valid, invalid or error for files that could not be read or parsed), a list
+of errors with the JSON pointer of each invalid value, the file size in
+bytes, the time to parse and validate it in seconds and the peak memory in
+bytes of the Python objects allocated while validating it. Note that the
+peak memory is measured with tracemalloc, which slows down validation and
+does not include the memory of the Rust JSON parser of pydantic-core.
+
+Usage:
+
+.. code-block:: console
+
+    dragonfly-schema validate ./models "./projects/**/*.dfjson" --output-file report.ndjson
+
+.. code-block:: python
+
+    from dragonfly_schema.batch import collect_files, validate_files
+
+    for report in validate_files(collect_files(['./models'])):
+        print(report['path'], report['status'])
+"""
+import os
+import glob
+import json
+import time
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+from typing import Union, Annotated
+
+from pydantic import Field, TypeAdapter, ValidationError
+
+from . import model
+from .lenient import json_pointer
+
+FILE_EXTENSIONS = ('.dfjson', '.json')
+
+_ADAPTER = None
+
+
+def collect_files(inputs):
+    """Get a sorted list of the DFJSON files of several globs, directories or files.
+
+    Args:
+        inputs: A list of text for glob patterns (eg. ./projects/**/*.dfjson),
+            directories or file paths. Directories are searched recursively
+            for .dfjson and .json files.
+    """
+    files = set()
+    for item in inputs:
+        if os.path.isdir(item):
+            for root, _, f_names in os.walk(item):
+                files.update(
+                    os.path.join(root, f) for f in f_names
+                    if f.lower().endswith(FILE_EXTENSIONS))
+        elif os.path.isfile(item):
+            files.add(item)
+        else:
+            files.update(
+                f for f in glob.glob(item, recursive=True) if os.path.isfile(f))
+    return sorted(files)
+
+
+def top_level_adapter():
+    """Get a TypeAdapter for any of the top-level objects of a DFJSON file."""
+    global _ADAPTER
+    if _ADAPTER is None:
+        model.build_models()
+        _ADAPTER = TypeAdapter(Annotated[
+            Union[model.Model, model.Building, model.Story, model.Room2D,
+                  model.ContextShade],
+            Field(discriminator='type')
+        ])
+    return _ADAPTER
+
+
+def validate_data(data, memory=False):
+    """Validate the bytes of a JSON file and get a report dictionary of the result.
+
+    Args:
+        data: The bytes (or text) of a DFJSON file (or of the JSON of a Building,
+            Story, Room2D or ContextShade).
+        memory: Boolean to note whether the peak memory of the validation
+            should be measured with tracemalloc. (Default: False).
+
+    Returns:
+        A report dictionary without the path of the file.
+    """
+    adapter = top_level_adapter()
+    report = {
+        'type': None, 'status': 'valid', 'errors': [],
+        'size': len(data), 'parse_time': None, 'peak_memory': None
+    }
+    if memory:
+        tracemalloc.start()
+    start = time.perf_counter()
+    try:
+        obj = adapter.validate_json(data)
+        report['type'] = obj.type
+    except ValidationError as e:
+        errors = e.errors()
+    else:
+        errors = None
+    finally:
+        report['parse_time'] = round(time.perf_counter() - start, 6)
+        if memory:
+            report['peak_memory'] = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+    if errors is None:
+        return report
+
+    try:
+        obj_dict = json.loads(data)
+    except ValueError:  # not JSON so the first error is the parsing error
+        report['status'] = 'error'
+        report['errors'].append({'path': '', 'message': errors[0]['msg']})
+        return report
+    report['status'] = 'invalid'
+    if isinstance(obj_dict, dict) and isinstance(obj_dict.get('type'), str):
+        report['type'] = obj_dict['type']
+    for error in errors:
+        report['errors'].append(
+            {'path': json_pointer(obj_dict, error), 'message': error['msg']})
+    return report
+
+
+def validate_file(path, memory=True):
+    """Validate a file and get a report dictionary of the result.
+
+    Args:
+        path: The path to a DFJSON file (or a JSON file of a Building, Story,
+            Room2D or ContextShade).
+        memory: Boolean to note whether the peak memory of the validation
+            should be measured with tracemalloc. (Default: True).
+    """
+    try:
+        with open(path, 'rb') as f:
+            data = f.read()
+    except OSError as e:
+        return {
+            'path': path, 'type': None, 'status': 'error',
+            'errors': [{'path': '', 'message': str(e)}],
+            'size': None, 'parse_time': None, 'peak_memory': None
+        }
+    report = {'path': path}
+    report.update(validate_data(data, memory))
+    return report
+
+
+def _validate_file(args):
+    """Validate a file from a tuple of arguments within a worker process."""
+    return validate_file(*args)
+
+
+def validate_files(files, processes=None, memory=True, chunk_size=4):
+    """Validate several files across a pool of processes.
+
+    Args:
+        files: A list of paths to the files to be validated.
+        processes: An integer for the number of worker processes. If None, the
+            number of CPUs will be used. If 1, the files are validated in
+            the current process. (Default: None).
+        memory: Boolean to note whether the peak memory of the validation of
+            each file should be measured. (Default: True).
+        chunk_size: An integer for the number of files that are sent to a
+            worker at a time. Larger chunks reduce the overhead of sending
+            files to the workers for large numbers of small files. (Default: 4).
+
+    Returns:
+        An iterator of the report dictionary of each file, in the order of the
+        input files. The reports are produced as soon as they are ready.
+    """
+    args = [(f, memory) for f in files]
+    if processes == 1 or len(args) <= 1:
+        for arg in args:
+            yield _validate_file(arg)
+        return
+    with ProcessPoolExecutor(max_workers=processes,
+                             initializer=top_level_adapter) as executor:
+        yield from executor.map(_validate_file, args, chunksize=chunk_size)
+
+
+def write_report(reports, output, ndjson=False):
+    """Write file reports to a text file and get the number of files that are not valid.
+
+    Args:
+        reports: An iterable of file report dictionaries (eg. from validate_files).
+        output: A text file object to which the report will be written.
+        ndjson: Boolean to note whether each report should be written on its
+            own line as soon as it is ready (NDJSON) instead of writing a
+            single JSON object with a summary and a list of all reports
+            once all files are done. (Default: False).
+    """
+    failed, all_reports, start = 0, [], time.perf_counter()
+    for report in reports:
+        failed += report['status'] != 'valid'
+        if ndjson:
+            output.write(json.dumps(report) + '\n')
+            output.flush()
+        else:
+            all_reports.append(report)
+    if not ndjson:
+        summary = {
+            'file_count': len(all_reports), 'invalid_count': failed,
+            'total_time': round(time.perf_counter() - start, 6)
+        }
+        json.dump({'summary': summary, 'files': all_reports}, output, indent=2)
+        output.write('\n')
+    return failed
+
@@ -0,0 +1,88 @@
+"""Command Line Interface (CLI) entry point for dragonfly schema."""
+
+try:
+    import click
+except ImportError:
+    raise ImportError(
+        'click module is not installed. Try `pip install dragonfly-schema[cli]` command.'
+    )
+
+import sys
+
+from dragonfly_schema.batch import collect_files, validate_files, write_report
+from dragonfly_schema.server import serve as _serve, MAX_BODY_SIZE
+
+
+@click.group()
+@click.version_option()
+def main():
+    pass
+
+
+@main.command('validate')
+@click.argument('inputs', nargs=-1, required=True)
+@click.option('--processes', '-p', help='Integer for the number of worker processes '
+              'across which the files will be validated. By default, the number '
+              'of CPUs will be used.', type=int, default=None)
+@click.option('--ndjson/--json', help='Flag to note whether the report '
+              'should be written as NDJSON with one line for each file as soon as '
+              'it is validated or as a single JSON object with a summary once all '
+              'files are done.', default=True, show_default=True)
+@click.option('--memory/--no-memory', help='Flag to note whether the '
+              'peak memory of the validation of each file should be measured. '
+              'Measuring memory slows down validation.', default=True,
+              show_default=True)
+@click.option('--output-file', '-f', help='Optional file to output the report. '
+              'By default, it will be printed out to stdout',
+              type=click.File('w'), default='-', show_default=True)
+def validate(inputs, processes, ndjson, memory, output_file):
+    """Validate many DFJSON files in parallel and report the result of each file.
+
+    The top-level object of each file (Model, Building, Story, Room2D or
+    ContextShade) is detected from its type. The exit code is 1 if any
+    of the files is invalid.
+
+    \b
+    Args:
+        inputs: Any number of glob patterns (eg. "./projects/**/*.dfjson"),
+            directories or file paths. Directories are searched recursively
+            for .dfjson and .json files.
+    """
+    files = collect_files(inputs)
+    if not files:
+        raise click.UsageError('No files were found for the inputs.')
+    reports = validate_files(files, processes=processes, memory=memory)
+    failed = write_report(reports, output_file, ndjson=ndjson)
+    sys.exit(1 if failed else 0)
+
+
+@main.command('serve')
+@click.option('--host', '-h', help='Host on which the server will listen.',
+              type=str, default='127.0.0.1', show_default=True)
+@click.option('--port', '-p', help='Port on which the server will listen.',
+              type=int, default=8080, show_default=True)
+@click.option('--socket', '-s', help='Optional path to a Unix socket on which the '
+              'server will listen instead of the host and port.',
+              type=click.Path(dir_okay=False, resolve_path=True), default=None)
+@click.option('--processes', '-w', help='Integer for the number of warm worker '
+              'processes. By default, the number of CPUs will be used.',
+              type=int, default=None)
+@click.option('--max-size', '-ms', help='Integer for the maximum size in bytes of '
+              'a request body after it is decompressed.', type=int,
+              default=MAX_BODY_SIZE, show_default=True)
+@click.option('--max-pending', '-mp', help='Integer for the maximum number of '
+              'requests that can be validating or waiting for a worker at once. '
+              'Further requests are rejected with a 503. By default, it will be '
+              'twice the number of processes.', type=int, default=None)
+@click.option('--memory/--no-memory', help='Flag to note whether the peak memory '
+              'of the validation of each request should be measured.',
+              default=False, show_default=True)
+def serve(host, port, socket, processes, max_size, max_pending, memory):
+    """Run a local server that validates DFJSON with a pool of warm processes.
+
+    POST the JSON of a Model, Building, Story, Room2D or ContextShade
+    (optionally with Content-Encoding: gzip) to /validate. GET /metrics
+    for a summary of all requests.
+    """
+    _serve(host, port, socket, processes=processes, max_size=max_size,
+           max_pending=max_pending, memory=memory)
@@ -0,0 +1,227 @@
+"""Content-addressed deduplication of the energy resources of a Model.
+
+Models that are merged from several sources often contain the same schedule,
+construction or program under different identifiers. The dedupe_energy_resources
+function hashes each resource of a Model dictionary by its content (without its
+identifier and display_name), removes all but the first resource of each hash
+and rewrites all references to the removed resources.
+
+Identifiers only need to be unique among the resources of the same type and
+so the removed identifiers are tracked separately for each type of resource.
+Only the fields that reference that type of resource are rewritten (eg. a
+program_type is never rewritten to a schedule that has the same identifier).
+
+Since resources reference one another (eg. constructions reference materials),
+removing duplicates of one type of resource can make others identical and so
+the deduplication is repeated until no more duplicates are found.
+
+Usage:
+
+.. code-block:: python
+
+    with open('model.dfjson') as f:
+        model_dict = json.load(f)
+    report = dedupe_energy_resources(model_dict)
+    model = Model.model_validate(model_dict)
+"""
+import json
+import hashlib
+from typing import Dict, NamedTuple
+
+# keys of the ModelEnergyProperties with resources that can be shared by any object
+# hvacs and shws are excluded since each one is a separate system in the simulation
+RESOURCE_KEYS = (
+    'schedule_type_limits', 'schedules', 'materials', 'constructions',
+    'construction_sets', 'program_types'
+)
+# keys of the ModelEnergyProperties with resources that reference the RESOURCE_KEYS
+REFERENCING_KEYS = RESOURCE_KEYS + ('hvacs', 'shws')
+# keys that never hold references to resources
+_NAME_KEYS = ('identifier', 'display_name')
+_SKIPPED_KEYS = ('type', 'user_data') + _NAME_KEYS
+# keys that reference the day schedules nested within a ScheduleRuleset
+_LOCAL_KEYS = (
+    'default_day_schedule', 'summer_designday_schedule', 'winter_designday_schedule',
+    'holiday_schedule', 'schedule_day'
+)
+
+
+class DedupeReport(NamedTuple):
+    """Summary of the resources that were removed from a Model."""
+
+    removed: Dict[str, Dict[str, str]]
+    """Dictionary with a key for each type of resource (eg. schedules) and values
+    that are dictionaries of the identifiers of removed resources to the ones
+    that replaced them."""
+
+    bytes_saved: int
+    """Number of bytes of the compact JSON of the removed resources."""
+
+    @property
+    def object_count(self):
+        """Get the number of resources that were removed."""
+        return sum(len(removed) for removed in self.removed.values())
+
+
+def _local_identifiers(obj, identifiers):
+    """Collect the identifiers of the objects nested within a resource, in order."""
+    if isinstance(obj, dict):
+        nested_id = obj.get('identifier')
+        if isinstance(nested_id, str) and nested_id not in identifiers:
+            identifiers[nested_id] = f'#{len(identifiers)}'
+        for value in obj.values():
+            _local_identifiers(value, identifiers)
+    elif isinstance(obj, list):
+        for value in obj:
+            _local_identifiers(value, identifiers)
+    return identifiers
+
+
+def _canonical(obj, identifiers):
+    """Get a copy of a resource with names removed and nested identifiers replaced."""
+    if isinstance(obj, dict):
+        return {k: _canonical(v, identifiers) for k, v in obj.items()
+                if k not in _NAME_KEYS or k == 'identifier'}
+    if isinstance(obj, list):
+        return [_canonical(v, identifiers) for v in obj]
+    if isinstance(obj, str):
+        return identifiers.get(obj, obj)
+    return obj
+
+
+def content_hash(resource):
+    """Get a hash of the content of a resource dictionary.
+
+    The identifier and display_name of the resource are excluded from the hash.
+    Objects nested within the resource (eg. the day schedules of a
+    ScheduleRuleset or the loads of a ProgramType) are hashed without their
+    display_name and their identifiers are replaced with their order in the
+    resource such that resources with differently-named nested objects have the
+    same hash as long as they reference one another in the same way.
+
+    Args:
+        resource: A dictionary of an energy resource (eg. a ScheduleRuleset).
+    """
+    identifiers = {}
+    for key, value in resource.items():
+        if key not in _SKIPPED_KEYS:
+            _local_identifiers(value, identifiers)
+    content = {k: _canonical(v, identifiers)
+               for k, v in resource.items() if k not in _NAME_KEYS}
+    content = json.dumps(content, sort_keys=True, separators=(',', ':'))
+    return hashlib.sha256(content.encode('utf-8')).hexdigest()
+
+
+def _reference_type(key):
+    """Get the RESOURCE_KEYS item referenced by a field or None if it is not a reference.
+    """
+    if key in _LOCAL_KEYS:
+        return None
+    if key == 'program_type':
+        return 'program_types'
+    if key == 'construction_set':
+        return 'construction_sets'
+    if key == 'schedule_type_limit':
+        return 'schedule_type_limits'
+    if key in ('materials', 'frame') or key.endswith('material'):
+        return 'materials'
+    if key == 'constructions' or key.endswith('construction'):
+        return 'constructions'
+    if key.endswith(('schedule', '_availability')):
+        return 'schedules'
+    return None
+
+
+def _rewrite_references(obj, removed, field=None):
+    """Replace all references to removed identifiers within an object in place.
+
+    Args:
+        obj: A dictionary or list to be rewritten.
+        removed: A dictionary with RESOURCE_KEYS as keys and dictionaries of the
+            removed identifiers to their replacements as values.
+        field: The key of the field that holds obj, which is used for the
+            strings within lists. (Default: None).
+    """
+    if isinstance(obj, dict):
+        for key, value in obj.items():
+            if key in _SKIPPED_KEYS:
+                continue
+            if isinstance(value, str):
+                replaced = removed.get(_reference_type(key))
+                if replaced and value in replaced:
+                    obj[key] = replaced[value]
+            else:
+                _rewrite_references(value, removed, key)
+    elif isinstance(obj, list):
+        replaced = removed.get(_reference_type(field)) if field else None
+        for i, value in enumerate(obj):
+            if isinstance(value, str):
+                if replaced and value in replaced:
+                    obj[i] = replaced[value]
+            else:
+                _rewrite_references(value, removed, field)
+
+
+def _energy_properties(obj, energy_props):
+    """Collect all of the energy properties dictionaries nested within an object."""
+    if isinstance(obj, dict):
+        for key, value in obj.items():
+            if key == 'energy' and isinstance(value, dict):
+                energy_props.append(value)
+            else:
+                _energy_properties(value, energy_props)
+    elif isinstance(obj, list):
+        for value in obj:
+            _energy_properties(value, energy_props)
+    return energy_props
+
+
+def dedupe_energy_resources(model_dict):
+    """Remove duplicated energy resources from a Model dictionary in place.
+
+    References to the removed resources are rewritten within the other resources,
+    hvacs and shws of the ModelEnergyProperties as well as within the energy properties of all
+    Room2Ds, Stories, Buildings, ContextShades and Building room_3ds.
+
+    Args:
+        model_dict: A dictionary of a dragonfly Model (eg. loaded from a DFJSON
+            or from Model.model_dump). The Model energy properties should not
+            be abridged to a raw profile.
+
+    Returns:
+        A DedupeReport with the identifiers of the removed resources of each
+        type and the number of bytes that they used in the compact JSON of
+        the Model.
+    """
+    model_energy = (model_dict.get('properties') or {}).get('energy')
+    if not model_energy:
+        return DedupeReport({}, 0)
+    all_removed, bytes_saved = {key: {} for key in RESOURCE_KEYS}, 0
+    while True:
+        removed = {}
+        for key in RESOURCE_KEYS:
+            resources = model_energy.get(key)
+            if not resources:
+                continue
+            unique, kept = {}, []
+            for res in resources:
+                first = unique.setdefault(content_hash(res), res)
+                if first is res:
+                    kept.append(res)
+                else:
+                    removed.setdefault(key, {})[res['identifier']] = first['identifier']
+                    bytes_saved += len(json.dumps(res, separators=(',', ':')))
+            model_energy[key] = kept
+        if not removed:
+            return DedupeReport(
+                {k: v for k, v in all_removed.items() if v}, bytes_saved)
+        for key, key_removed in removed.items():
+            key_all = all_removed[key]
+            for old_id, new_id in key_all.items():  # collapse chains of removals
+                key_all[old_id] = key_removed.get(new_id, new_id)
+            key_all.update(key_removed)
+        for key in REFERENCING_KEYS:
+            _rewrite_references(model_energy.get(key), removed)
+        objects = [model_dict.get('buildings'), model_dict.get('context_shades')]
+        for energy_props in _energy_properties(objects, []):
+            _rewrite_references(energy_props, removed)
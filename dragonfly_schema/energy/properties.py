@@ -1,5 +1,6 @@
 """Model energy properties."""
-from pydantic import Field
+from functools import partial
+from pydantic import Field, field_validator
 from typing import List, Union, Literal, Optional
 
 from honeybee_schema._base import NoExtraBaseModel
@@ -29,7 +30,12 @@ from honeybee_schema.energy.material import EnergyMaterial, EnergyMaterialNoMass
     EnergyWindowMaterialSimpleGlazSys, EnergyWindowMaterialGlazing, \
     EnergyWindowMaterialShade, EnergyWindowMaterialBlind
 from honeybee_schema.energy.schedule import ScheduleTypeLimit, ScheduleRulesetAbridged, \
-    ScheduleFixedIntervalAbridged, ScheduleRuleset, ScheduleFixedInterval
+    ScheduleRuleset, ScheduleFixedInterval
+
+from .schedule import ScheduleFixedIntervalAbridged
+from ..interning import intern_identifier, shared_default, share_default, \
+    shared_default_schema, validate_shared_default
+from .._construct import register_finalizer
 
 
 class Room2DEnergyPropertiesAbridged(NoExtraBaseModel):
@@ -160,6 +166,12 @@ class Room2DEnergyPropertiesAbridged(NoExtraBaseModel):
         'given a HVAC that can meet this specification.'
     )
 
+    @field_validator('construction_set', 'program_type', 'hvac', 'shw')
+    @classmethod
+    def intern_identifiers(cls, v):
+        "Intern resource identifiers that are shared across many Room2Ds."
+        return intern_identifier(v)
+
 
 class StoryEnergyPropertiesAbridged(NoExtraBaseModel):
 
@@ -175,6 +187,12 @@ class StoryEnergyPropertiesAbridged(NoExtraBaseModel):
         'assigned here will override those assigned to these objects.'
     )
 
+    @field_validator('construction_set')
+    @classmethod
+    def intern_identifiers(cls, v):
+        "Intern resource identifiers that are shared across many Stories."
+        return intern_identifier(v)
+
 
 class BuildingEnergyPropertiesAbridged(NoExtraBaseModel):
 
@@ -235,11 +253,17 @@ class ModelEnergyProperties(NoExtraBaseModel):
     type: Literal['ModelEnergyProperties'] = 'ModelEnergyProperties'
 
     global_construction_set: GlobalConstructionSet = Field(
-        default=GlobalConstructionSet(),
+        default_factory=partial(shared_default, GlobalConstructionSet),
         description='Global Energy construction set.',
-        json_schema_extra={'readOnly': True}
+        json_schema_extra=partial(shared_default_schema, GlobalConstructionSet)
     )
 
+    @field_validator('global_construction_set', mode='wrap')
+    @classmethod
+    def share_global_construction_set(cls, v, handler):
+        "Use one shared GlobalConstructionSet for all Models with the default one."
+        return validate_shared_default(v, handler, GlobalConstructionSet)
+
     construction_sets: Union[
         List[Union[ConstructionSetAbridged, ConstructionSet]], None
     ] = Field(
@@ -307,3 +331,12 @@ class ModelEnergyProperties(NoExtraBaseModel):
         description='A list of all unique ScheduleTypeLimits in the model. This '
         'all ScheduleTypeLimits needed to make the Model schedules.'
     )
+
+
+def _share_global_set(properties):
+    """Use the shared GlobalConstructionSet for properties built without validation."""
+    properties.__dict__['global_construction_set'] = \
+        share_default(properties.global_construction_set, GlobalConstructionSet)
+
+
+register_finalizer(ModelEnergyProperties, _share_global_set)
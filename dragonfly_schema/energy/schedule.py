@@ -0,0 +1,228 @@
+"""Schedules with values that can be stored in a compact binary encoding."""
+import sys
+import base64
+import datetime
+from array import array
+from pydantic import Field, PrivateAttr, SerializationInfo, field_validator, \
+    field_serializer, model_validator
+from typing import List, Union, Literal, Annotated
+
+from honeybee_schema._base import NoExtraBaseModel
+from honeybee_schema.energy._base import IDdEnergyBaseModel
+
+from .._construct import register_finalizer
+
+# array typecodes for each of the data types of encoded values
+_TYPECODES = {'float64': 'd', 'float32': 'f'}
+_BINARY_TYPES = (bytes, bytearray, memoryview)
+
+
+class EncodedValues(NoExtraBaseModel):
+    """A list of numbers encoded as the base64 text of their little-endian binary."""
+
+    type: Literal['EncodedValues'] = 'EncodedValues'
+
+    dtype: Literal['float64', 'float32'] = Field(
+        'float64',
+        description='Text for the binary data type of each value. Note that float32 '
+        'halves the size of the data but it only preserves about 7 significant '
+        'digits of each value.'
+    )
+
+    data: str = Field(
+        ...,
+        description='Base64 text of the little-endian binary values.'
+    )
+
+
+def _binary_array(data, typecode):
+    """Get an array from the little-endian binary data of some values."""
+    arr = array(typecode)
+    arr.frombytes(data)
+    if sys.byteorder == 'big':
+        arr.byteswap()
+    return arr
+
+
+def encode_values(values, dtype='float64'):
+    """Get an EncodedValues object from a list of numbers.
+
+    Args:
+        values: A list (or array) of numbers.
+        dtype: Text for the binary data type. Either float64 or float32.
+    """
+    arr = array(_TYPECODES[dtype], values)
+    if sys.byteorder == 'big':
+        arr.byteswap()
+    return EncodedValues(dtype=dtype, data=base64.b64encode(arr.tobytes()).decode())
+
+
+def decode_values(values):
+    """Get an array of numbers from an EncodedValues object.
+
+    Args:
+        values: An EncodedValues object.
+
+    Returns:
+        An array('d') for float64 values or an array('f') for float32 values.
+    """
+    return _binary_array(
+        base64.b64decode(values.data, validate=True), _TYPECODES[values.dtype])
+
+
+class ScheduleFixedIntervalAbridged(IDdEnergyBaseModel):
+    """Used to specify a start date and a list of values for a period of analysis.
+
+    This matches the honeybee ScheduleFixedIntervalAbridged except that the values
+    can also be an EncodedValues object or, when validating from a
+    binary format (eg. msgpack), the bytes of little-endian float64 values. The
+    values are stored in memory as an array('d') (or an array('f') for float32
+    EncodedValues), which uses a fraction of the memory of a list of floats. The
+    values are written in the same form that they were loaded unless a
+    schedule_values key is in the serialization context. Use a value of list
+    to write the standard list of numbers or either float64 or float32 to write
+    EncodedValues. For example, model.model_dump_json(context={'schedule_values':
+    'list'}).
+    """
+
+    type: Literal['ScheduleFixedIntervalAbridged'] = 'ScheduleFixedIntervalAbridged'
+
+    values: Union[
+        Annotated[List[float], Field(min_length=24, max_length=527040)], EncodedValues
+    ] = Field(
+        ...,
+        description='A list of timeseries values occurring at each timestep over '
+        'the course of the simulation. This can also be an EncodedValues object '
+        'with the base64 text of the binary values, which is more compact.'
+    )
+
+    schedule_type_limit: Union[str, None] = Field(
+        default=None,
+        min_length=1,
+        max_length=100,
+        description='Identifier of a ScheduleTypeLimit that will be used to validate '
+        'schedule values against upper/lower limits and assign units to the '
+        'schedule values. If None, no validation will occur.'
+    )
+
+    timestep: int = Field(
+        1,
+        description='An integer for the number of steps per hour that the input '
+        'values correspond to.  For example, if each value represents 30 '
+        'minutes, the timestep is 2. For 15 minutes, it is 4.'
+    )
+
+    @field_validator('timestep')
+    @classmethod
+    def check_timestep(cls, v: int) -> int:
+        "Ensure the timestep is acceptable by EnergyPlus."
+        valid_timesteps = (1, 2, 3, 4, 5, 6, 10, 12, 15, 20, 30, 60)
+        assert v in valid_timesteps, '"{}" is not a valid timestep. ' \
+            'Choose from {}'.format(v, valid_timesteps)
+        return v
+
+    start_date: List[int] = Field(
+        [1, 1],
+        min_length=2,
+        max_length=3,
+        description='A list of two integers for [month, day], representing the start '
+        'date when the schedule values begin to take effect.'
+        'A third integer may be added to denote whether the date should be '
+        're-serialized for a leap year (it should be a 1 in this case).'
+    )
+
+    @field_validator('start_date')
+    @classmethod
+    def check_start_date(cls, v: List[int]) -> List[int]:
+        "Ensure the start_date is a valid date."
+        year = 2016 if len(v) == 3 and v[2] else 2017
+        try:
+            datetime.date(year, v[0], v[1])
+        except ValueError:
+            raise ValueError('{}/{} is not a valid date.'.format(v[0], v[1]))
+        return v
+
+    placeholder_value: float = Field(
+        0,
+        description=' A value that will be used for all times not covered by the '
+        'input values. Typically, your simulation should not need to use this '
+        'value if the input values completely cover the simulation period.'
+    )
+
+    interpolate: bool = Field(
+        False,
+        description='Boolean to note whether values in between intervals should be '
+        'linearly interpolated or whether successive values should take effect '
+        'immediately upon the beginning time corresponding to them.'
+    )
+
+    _dtype: Union[str, None] = PrivateAttr(default=None)
+
+    @field_validator('values', mode='wrap')
+    @classmethod
+    def compact_values(cls, v, handler):
+        "Store the values in a compact array."
+        if isinstance(v, _BINARY_TYPES):  # float64 values from binary formats
+            return _binary_array(v, 'd')
+        v = handler(v)
+        return decode_values(v) if isinstance(v, EncodedValues) else array('d', v)
+
+    @model_validator(mode='after')
+    def check_number_of_values(self):
+        "Ensure an acceptable number of schedule values."
+        if len(self.values) < 24 * self.timestep:
+            raise ValueError('Number of schedule values must be for at least one day, '
+                             f'with a length greater than 24 * {self.timestep}.')
+        max_l = self.timestep * 8760 if len(self.start_date) != 3 or \
+            not self.start_date[2] else self.timestep * 8784
+        if len(self.values) > max_l:
+            raise ValueError('Number of schedule values must not exceed a full year, '
+                             f'with a length less than or equal to {max_l}.')
+        if len(self.values) % (24 * self.timestep) != 0:
+            raise ValueError(
+                'Number of schedule values must be for a whole number of days.')
+        return self
+
+    @model_validator(mode='wrap')
+    @classmethod
+    def remember_encoding(cls, data, handler):
+        "Remember if the values were encoded so that they are written the same way."
+        schedule = handler(data)
+        values = data.get('values') if isinstance(data, dict) else None
+        if isinstance(values, dict):
+            schedule._dtype = values.get('dtype', 'float64')
+        elif isinstance(values, EncodedValues):
+            schedule._dtype = values.dtype
+        elif isinstance(values, _BINARY_TYPES):
+            schedule._dtype = 'float64'
+        return schedule
+
+    def __eq__(self, other):
+        "Compare the dumped schedules without the encoding of their input values."
+        if isinstance(other, ScheduleFixedIntervalAbridged):
+            context = {'schedule_values': 'list'}
+            return type(self) is type(other) and \
+                self.model_dump(context=context) == other.model_dump(context=context)
+        return NotImplemented
+
+    @field_serializer('values')
+    def serialize_values(self, values, info: SerializationInfo):
+        "Write the values as a list or as EncodedValues."
+        context = info.context if isinstance(info.context, dict) else {}
+        form = context.get('schedule_values', self._dtype)
+        if form is None or form == 'list':
+            return values.tolist()
+        return encode_values(values, form).model_dump()
+
+
+def _compact_constructed(schedule):
+    """Store the values of a schedule that was built without validation in an array."""
+    values = schedule.values
+    if isinstance(values, EncodedValues):
+        schedule._dtype = values.dtype
+        schedule.__dict__['values'] = decode_values(values)
+    elif not isinstance(values, array):
+        schedule.__dict__['values'] = array('d', values)
+
+
+register_finalizer(ScheduleFixedIntervalAbridged, _compact_constructed)
@@ -0,0 +1,600 @@
+"""Vectorized sanity checks of the floor polygons and skylights of Room2Ds.
+
+Floor polygons with duplicate vertices (zero-length segments), redundant
+colinear vertices or a clockwise floor_boundary are valid according to the schema but
+they break the translation of the Model much later. The check_floor_polygons
+function finds all of these issues at once by stacking the floor_boundary
+and floor_holes of all Room2Ds in a Story into a single NumPy array. With
+clean=True, the issues are also fixed on the Room2Ds and the per-segment
+boundary_conditions, window_parameters, shading_parameters and
+air_boundaries are remapped to stay aligned with the remaining segments, as
+are the Surface boundary conditions of adjacent Room2Ds that reference them.
+
+The check_skylight_containment function checks that every vertex of the
+DetailedSkylights of each Room2D lies within its floor_boundary and outside
+of its floor_holes with the winding numbers of all skylight vertices of a
+Story evaluated together. It is one of the checks of strict validation (see
+the strict module).
+
+This module requires NumPy, which can be installed with
+`pip install dragonfly-schema[geometry]`.
+
+Usage:
+
+.. code-block:: python
+
+    from dragonfly_schema.geometry import check_floor_polygons
+
+    errors = check_floor_polygons(model)  # report the issues
+    errors = check_floor_polygons(model, clean=True)  # fix them in place
+    errors = check_skylight_containment(model)
+"""
+import math
+
+try:
+    import numpy as np
+except ImportError:
+    raise ImportError(
+        'numpy module is not installed. '
+        'Try `pip install dragonfly-schema[geometry]` command.'
+    )
+
+from honeybee_schema.geometry import Point3D
+from honeybee_schema.validation import ValidationError
+
+from ._hierarchy import stories, model_tolerance, parents
+from .window_parameter import RectangularWindows, DetailedWindows
+
+DUPLICATE_VERTICES_CODE = '100160'
+COLINEAR_VERTICES_CODE = '100161'
+CLOCKWISE_FLOOR_CODE = '100162'
+DEGENERATE_FLOOR_CODE = '100163'
+SKYLIGHT_OUTSIDE_FLOOR_CODE = '100164'
+
+# per-segment attributes of the Room2D that are remapped when the floor is cleaned
+_SEGMENT_ATTRIBUTES = (
+    'boundary_conditions', 'window_parameters', 'shading_parameters', 'air_boundaries')
+# window parameters with geometry that is relative to the start of their segment
+_ASYMMETRIC_WINDOWS = (RectangularWindows, DetailedWindows)
+
+
+def _rings(rooms):
+    """Get the floor boundaries and holes of Room2Ds as a list of rings.
+
+    Returns:
+        A tuple with two items.
+
+        -   rings: A list of lists of 2D points for each boundary and hole.
+
+        -   owners: A list of (room index, first segment index) tuples with the
+            Room2D of each ring and the index of its first segment in the Room2D.
+    """
+    rings, owners = [], []
+    for r_i, room in enumerate(rooms):
+        seg_i = 0
+        for ring in [room.floor_boundary] + list(room.floor_holes or ()):
+            rings.append(ring)
+            owners.append((r_i, seg_i))
+            seg_i += len(ring)
+    return rings, owners
+
+
+def vertex_flags(points, counts, tolerance, angle_tolerance):
+    """Get arrays of the issues with each vertex of several closed rings.
+
+    Args:
+        points: A NumPy array of shape (N, 2) with the vertices of all rings.
+        counts: A NumPy array of integers with the number of vertices of each ring.
+        tolerance: The maximum length at which a segment is considered zero-length.
+        angle_tolerance: The maximum angle in degrees between two segments at
+            which their shared vertex is considered colinear.
+
+    Returns:
+        A tuple with three items.
+
+        -   duplicate: A boolean array noting whether the segment that starts at
+            each vertex has zero length (meaning the vertex duplicates the next one).
+
+        -   colinear: A boolean array noting whether each vertex is colinear
+            with its neighbors. Vertices of zero-length segments are excluded.
+
+        -   areas: An array with the signed area of each ring, which is negative
+            for rings that are clockwise.
+    """
+    starts = np.cumsum(counts) - counts
+    ends = starts + counts - 1
+    index = np.arange(len(points))
+    nxt, prv = index + 1, index - 1
+    nxt[ends] = starts
+    prv[starts] = ends
+
+    segs = points[nxt] - points
+    duplicate = np.hypot(segs[:, 0], segs[:, 1]) <= tolerance
+    prev_segs = segs[prv]
+    cross = prev_segs[:, 0] * segs[:, 1] - prev_segs[:, 1] * segs[:, 0]
+    angle = np.arctan2(np.abs(cross), np.einsum('ij,ij->i', prev_segs, segs))
+    deviation = np.minimum(angle, math.pi - angle)  # a spike is also colinear
+    colinear = (deviation <= math.radians(angle_tolerance)) & \
+        ~duplicate & ~duplicate[prv]
+
+    double_areas = points[:, 0] * points[nxt, 1] - points[nxt, 0] * points[:, 1]
+    areas = np.add.reduceat(double_areas, starts) / 2
+    return duplicate, colinear, areas
+
+
+def check_floor_polygons(obj, tolerance=None, angle_tolerance=None, clean=False):
+    """Check the floor polygons of all Room2Ds for issues that break translation.
+
+    The issues are duplicate vertices (which produce zero-length segments),
+    redundant colinear vertices and floor_boundaries with a clockwise winding.
+    Colinear vertices are only redundant when the two segments that they join
+    have equal boundary conditions, shading parameters, air boundaries and
+    window parameters (without RectangularWindows or DetailedWindows, which
+    are placed relative to the start of each segment). Other colinear vertices
+    are expected (eg. where a wall is split between two adjacent Room2Ds). With
+    clean, the Room2Ds are fixed in place as follows.
+
+    *   Duplicate vertices are removed along with their zero-length segments.
+    *   Redundant colinear vertices are removed by merging the two segments
+        that they join.
+    *   Clockwise floor_boundaries are reversed and the RectangularWindows and
+        DetailedWindows of their segments are mirrored to stay in place.
+
+    The per-segment attributes are remapped to the cleaned segments and compact
+    (default-plus-override) attributes remain compact. The Surface boundary
+    conditions of the other Room2Ds in the Story that reference the faces of a
+    cleaned Room2D are renumbered to match its new segments. A Room2D is not
+    cleaned when another Room2D has a Surface boundary condition that references
+    one of the segments that would be removed.
+
+    Args:
+        obj: A validated dragonfly Model, Building or Story object.
+        tolerance: The maximum length at which a segment is considered
+            zero-length. If None, the Model tolerance will be used when obj
+            is a Model and 0.01 will be used otherwise.
+        angle_tolerance: The maximum angle in degrees by which a vertex may
+            deviate from the line of its neighbors to be considered colinear.
+            If None, the Model angle_tolerance will be used when obj is a Model
+            and 1.0 will be used otherwise.
+        clean: Boolean to note whether the issues should be fixed on the Room2Ds
+            of obj. (Default: False).
+
+    Returns:
+        A list of honeybee-schema ValidationError objects with one error for
+        each type of issue on each Room2D. If clean is True, only the issues
+        that could not be fixed are included. Room2Ds that are not changed
+        (eg. floors that would be left with fewer than 3 vertices or removed
+        segments that are referenced by Surface boundary conditions) keep all
+        of their issues, along with a degenerate floor error if applicable.
+    """
+    tolerance = model_tolerance(obj, tolerance)
+    angle_tolerance = model_tolerance(obj, angle_tolerance, 'angle_tolerance', 1.0)
+
+    errors = []
+    for bldg, story in stories(obj):
+        if not story.room_2ds:
+            continue
+        rings, owners = _rings(story.room_2ds)
+        counts = np.fromiter((len(r) for r in rings), dtype=np.intp, count=len(rings))
+        points = np.array([pt for ring in rings for pt in ring], dtype=float)
+        duplicate, colinear, areas = \
+            vertex_flags(points, counts, tolerance, angle_tolerance)
+
+        # collect the issues of each Room2D from the vectorized flags
+        issues = {}  # room index to a dictionary of issue codes to segment indices
+        ring_of_vertex = np.repeat(np.arange(len(rings)), counts)
+        starts = np.cumsum(counts) - counts
+        room_values = {}
+        for v_i in np.flatnonzero(duplicate | colinear):
+            r_i = ring_of_vertex[v_i]
+            room_i, seg_i = owners[r_i]
+            local_i = int(v_i - starts[r_i])
+            if duplicate[v_i]:
+                code = DUPLICATE_VERTICES_CODE
+            else:  # only vertices between segments with equal properties are redundant
+                code = COLINEAR_VERTICES_CODE
+                if room_i not in room_values:
+                    room_values[room_i] = _segment_values(story.room_2ds[room_i])
+                prev_i = (local_i - 1) % int(counts[r_i])
+                if not _can_merge(room_values[room_i], seg_i + prev_i, seg_i + local_i):
+                    continue
+            issues.setdefault(room_i, {}).setdefault(code, []).append(seg_i + local_i)
+        for r_i in np.flatnonzero(areas < 0):
+            room_i, seg_i = owners[r_i]
+            if seg_i == 0:  # only the floor_boundary must be counterclockwise
+                issues.setdefault(room_i, {})[CLOCKWISE_FLOOR_CODE] = []
+
+        references = _surface_references(story.room_2ds) if clean and issues else {}
+        for room_i, room_issues in issues.items():
+            room = story.room_2ds[room_i]
+            if clean:
+                remaining, new_index = _clean_room(
+                    room, tolerance, angle_tolerance, references.get(room.identifier))
+                if new_index is not None:
+                    _remap_surfaces(story.room_2ds, room.identifier, new_index)
+                    room_issues = remaining
+                else:  # the room is unchanged and all of its issues remain
+                    room_issues = dict(room_issues, **remaining)
+            for code, segments in room_issues.items():
+                errors.append(_floor_error(bldg, story, room, code, segments))
+    return errors
+
+
+def _clean_room(room, tolerance, angle_tolerance, referenced=None):
+    """Fix the floor polygon issues of a Room2D in place.
+
+    Args:
+        room: The Room2D to be cleaned.
+        tolerance: The maximum length at which a segment is considered zero-length.
+        angle_tolerance: The maximum angle in degrees at which a vertex is colinear.
+        referenced: An optional set of the segment indices of the Room2D that
+            are referenced by Surface boundary conditions of other Room2Ds.
+            The Room2D is left unchanged if any of them would be removed.
+
+    Returns:
+        A tuple with two items.
+
+        -   remaining: A dictionary of the issue codes to the segment indices
+            that could not be fixed.
+
+        -   new_index: A dictionary of the original segment indices to their
+            new indices. This is None when the Room2D is left unchanged, which
+            happens if any of its rings would have fewer than 3 vertices or
+            if a referenced segment would be removed.
+    """
+    values = _segment_values(room)
+    new_rings, kept_segments, remaining = [], [], {}
+    seg_i = 0
+    for ring_i, ring in enumerate([room.floor_boundary] + list(room.floor_holes or ())):
+        pts = np.array(ring, dtype=float)
+        seg_ids = np.arange(seg_i, seg_i + len(ring))
+        seg_i += len(ring)
+        counts = np.array([len(pts)])
+        duplicate, _, _ = vertex_flags(pts, counts, tolerance, angle_tolerance)
+        pts, seg_ids = pts[~duplicate], seg_ids[~duplicate]
+        while len(pts) >= 3:  # remove colinear vertices until none can be merged
+            _, colinear, _ = vertex_flags(
+                pts, np.array([len(pts)]), tolerance, angle_tolerance)
+            remove, last = np.zeros(len(pts), dtype=bool), -2
+            for v_i in np.flatnonzero(colinear):
+                if v_i - last > 1 and not (v_i == len(pts) - 1 and remove[0]) and \
+                        _can_merge(values, seg_ids[v_i - 1], seg_ids[v_i]):
+                    remove[v_i] = True
+                    last = v_i
+            if len(pts) - remove.sum() < 3 or not remove.any():
+                break
+            pts, seg_ids = pts[~remove], seg_ids[~remove]
+        if len(pts) < 3:
+            return {DEGENERATE_FLOOR_CODE: list(range(seg_i - len(ring), seg_i))}, None
+        _, colinear, areas = vertex_flags(
+            pts, np.array([len(pts)]), tolerance, angle_tolerance)
+        if colinear.any():
+            remaining.setdefault(COLINEAR_VERTICES_CODE, []).extend(
+                int(s) for s in seg_ids[colinear])
+        if ring_i == 0 and areas[0] < 0:  # reverse the boundary to be counterclockwise
+            order = np.concatenate(([0], np.arange(len(pts) - 1, 0, -1)))
+            pts, seg_ids = pts[order], seg_ids[::-1]
+            _flip_windows(values, pts, seg_ids)
+        new_rings.append(pts.tolist())
+        kept_segments.extend(int(s) for s in seg_ids)
+
+    if referenced and referenced.intersection(range(seg_i)).difference(kept_segments):
+        return {}, None
+    room.floor_boundary = new_rings[0]
+    if room.floor_holes is not None:
+        room.floor_holes = new_rings[1:]
+    for attr, vals in values.items():
+        _assign_segment_list(room, attr, [vals[s] for s in kept_segments])
+    new_index = {s: i for i, s in enumerate(kept_segments)}
+    remaining = {code: sorted(new_index[s] for s in segs)
+                 for code, segs in remaining.items()}
+    return remaining, new_index
+
+
+def _surface_segment(boundary_condition, room_id):
+    """Get the index of the Room2D segment referenced by a Surface boundary condition.
+
+    None is returned if the boundary condition does not reference a segment
+    of the Room2D with the room_id.
+    """
+    if getattr(boundary_condition, 'type', None) != 'Surface':
+        return None
+    bc_objs = boundary_condition.boundary_condition_objects
+    prefix = '{}..Face'.format(room_id)
+    if bc_objs[-1] != room_id or not bc_objs[0].startswith(prefix):
+        return None
+    try:
+        return int(bc_objs[0][len(prefix):]) - 1
+    except ValueError:
+        return None
+
+
+def _surface_references(rooms):
+    """Get a dictionary of Room2D identifiers to their segments referenced by Surfaces."""
+    references = {}
+    for room in rooms:
+        for bc in room.segment_list('boundary_conditions') or ():
+            if getattr(bc, 'type', None) == 'Surface':
+                room_id = bc.boundary_condition_objects[-1]
+                seg_i = _surface_segment(bc, room_id)
+                if seg_i is not None:
+                    references.setdefault(room_id, set()).add(seg_i)
+    return references
+
+
+def _remap_surfaces(rooms, room_id, new_index):
+    """Renumber the Surface boundary conditions that reference a cleaned Room2D.
+
+    Args:
+        rooms: A list of the Room2Ds of the Story, which are changed in place.
+        room_id: The identifier of the Room2D that was cleaned.
+        new_index: A dictionary of the original segment indices of the cleaned
+            Room2D to their new indices.
+    """
+    for room in rooms:
+        bcs = room.segment_list('boundary_conditions')
+        if bcs is None:
+            continue
+        new_bcs, changed = list(bcs), False
+        for i, bc in enumerate(bcs):
+            seg_i = _surface_segment(bc, room_id)
+            if seg_i is None or new_index.get(seg_i, seg_i) == seg_i:
+                continue
+            bc_objs = list(bc.boundary_condition_objects)
+            bc_objs[0] = '{}..Face{}'.format(room_id, new_index[seg_i] + 1)
+            new_bcs[i] = bc.model_copy(update={'boundary_condition_objects': bc_objs})
+            changed = True
+        if changed:
+            _assign_segment_list(room, 'boundary_conditions', new_bcs)
+
+
+def _segment_values(room):
+    """Get a dictionary of each per-segment attribute of a Room2D as a full list."""
+    values = {attr: room.segment_list(attr) for attr in _SEGMENT_ATTRIBUTES}
+    return {attr: vals for attr, vals in values.items() if vals is not None}
+
+
+def _can_merge(values, seg_a, seg_b):
+    """Check whether two segments have equal properties that can be merged."""
+    for vals in values.values():
+        val_a, val_b = vals[seg_a], vals[seg_b]
+        if isinstance(val_a, _ASYMMETRIC_WINDOWS) or val_a != val_b:
+            return False
+    return True
+
+
+def _flip_windows(values, pts, seg_ids):
+    """Mirror the asymmetric window parameters of segments that were reversed."""
+    win_pars = values.get('window_parameters')
+    if win_pars is None:
+        return
+    win_pars = values['window_parameters'] = list(win_pars)
+    lengths = np.hypot(*(np.roll(pts, -1, axis=0) - pts).T)
+    for seg_i, length in zip(seg_ids, lengths):
+        win_pars[seg_i] = flip_window_parameter(win_pars[seg_i], float(length))
+
+
+def flip_window_parameter(window_parameter, length):
+    """Get a window parameter mirrored for a wall segment that has been reversed.
+
+    Only RectangularWindows and DetailedWindows with 2D vertices are affected
+    since their geometry is relative to the start of the segment. Any other
+    window parameter is returned unchanged.
+
+    Args:
+        window_parameter: A window parameter object or None.
+        length: The length of the wall segment.
+    """
+    if isinstance(window_parameter, RectangularWindows):
+        origins = [[length - org[0] - width, org[1]] for org, width in
+                   zip(window_parameter.origins, window_parameter.widths)]
+        return window_parameter.model_copy(update={'origins': origins})
+    if isinstance(window_parameter, DetailedWindows):
+        polygons = [
+            [[length - pt[0], pt[1]] for pt in reversed(poly)]
+            if all(len(pt) == 2 for pt in poly) else poly
+            for poly in window_parameter.polygons
+        ]
+        return window_parameter.model_copy(update={'polygons': polygons})
+    return window_parameter
+
+
+def _assign_segment_list(room, attr, values):
+    """Assign a list of per-segment values to a Room2D, keeping compact values compact."""
+    original = getattr(room, attr)
+    if isinstance(original, list):
+        setattr(room, attr, values)
+        return
+    indices = [i for i, val in enumerate(values) if val != original.default]
+    setattr(room, attr, original.__class__(
+        default=original.default, indices=indices, values=[values[i] for i in indices]))
+
+
+_ERROR_TYPES = {
+    DUPLICATE_VERTICES_CODE: ('Duplicate Room2D Floor Vertices',
+                              'has duplicate vertices that produce zero-length segments'),
+    COLINEAR_VERTICES_CODE: ('Colinear Room2D Floor Vertices',
+                             'has redundant colinear vertices'),
+    CLOCKWISE_FLOOR_CODE: ('Clockwise Room2D Floor',
+                           'has a floor_boundary with a clockwise winding'),
+    DEGENERATE_FLOOR_CODE: ('Degenerate Room2D Floor',
+                            'has a floor ring with fewer than 3 distinct vertices')
+}
+
+
+def _floor_error(building, story, room, code, segments):
+    """Get a ValidationError for an issue with the floor polygon of a Room2D."""
+    error_type, description = _ERROR_TYPES[code]
+    name = room.display_name or room.identifier
+    msg = 'Room2D "{}" {}'.format(name, description)
+    if segments:
+        msg += ' at the segments {}'.format(segments)
+    points = [pt for ring in [room.floor_boundary] + list(room.floor_holes or ())
+              for pt in ring]
+    error = ValidationError(
+        code=code,
+        error_type=error_type,
+        extension_type='Core',
+        element_type='Room2D',
+        element_id=[room.identifier],
+        element_name=[name],
+        message=msg + '.',
+        helper_geometry=[
+            Point3D(x=points[s][0], y=points[s][1], z=room.floor_height)
+            for s in segments if s < len(points)
+        ]
+    )
+    error.parents = [parents(building, story)]
+    return error
+
+
+def points_in_rings(points, point_groups, rings, ring_groups, ring_holes, tolerance):
+    """Check whether points lie inside floors with holes using their winding numbers.
+
+    All of the pairs between each point and each edge of the rings of its group
+    are evaluated at once with NumPy. A point is inside when it has a non-zero
+    winding number around the boundary of its group and a zero winding number
+    around each hole, or when it is within the tolerance of any edge of its group.
+
+    Args:
+        points: A NumPy array of shape (N, 2) with the points to be checked.
+        point_groups: A NumPy array of integers with the group of each point.
+        rings: A list of closed rings, each of which is a list of 2D points.
+        ring_groups: A list of integers for the group of each ring. The rings
+            of each group must follow one another in the list.
+        ring_holes: A list of booleans for whether each ring is a hole.
+        tolerance: The maximum distance outside of the rings at which a point
+            is considered to be inside.
+
+    Returns:
+        A boolean NumPy array noting whether each point is inside the rings
+        of its group. Points of groups without any rings are not inside.
+    """
+    counts = np.fromiter((len(r) for r in rings), dtype=np.intp, count=len(rings))
+    starts = np.cumsum(counts) - counts
+    edge_a = np.array([pt for ring in rings for pt in ring], dtype=float)
+    index = np.arange(len(edge_a)) + 1
+    index[starts + counts - 1] = starts
+    edge_b = edge_a[index]
+    edge_ring = np.repeat(np.arange(len(rings)), counts)
+
+    # the first edge and the number of edges of each group
+    group_count = int(max(max(ring_groups, default=-1), point_groups.max(initial=-1))) + 1
+    group_edges = np.bincount(
+        np.asarray(ring_groups, dtype=np.intp), weights=counts, minlength=group_count
+    ).astype(np.intp)
+    group_starts = np.cumsum(group_edges) - group_edges
+
+    # a pair of each point with each edge of its group, ordered by point
+    pair_counts = group_edges[point_groups]
+    pair_point = np.repeat(np.arange(len(points)), pair_counts)
+    pair_starts = np.cumsum(pair_counts) - pair_counts
+    pair_edge = np.arange(pair_counts.sum()) - \
+        np.repeat(pair_starts - group_starts[point_groups], pair_counts)
+    q, a, b = points[pair_point], edge_a[pair_edge], edge_b[pair_edge]
+
+    # winding number of each point around each ring
+    ab, aq = b - a, q - a
+    cross = ab[:, 0] * aq[:, 1] - ab[:, 1] * aq[:, 0]
+    upward = (a[:, 1] <= q[:, 1]) & (b[:, 1] > q[:, 1]) & (cross > 0)
+    downward = (b[:, 1] <= q[:, 1]) & (a[:, 1] > q[:, 1]) & (cross < 0)
+    winding = upward.astype(np.intp) - downward.astype(np.intp)
+    pair_ring = edge_ring[pair_edge]
+    new_group = np.ones(len(pair_ring), dtype=bool)
+    new_group[1:] = (pair_ring[1:] != pair_ring[:-1]) | (pair_point[1:] != pair_point[:-1])
+    group_index = np.flatnonzero(new_group)
+    inside = np.zeros(len(points), dtype=bool)
+    if not len(group_index):
+        return inside
+    ring_winding = np.add.reduceat(winding, group_index)
+    ring_point, ring_of_group = pair_point[group_index], pair_ring[group_index]
+    is_hole = np.asarray(ring_holes, dtype=bool)[ring_of_group]
+    inside[ring_point[~is_hole & (ring_winding != 0)]] = True
+    inside[ring_point[is_hole & (ring_winding != 0)]] = False
+
+    # distance of each point to the nearest edge of its group
+    length_sq = np.einsum('ij,ij->i', ab, ab)
+    t = np.clip(np.einsum('ij,ij->i', aq, ab) / np.where(length_sq == 0, 1, length_sq),
+                0, 1)
+    dist = np.hypot(*(a + t[:, None] * ab - q).T)
+    has_pairs = pair_counts > 0
+    near = np.zeros(len(points), dtype=bool)
+    near[has_pairs] = \
+        np.minimum.reduceat(dist, pair_starts[has_pairs]) <= tolerance
+    return inside | near
+
+
+def check_skylight_containment(obj, tolerance=None):
+    """Check that the DetailedSkylights of all Room2Ds lie within their floor.
+
+    Every vertex of every DetailedSkylights polygon is checked against the
+    floor_boundary and floor_holes of its Room2D with the winding number
+    of all of the Room2Ds of each Story evaluated together in NumPy.
+
+    Args:
+        obj: A validated dragonfly Model, Building or Story object.
+        tolerance: The maximum distance that a skylight vertex can be outside
+            of the floor. If None, the Model tolerance will be used when obj
+            is a Model and 0.01 will be used otherwise.
+
+    Returns:
+        A list of honeybee-schema ValidationError objects with one error for each
+        Room2D that has skylight polygons with vertices outside of its floor.
+    """
+    tolerance = model_tolerance(obj, tolerance)
+
+    errors = []
+    for bldg, story in stories(obj):
+        rooms = [room for room in story.room_2ds
+                 if getattr(room.skylight_parameters, 'type', None) == 'DetailedSkylights']
+        if not rooms:
+            continue
+        rings, owners = _rings(rooms)
+        polygons = [room.skylight_parameters.polygons for room in rooms]
+        point_groups = np.array(
+            [r_i for r_i, polys in enumerate(polygons) for poly in polys for _ in poly],
+            dtype=np.intp)
+        points = np.array(
+            [pt for polys in polygons for poly in polys for pt in poly], dtype=float)
+        if not len(points):
+            continue
+        inside = points_in_rings(
+            points, point_groups, rings, [room_i for room_i, _ in owners],
+            [seg_i != 0 for _, seg_i in owners], tolerance)
+        if inside.all():
+            continue
+
+        p_i = 0
+        for room, polys in zip(rooms, polygons):
+            outside = {}  # skylight polygon index to its vertices outside the floor
+            for poly_i, poly in enumerate(polys):
+                for pt, pt_inside in zip(poly, inside[p_i:p_i + len(poly)]):
+                    if not pt_inside:
+                        outside.setdefault(poly_i, []).append(pt)
+                p_i += len(poly)
+            if outside:
+                errors.append(_skylight_error(bldg, story, room, outside))
+    return errors
+
+
+def _skylight_error(building, story, room, outside):
+    """Get a ValidationError for a Room2D with skylights outside of its floor."""
+    name = room.display_name or room.identifier
+    msg = 'Room2D "{}" has DetailedSkylights polygons {} with vertices outside ' \
+        'of its floor.'.format(name, sorted(outside))
+    height = room.floor_height + room.floor_to_ceiling_height
+    error = ValidationError(
+        code=SKYLIGHT_OUTSIDE_FLOOR_CODE,
+        error_type='Skylight Outside Room2D Floor',
+        extension_type='Core',
+        element_type='Room2D',
+        element_id=[room.identifier],
+        element_name=[name],
+        message=msg,
+        helper_geometry=[
+            Point3D(x=pt[0], y=pt[1], z=height)
+            for pts in outside.values() for pt in pts
+        ]
+    )
+    error.parents = [parents(building, story)]
+    return error
@@ -0,0 +1,80 @@
+"""Batch resolution of Story heights and checks for the stacking of Stories."""
+from honeybee_schema.validation import ValidationError
+
+from ._hierarchy import buildings, stories, model_tolerance, parents
+
+OVERLAPPING_STORIES_CODE = '100150'
+
+
+def resolve_story_heights(obj):
+    """Resolve all Autocalculate Story heights of a Building or Model in one pass.
+
+    Nothing is cached on the Stories so the result should be kept for as long
+    as the Stories are not edited.
+
+    Args:
+        obj: A validated dragonfly Building or Model object.
+
+    Returns:
+        A dictionary with the identifier of each Story as keys and a tuple of
+        (floor_height, floor_to_floor_height) with no Autocalculate as values
+        (see Story.resolve_heights).
+    """
+    return {story.identifier: story.resolve_heights() for _, story in stories(obj)}
+
+
+def check_overlapping_stories(obj, tolerance=None, heights=None):
+    """Check the Stories of each Building of a Building or Model for overlaps.
+
+    Args:
+        obj: A validated dragonfly Building or Model object.
+        tolerance: The maximum difference between elevations at which Stories
+            are considered to be touching rather than overlapping. If None,
+            the Model tolerance will be used when obj is a Model and 0.01
+            will be used otherwise.
+        heights: An optional dictionary of resolved Story heights from
+            resolve_story_heights, which avoids resolving them again. If None,
+            the heights will be resolved from the Stories.
+
+    Returns:
+        A list of honeybee-schema ValidationError objects for each pair of
+        Stories that overlap one another. Will be an empty list if the
+        Stories stack correctly.
+    """
+    tolerance = model_tolerance(obj, tolerance)
+    heights = resolve_story_heights(obj) if heights is None else heights
+
+    errors = []
+    for bldg in buildings(obj):
+        if not bldg.unique_stories:
+            continue
+        stack = sorted(
+            (heights[story.identifier] + (story,) for story in bldg.unique_stories),
+            key=lambda s: s[0]
+        )
+        for (flr_hgt, ftf_hgt, story), (next_flr, _, next_story) in \
+                zip(stack[:-1], stack[1:]):
+            top = flr_hgt + ftf_hgt * story.multiplier
+            if top - next_flr > tolerance or next_flr - flr_hgt <= tolerance:
+                errors.append(_overlap_error(bldg, story, next_story, top, next_flr))
+    return errors
+
+
+def _overlap_error(building, story, next_story, top, next_floor):
+    """Get a ValidationError for two overlapping Stories of a Building."""
+    msg = 'Story "{}" extends from its floor up to an elevation of {} but ' \
+        'Story "{}" starts at an elevation of {}.'.format(
+            story.display_name or story.identifier, round(top, 6),
+            next_story.display_name or next_story.identifier, round(next_floor, 6))
+    parent = parents(building, None)
+    return ValidationError(
+        code=OVERLAPPING_STORIES_CODE,
+        error_type='Overlapping Stories',
+        extension_type='Core',
+        element_type='Story',
+        element_id=[story.identifier, next_story.identifier],
+        element_name=[story.display_name or story.identifier,
+                      next_story.display_name or next_story.identifier],
+        message=msg,
+        parents=[parent, parent]
+    )
@@ -0,0 +1,236 @@
+"""Utilities to share identical objects in memory while models are validated."""
+import sys
+import copy
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from pydantic import BaseModel, ConfigDict
+
+_INTERN_TABLE = ContextVar('_INTERN_TABLE', default=None)
+
+
+@contextmanager
+def intern_parameters():
+    """Context manager to share one object between identical parameters on validation.
+
+    While the context is active, every validated Room2D boundary condition,
+    WindowParameter, ShadingParameter and SkylightParameter that is equal to
+    one that was already validated is replaced with that first instance. This
+    reduces the memory of large models with many repeated parameters.
+
+    Note that interned objects are shared across all of the Room2Ds that use
+    them and so they should be treated as frozen. Any edits should be made by
+    assigning a new object rather than mutating the existing one.
+
+    Yields:
+        A dictionary of the interned objects, which can be inspected to see
+        how many unique parameters were found.
+
+    Usage:
+
+    .. code-block:: python
+
+        with intern_parameters():
+            model = Model.model_validate_json(model_json)
+    """
+    token = _INTERN_TABLE.set({})
+    try:
+        yield _INTERN_TABLE.get()
+    finally:
+        _INTERN_TABLE.reset(token)
+
+
+def intern_object(obj):
+    """Get the shared instance of a parameter object when interning is active.
+
+    Args:
+        obj: A validated pydantic object to be interned. None values are
+            returned unchanged.
+
+    Returns:
+        The first validated instance that is equal to the input object if
+        interning is active. Otherwise, the input object itself.
+    """
+    table = _INTERN_TABLE.get()
+    if table is None or obj is None:
+        return obj
+    key = (obj.__class__, obj.model_dump_json())
+    return table.setdefault(key, obj)
+
+
+def intern_objects(objs):
+    """Intern a list of parameter objects in place when interning is active.
+
+    Args:
+        objs: A list of validated pydantic objects (or None values).
+
+    Returns:
+        The input list.
+    """
+    if _INTERN_TABLE.get() is None or not objs:
+        return objs
+    for i, obj in enumerate(objs):
+        objs[i] = intern_object(obj)
+    return objs
+
+
+def intern_identifier(value):
+    """Intern an identifier string so that each unique identifier exists once in memory.
+
+    Unlike the interning of parameter objects, this is always active since
+    interned strings are immutable and they also speed up dictionary lookups
+    against the resource identifiers of a Model.
+
+    Args:
+        value: Text for an identifier or None.
+    """
+    return value if value is None else sys.intern(value)
+
+
+# shared instances of objects with all default values and the JSON dictionary of each
+_SHARED_DEFAULTS = {}
+# frozen subclasses of pydantic object classes and the class of each frozen subclass
+_FROZEN_CLASSES = {}
+_BASE_CLASSES = {}
+
+
+class FrozenList(list):
+    """A list of a shared default object, which raises a TypeError when it is edited."""
+
+    def _frozen(self, *args, **kwargs):
+        raise TypeError(
+            'The lists of shared default objects cannot be edited. Assign a new '
+            'list or a new object instead.')
+
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _frozen
+    append = extend = insert = pop = remove = clear = sort = reverse = _frozen
+
+    def __reduce__(self):
+        return FrozenList, (list(self),)
+
+
+def _frozen_class(model_cls):
+    """Get a frozen subclass of a pydantic object class."""
+    try:
+        return _FROZEN_CLASSES[model_cls]
+    except KeyError:
+        frozen_cls = type(model_cls.__name__, (model_cls,), {
+            '__module__': model_cls.__module__,
+            '__doc__': model_cls.__doc__,
+            '__reduce__': lambda self: (freeze, (thaw(self),)),
+            # the object is serialized and validated as a part of its parents
+            'model_config': ConfigDict(frozen=True, defer_build=True)
+        })
+        _FROZEN_CLASSES[model_cls] = frozen_cls
+        _BASE_CLASSES[frozen_cls] = model_cls
+        return frozen_cls
+
+
+def freeze(value):
+    """Get a deeply frozen copy of a pydantic object.
+
+    Assigning to a field of the copy (or any object within it) raises a pydantic
+    ValidationError and editing any of its lists raises a TypeError. The copy
+    is serialized in the same way as the input object.
+
+    Args:
+        value: A pydantic object or a list or other value within one.
+    """
+    if isinstance(value, BaseModel):
+        if type(value) in _BASE_CLASSES:
+            return value
+        fields = {k: freeze(v) for k, v in value.__dict__.items()}
+        return _frozen_class(type(value)).model_construct(
+            _fields_set=set(value.model_fields_set), **fields)
+    if isinstance(value, list):
+        return FrozenList(freeze(v) for v in value)
+    return value
+
+
+def thaw(value):
+    """Get an editable copy of an object that was frozen with the freeze function.
+
+    Args:
+        value: A frozen pydantic object or a list or other value within one.
+    """
+    if isinstance(value, BaseModel):
+        if type(value) not in _BASE_CLASSES:
+            return value
+        fields = {k: thaw(v) for k, v in value.__dict__.items()}
+        return _BASE_CLASSES[type(value)].model_construct(
+            _fields_set=set(value.model_fields_set), **fields)
+    if isinstance(value, list):
+        return [thaw(v) for v in value]
+    return value
+
+
+def shared_default(model_cls):
+    """Get one frozen instance of a pydantic object with all default values.
+
+    This is used for constant objects that are included in every Model (eg. the
+    GlobalConstructionSet) such that they are only built once. The shared
+    instance is deeply frozen (see the freeze function) so that it cannot be
+    edited through one Model while it is used by others. Use the thaw function
+    to get an editable copy.
+
+    Args:
+        model_cls: A pydantic object class that can be created without any inputs.
+    """
+    try:
+        return _SHARED_DEFAULTS[model_cls][0]
+    except KeyError:
+        instance = model_cls()
+        _SHARED_DEFAULTS[model_cls] = \
+            (freeze(instance), instance.model_dump(mode='json'), instance)
+        return _SHARED_DEFAULTS[model_cls][0]
+
+
+def shared_default_schema(model_cls, json_schema):
+    """Add the default of a shared default object to the JSON schema of its field.
+
+    This is used as the json_schema_extra of the fields of shared defaults such
+    that the default object is only built when the JSON schema is generated
+    rather than when the field is defined.
+
+    Args:
+        model_cls: A pydantic object class that can be created without any inputs.
+        json_schema: The dictionary of the JSON schema of the field.
+    """
+    shared_default(model_cls)
+    json_schema['readOnly'] = True
+    json_schema['default'] = copy.deepcopy(_SHARED_DEFAULTS[model_cls][1])
+
+
+def share_default(value, model_cls):
+    """Get the shared default instance of model_cls if a value is equal to it.
+
+    Args:
+        value: None, a JSON dictionary or an object of model_cls.
+        model_cls: The pydantic object class of the shared default.
+
+    Returns:
+        The shared instance if the value is None or it is equal to the default.
+        Otherwise, the input value.
+    """
+    instance = shared_default(model_cls)
+    if value is None or value is instance:
+        return instance
+    _, default_dict, default_obj = _SHARED_DEFAULTS[model_cls]
+    default = default_dict if isinstance(value, dict) else default_obj
+    return instance if value == default else value
+
+
+def validate_shared_default(value, handler, model_cls):
+    """Validate an input for an object and use the shared instance if it is the default.
+
+    Args:
+        value: The input value to be validated.
+        handler: The handler of a pydantic wrap validator for the object.
+        model_cls: The pydantic object class of the shared default.
+
+    Returns:
+        The shared instance if the value is None or it is equal to the default.
+        Otherwise, the result of validating the value with the handler.
+    """
+    instance = share_default(value, model_cls)
+    return instance if instance is shared_default(model_cls) else handler(value)
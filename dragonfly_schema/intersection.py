@@ -0,0 +1,320 @@
+"""Sweep-line detection of self-intersecting Room2D floor polygons.
+
+Floors that are traced from GIS footprints can have thousands of vertices,
+which makes the test of every pair of segments too slow. Instead, the
+segments are swept from left to right in the order of their minimum X
+coordinate while an index of the active segments (those that overlap the
+sweep line in X) is kept in the order of their minimum Y coordinate. This
+index is a tree with the maximum Y coordinate of the active segments under
+each node, such that the active segments that overlap each new segment in Y
+are found in logarithmic time without scanning the others. This finds every
+intersecting pair, including crossings between floor_holes and the
+floor_boundary, in O((n + k) log n) time for n segments with k overlapping
+bounding boxes.
+
+The check can be run on any Model, Building or Story with check_floor_intersections
+or it can be added to the validation of Models with the validate_floor_intersections
+context manager.
+
+Usage:
+
+.. code-block:: python
+
+    from dragonfly_schema.intersection import check_floor_intersections, \\
+        validate_floor_intersections
+
+    errors = check_floor_intersections(model)
+
+    with validate_floor_intersections():
+        model = Model.model_validate_json(model_json)  # fails for intersecting floors
+"""
+import heapq
+from bisect import bisect_right
+
+from honeybee_schema.validation import ValidationError
+
+from ._hierarchy import stories, model_tolerance, parents
+from .strict import strict_validation
+
+SELF_INTERSECTING_FLOOR_CODE = '100170'
+
+
+def _orientation(a, b, c):
+    """Get twice the signed area of the triangle between three 2D points."""
+    return (b[0] - a[0]) * (c[1] - a[1]) - (b[1] - a[1]) * (c[0] - a[0])
+
+
+def _point_segment_distance(pt, a, b):
+    """Get the distance between a 2D point and a line segment."""
+    dx, dy = b[0] - a[0], b[1] - a[1]
+    length_sq = dx * dx + dy * dy
+    t = 0 if length_sq == 0 else \
+        ((pt[0] - a[0]) * dx + (pt[1] - a[1]) * dy) / length_sq
+    t = 0 if t < 0 else (1 if t > 1 else t)
+    x, y = a[0] + t * dx - pt[0], a[1] + t * dy - pt[1]
+    return (x * x + y * y) ** 0.5
+
+
+def segments_intersect(a, b, c, d, tolerance=0.01):
+    """Check whether two line segments cross or come within a tolerance of one another.
+
+    Args:
+        a: The first 2D point of the first segment.
+        b: The second 2D point of the first segment.
+        c: The first 2D point of the second segment.
+        d: The second 2D point of the second segment.
+        tolerance: The maximum distance between the segments at which they are
+            considered to be touching. (Default: 0.01).
+    """
+    o1, o2 = _orientation(c, d, a), _orientation(c, d, b)
+    o3, o4 = _orientation(a, b, c), _orientation(a, b, d)
+    if o1 * o2 < 0 and o3 * o4 < 0:  # the segments properly cross one another
+        return True
+    # otherwise, the closest points of the segments include an end point
+    return min(_point_segment_distance(a, c, d), _point_segment_distance(b, c, d),
+               _point_segment_distance(c, a, b), _point_segment_distance(d, a, b)) \
+        <= tolerance
+
+
+class _ActiveSegments:
+    """Index of the active segments of a sweep in the order of their minimum Y.
+
+    Each segment has a fixed leaf of a binary tree in the order of the minimum
+    Y of all segments and each node of the tree holds the largest maximum Y
+    of the active segments below it, which prunes the branches without any
+    active segment that reaches up to a query.
+
+    Args:
+        y_mins: A list of the minimum Y coordinate of each segment.
+        y_maxs: A list of the maximum Y coordinate of each segment.
+    """
+    def __init__(self, y_mins, y_maxs):
+        self._y_maxs = y_maxs
+        self._order = sorted(range(len(y_mins)), key=y_mins.__getitem__)
+        self._size = size = 1 << max(len(y_mins) - 1, 0).bit_length()
+        self._leaf = [0] * len(y_mins)
+        for rank, seg_i in enumerate(self._order):
+            self._leaf[seg_i] = size + rank
+        self._sorted_mins = [y_mins[seg_i] for seg_i in self._order]
+        self._tops = [float('-inf')] * (2 * size)
+
+    def add(self, seg_i):
+        """Add a segment to the active segments."""
+        tops, node, top = self._tops, self._leaf[seg_i], self._y_maxs[seg_i]
+        while node and tops[node] < top:
+            tops[node] = top
+            node >>= 1
+
+    def remove(self, seg_i):
+        """Remove a segment from the active segments."""
+        tops, node = self._tops, self._leaf[seg_i]
+        tops[node] = float('-inf')
+        node >>= 1
+        while node:
+            top = max(tops[2 * node], tops[2 * node + 1])
+            if tops[node] == top:
+                break
+            tops[node] = top
+            node >>= 1
+
+    def overlapping(self, y_min, y_max):
+        """Get a list of the active segments that overlap a range of Y coordinates."""
+        tops, size = self._tops, self._size
+        end = size + bisect_right(self._sorted_mins, y_max)  # leaves below y_max
+        found, stack = [], [(1, size, 2 * size)]
+        while stack:
+            node, first, last = stack.pop()
+            if first >= end or tops[node] < y_min:
+                continue
+            if node >= size:
+                found.append(self._order[node - size])
+            else:
+                mid = (first + last) // 2
+                stack.append((2 * node + 1, mid, last))
+                stack.append((2 * node, first, mid))
+        return found
+
+
+def _adjacent_reach(points_a, points_b, tolerance):
+    """Get the number of steps from each segment of a ring to the next adjacent segment.
+
+    A segment is adjacent to the segments after it up to and including the
+    first one that is longer than the tolerance. So this is 1 unless the next
+    segments are within the tolerance in length (eg. from duplicate vertices).
+    """
+    count = len(points_a)
+    is_long = [((b[0] - a[0]) ** 2 + (b[1] - a[1]) ** 2) ** 0.5 > tolerance
+               for a, b in zip(points_a, points_b)]
+    if not any(is_long):
+        return [count] * count
+    reach = [0] * count
+    for i in range(2 * count - 1, -1, -1):  # twice around to wrap past the end
+        nxt = (i + 1) % count
+        reach[i % count] = 1 if is_long[nxt] else reach[nxt] + 1
+    return reach
+
+
+def _folds(points_a, points_b, first, last, tolerance):
+    """Check whether two segments that are separated by short segments fold back.
+
+    The segments meet within the tolerance at the end of the first one and so
+    they only intersect elsewhere if they overlap, in which case the far end
+    of one of them is within the tolerance of the other. Short segments are
+    always within the tolerance of their neighbors and they never fold back.
+    """
+    a, b, c, d = points_a[first], points_b[first], points_a[last], points_b[last]
+    if _point_segment_distance(a, b, b) <= tolerance or \
+            _point_segment_distance(c, d, d) <= tolerance:
+        return False
+    return _point_segment_distance(a, c, d) <= tolerance or \
+        _point_segment_distance(d, a, b) <= tolerance
+
+
+def segment_intersections(rings, tolerance=0.01):
+    """Get all pairs of intersecting segments of a list of closed rings.
+
+    Segments that follow one another around the same ring share a vertex and
+    they are not considered to be intersecting. The same is true of segments
+    that are only separated by segments with a length within the tolerance
+    (eg. from duplicate vertices) unless they fold back over one another.
+    Such short segments are reported by (and can be removed with) the
+    check_floor_polygons function of the geometry module.
+
+    Args:
+        rings: A list of closed rings, each of which is a list of 2D points.
+            The first segment of each ring starts at its first point and the
+            last segment joins its last point back to the first one.
+        tolerance: The maximum distance between two segments at which they are
+            considered to be touching. (Default: 0.01).
+
+    Returns:
+        A sorted list of (i, j) tuples with i < j for the indices of each pair
+        of intersecting segments. Segments are numbered in the order of the
+        rings, such that the first segment of the second ring follows the last
+        segment of the first ring.
+    """
+    starts, counts, reach, points_a, points_b = [], [], [], [], []
+    for ring in rings:
+        start, count = len(points_a), len(ring)
+        for i, pt in enumerate(ring):
+            starts.append(start)
+            counts.append(count)
+            points_a.append(pt)
+            points_b.append(ring[(i + 1) % count])
+        reach.extend(_adjacent_reach(points_a[start:], points_b[start:], tolerance))
+    pad = tolerance / 2  # boxes of segments within the tolerance overlap
+    boxes = [
+        (min(a[0], b[0]) - pad, max(a[0], b[0]) + pad,
+         min(a[1], b[1]) - pad, max(a[1], b[1]) + pad)
+        for a, b in zip(points_a, points_b)
+    ]
+
+    intersections = []
+    active = _ActiveSegments([box[2] for box in boxes], [box[3] for box in boxes])
+    active_ends = []  # a heap of the max X of the active segments
+    for i in sorted(range(len(boxes)), key=lambda s: boxes[s][0]):
+        x_min, x_max, y_min, y_max = boxes[i]
+        while active_ends and active_ends[0][0] < x_min:
+            active.remove(heapq.heappop(active_ends)[1])
+        a, b = points_a[i], points_b[i]
+        for j in active.overlapping(y_min, y_max):
+            if starts[i] == starts[j]:  # skip the adjacent segments of a ring
+                ahead = (j - i) % counts[i]
+                if ahead == 1 or ahead == counts[i] - 1:
+                    continue
+                if ahead <= reach[i] or counts[i] - ahead <= reach[j]:
+                    first, last = (i, j) if ahead <= reach[i] else (j, i)
+                    if not _folds(points_a, points_b, first, last, tolerance):
+                        continue
+            if segments_intersect(a, b, points_a[j], points_b[j], tolerance):
+                intersections.append((i, j) if i < j else (j, i))
+        active.add(i)
+        heapq.heappush(active_ends, (x_max, i))
+    return sorted(intersections)
+
+
+def floor_intersections(room, tolerance=0.01):
+    """Get all pairs of intersecting segments of the floor of a Room2D.
+
+    Args:
+        room: A dragonfly Room2D object.
+        tolerance: The maximum distance between two segments at which they are
+            considered to be touching. (Default: 0.01).
+
+    Returns:
+        A sorted list of (i, j) tuples for the indices of each pair of
+        intersecting segments. The indices align with the per-segment lists of
+        the Room2D (eg. boundary_conditions), meaning that the floor_boundary
+        segments come first followed by the segments of each floor_hole.
+    """
+    return segment_intersections(
+        [room.floor_boundary] + list(room.floor_holes or ()), tolerance)
+
+
+def check_floor_intersections(obj, tolerance=None):
+    """Check the floors of all Room2Ds for segments that intersect one another.
+
+    Args:
+        obj: A validated dragonfly Model, Building or Story object.
+        tolerance: The maximum distance between two segments at which they are
+            considered to be touching. If None, the Model tolerance will be used
+            when obj is a Model and 0.01 will be used otherwise.
+
+    Returns:
+        A list of honeybee-schema ValidationError objects with one error for
+        each Room2D that has intersecting floor segments.
+    """
+    tolerance = model_tolerance(obj, tolerance)
+    errors = []
+    for bldg, story in stories(obj):
+        for room in story.room_2ds:
+            intersections = floor_intersections(room, tolerance)
+            if intersections:
+                errors.append(_intersection_error(bldg, story, room, intersections))
+    return errors
+
+
+def _intersection_error(building, story, room, intersections):
+    """Get a ValidationError for a Room2D with intersecting floor segments."""
+    name = room.display_name or room.identifier
+    bound_count = len(room.floor_boundary)
+    holes = any(j >= bound_count for _, j in intersections)
+    msg = 'Room2D "{}" has a self-intersecting floor{} with the intersecting ' \
+        'segment pairs {}.'.format(
+            name, ' (including its floor_holes)' if holes else '',
+            ', '.join('({}, {})'.format(i, j) for i, j in intersections))
+    error = ValidationError(
+        code=SELF_INTERSECTING_FLOOR_CODE,
+        error_type='Self-Intersecting Room2D Floor',
+        extension_type='Core',
+        element_type='Room2D',
+        element_id=[room.identifier],
+        element_name=[name],
+        message=msg
+    )
+    error.parents = [parents(building, story)]
+    return error
+
+
+def validate_floor_intersections(tolerance=None):
+    """Context manager to fail the validation of Models with self-intersecting floors.
+
+    While the context is active, the validation of every Model checks the
+    floors of all of its Room2Ds with check_floor_intersections and raises a
+    validation error that lists the intersecting segments of each Room2D.
+    This is the same as the strict_validation context manager with only
+    the floor intersection check.
+
+    Args:
+        tolerance: The maximum distance between two segments at which they are
+            considered to be touching. If None, the tolerance of each Model
+            will be used.
+
+    Usage:
+
+    .. code-block:: python
+
+        with validate_floor_intersections():
+            model = Model.model_validate_json(model_json)
+    """
+    return strict_validation(tolerance, skylights=False)
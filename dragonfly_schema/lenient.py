@@ -0,0 +1,221 @@
+"""Lenient validation that quarantines invalid Buildings and ContextShades.
+
+Model.model_validate fails as soon as any object of the Model is invalid, which
+means that a single bad Room2D makes all of the other Buildings unusable. The
+validate_lenient function in this module instead collects every error of the
+Model in the same validation pass, removes (quarantines) each Building and
+ContextShade with an error and returns a Model of the valid ones along with
+the errors. Each error is keyed by the JSON pointer of the invalid value, which
+can be used to locate it in the original DFJSON (eg. with section.load_section).
+
+Errors outside of the Buildings and ContextShades (eg. an invalid tolerance or
+an invalid energy resource of the Model properties) cannot be quarantined. They
+are reported in the fatal_error text of the result (like the fatal_error of a
+honeybee ValidationReport) and no Model is returned when they are found. The
+same is true of errors of the checks of the whole Model that still fail once
+the invalid objects are removed (eg. the geometry checks of strict validation).
+
+Usage:
+
+.. code-block:: python
+
+    from dragonfly_schema.lenient import load_lenient
+
+    result = load_lenient('model.dfjson')
+    for pointer, error in result.errors.items():
+        print(pointer, error.message)
+    model = result.model
+"""
+import re
+import json
+from typing import Dict, NamedTuple, Union
+
+from pydantic import ValidationError as PydanticValidationError
+from honeybee_schema.validation import ValidationError, ValidationParent
+
+from . import model
+
+INVALID_OBJECT_CODE = '100001'
+# top-level lists of the Model with the type of the objects that can be quarantined
+QUARANTINE_FIELDS = {'buildings': 'Building', 'context_shades': 'ContextShade'}
+# types of objects that can be reported in errors along with their ValidationError type
+_ELEMENT_TYPES = {
+    'Room2D': 'Room2D', 'Story': 'Story', 'Building': 'Building',
+    'ContextShade': 'Shade'
+}
+_PARENT_TYPES = ('Story', 'Building')
+_PARENT_ID = re.compile(r'^[.A-Za-z0-9_-]{1,100}$')
+_ELEMENT_ID = re.compile(r'^[^,;!\n\t]{1,100}$')
+
+
+class LenientResult(NamedTuple):
+    """Result of the lenient validation of a Model."""
+
+    model: Union['model.Model', None]
+    """The Model with all valid Buildings and ContextShades.
+
+    This is None if the Model had errors outside of its Buildings and ContextShades.
+    """
+
+    errors: Dict[str, ValidationError]
+    """Dictionary of the JSON pointer of each invalid value to its ValidationError."""
+
+    quarantined: Dict[str, dict]
+    """Dictionary of the JSON pointer of each removed object to its dictionary."""
+
+    fatal_error: str = ''
+    """Text for the errors outside of the Buildings and ContextShades."""
+
+    @property
+    def valid(self):
+        """Get a boolean for whether the Model had no errors."""
+        return not self.errors and not self.fatal_error
+
+
+def _escape(token):
+    """Escape a key of a JSON object for use in a JSON pointer."""
+    return str(token).replace('~', '~0').replace('/', '~1')
+
+
+def _locate(data, error):
+    """Get the JSON pointer and the objects along the path of a pydantic error.
+
+    Locations of pydantic errors include the names of union members (eg.
+    Ground or list[float]), which are not in the data and are left out.
+    """
+    loc, tokens, objects, current = error['loc'], [], [], data
+    for i, item in enumerate(loc):
+        if isinstance(current, dict) and current.get('type') in _ELEMENT_TYPES:
+            objects.append(current)
+        if isinstance(current, dict) and isinstance(item, str) and item in current:
+            current = current[item]
+        elif isinstance(current, list) and isinstance(item, int) \
+                and 0 <= item < len(current):
+            current = current[item]
+        else:
+            if i == len(loc) - 1 and error['type'] == 'missing':
+                tokens.append(item)
+            continue
+        tokens.append(item)
+    if isinstance(current, dict) and current.get('type') in _ELEMENT_TYPES:
+        objects.append(current)
+    return ''.join('/' + _escape(t) for t in tokens), tokens, objects
+
+
+def json_pointer(data, error):
+    """Get the JSON pointer of the invalid value of a pydantic error.
+
+    Args:
+        data: The dictionary that was validated.
+        error: One of the dictionaries of the errors() of a pydantic ValidationError.
+    """
+    return _locate(data, error)[0]
+
+
+def _name(obj):
+    """Get the display name of an object dictionary, falling back on its identifier."""
+    return str(obj.get('display_name') or obj.get('identifier'))
+
+
+def _validation_error(pointer, tokens, objects, messages):
+    """Get a ValidationError for all of the pydantic errors of a JSON pointer."""
+    if 'energy' in tokens:
+        extension = 'Energy'
+    elif 'radiance' in tokens:
+        extension = 'Radiance'
+    else:
+        extension = 'Core'
+    element = objects[-1] if objects else {'type': QUARANTINE_FIELDS[tokens[0]]}
+    element_id = element.get('identifier')
+    if not isinstance(element_id, str) or not _ELEMENT_ID.match(element_id):
+        element_id = pointer[:100]
+    parents = [
+        ValidationParent(
+            parent_type=obj['type'], id=obj['identifier'], name=_name(obj))
+        for obj in reversed(objects[:-1]) if obj['type'] in _PARENT_TYPES and
+        isinstance(obj.get('identifier'), str) and _PARENT_ID.match(obj['identifier'])
+    ]
+    error = ValidationError(
+        code=INVALID_OBJECT_CODE,
+        error_type='Invalid Schema Object',
+        extension_type=extension,
+        element_type=_ELEMENT_TYPES[element['type']],
+        element_id=[element_id],
+        element_name=[_name(element) if element.get('identifier') else element_id],
+        message='{}: {}'.format(pointer, '; '.join(messages))
+    )
+    if parents:
+        error.parents = [parents]
+    return error
+
+
+def validate_lenient(data):
+    """Validate a Model, quarantining all Buildings and ContextShades with errors.
+
+    Args:
+        data: The bytes or text of a DFJSON or a dictionary of a Model.
+
+    Returns:
+        A LenientResult with the Model of the valid objects, the errors and the
+        dictionaries of the quarantined objects.
+    """
+    model.build_models()
+    try:
+        if isinstance(data, dict):
+            return LenientResult(model.Model.model_validate(data), {}, {})
+        return LenientResult(model.Model.model_validate_json(data), {}, {})
+    except PydanticValidationError as e:
+        pydantic_errors = e.errors()
+    if not isinstance(data, dict):
+        data = json.loads(data)
+
+    # group all of the errors by the JSON pointer of the invalid value
+    grouped, removed, fatal = {}, set(), []
+    for error in pydantic_errors:
+        pointer, tokens, objects = _locate(data, error)
+        if len(tokens) < 2 or tokens[0] not in QUARANTINE_FIELDS \
+                or not isinstance(tokens[1], int):
+            fatal.append('{}: {}'.format(pointer or '/', error['msg']))
+            continue
+        removed.add((tokens[0], tokens[1]))
+        if pointer not in grouped:
+            grouped[pointer] = (tokens, objects, [])
+        if error['msg'] not in grouped[pointer][2]:
+            grouped[pointer][2].append(error['msg'])
+    errors = {
+        pointer: _validation_error(pointer, tokens, objects, messages)
+        for pointer, (tokens, objects, messages) in grouped.items()
+    }
+    quarantined = {
+        '/{}/{}'.format(field, index): data[field][index]
+        for field, index in sorted(removed)
+    }
+    if fatal:
+        return LenientResult(None, errors, quarantined, '\n'.join(fatal))
+
+    valid_data = dict(data)
+    for field in QUARANTINE_FIELDS:
+        if any(f == field for f, _ in removed):
+            valid_data[field] = [
+                obj for i, obj in enumerate(data[field]) if (field, i) not in removed]
+    try:
+        valid_model = model.Model.model_validate(valid_data)
+    except PydanticValidationError as e:  # checks of the whole Model can still fail
+        fatal = ['{}: {}'.format(json_pointer(valid_data, error) or '/', error['msg'])
+                 for error in e.errors()]
+        return LenientResult(None, errors, quarantined, '\n'.join(fatal))
+    return LenientResult(valid_model, errors, quarantined)
+
+
+def load_lenient(path):
+    """Load a DFJSON file, quarantining all Buildings and ContextShades with errors.
+
+    Args:
+        path: The path to a DFJSON file.
+
+    Returns:
+        A LenientResult with the Model of the valid objects, the errors and the
+        dictionaries of the quarantined objects.
+    """
+    with open(path, 'rb') as f:
+        return validate_lenient(f.read())
@@ -0,0 +1,225 @@
+"""Report of the memory retained by each part of a validated Model.
+
+The memory_report function walks all of the Python objects of a Model and adds
+up their sizes (from sys.getsizeof) to find which Buildings, Stories, energy or
+radiance resources and fields use the most memory. Each object is counted
+only once, under the first part of the Model where it is found (in the order
+of the Model fields). This means that objects that are shared by several
+parts of the Model (eg. interned identifiers or shared default objects) are
+only counted where they first appear. Global singletons (None, booleans and
+enumeration members) are not counted.
+
+Usage:
+
+.. code-block:: python
+
+    from dragonfly_schema.memory import memory_report
+
+    report = memory_report(model)
+    print(report.table())
+    print(report.buildings)
+"""
+import sys
+from array import array
+from collections import Counter
+from enum import Enum
+from functools import lru_cache
+from typing import Dict, NamedTuple, Annotated, get_args, get_origin
+
+from pydantic import BaseModel
+
+from ._construct import _UNION_TYPES
+
+# field names of the lists of parameters that are assigned to each Room2D segment
+_PARAMETER_FIELDS = ('boundary_conditions', 'air_boundaries')
+# objects that are shared by the whole process and not retained by the Model
+_SINGLETONS = (type(None), bool, Enum, type)
+
+
+class MemoryReport(NamedTuple):
+    """Retained bytes of each part of a Model."""
+
+    total: int
+    """Integer for the bytes of all of the objects of the Model."""
+
+    buildings: Dict[str, int]
+    """Dictionary of the identifier of each Building to its bytes."""
+
+    stories: Dict[str, int]
+    """Dictionary of the identifiers of each Story (as building/story) to its bytes."""
+
+    resources: Dict[str, int]
+    """Dictionary of each resource list of the Model extensions to its bytes.
+
+    Keys combine the extension and the field (eg. energy.constructions,
+    radiance.modifiers).
+    """
+
+    fields: Dict[str, int]
+    """Dictionary of each object field (eg. Room2D.floor_boundary) to its bytes.
+
+    Each field only includes the objects directly within it and not the fields
+    of the objects nested within it (eg. Room2D.window_parameters includes the
+    window parameter objects but not their DetailedWindows.polygons). The sum
+    of all fields is the total. Fields are sorted from largest to smallest.
+    """
+
+    categories: Dict[str, int]
+    """Dictionary of the bytes of each type of field.
+
+    Types are coordinates (fields with nested lists of numbers), parameters
+    (the per-segment lists of Room2Ds), user_data, identifiers (identifiers and
+    display names) and other. The sum of all categories is the total.
+    """
+
+    def table(self, limit=10):
+        """Get text for a table with the largest parts of the Model.
+
+        Args:
+            limit: An integer for the maximum number of rows of each part. (Default: 10).
+        """
+        lines = [f'total: {self.total / 1e6:.3f} MB']
+        for title, values in (
+                ('categories', self.categories), ('buildings', self.buildings),
+                ('stories', self.stories), ('resources', self.resources),
+                ('fields', self.fields)):
+            if not values:
+                continue
+            lines.append(f'\n{title}:')
+            largest = sorted(values.items(), key=lambda kv: kv[1], reverse=True)
+            width = max(len(k) for k, _ in largest[:limit])
+            lines.extend(f'  {k:{width}}  {v / 1e6:>10.3f} MB' for k, v in largest[:limit])
+        return '\n'.join(lines)
+
+
+def _number_list_depth(annotation):
+    """Get the depth of nested lists of numbers in an annotation (0 if it is not one)."""
+    origin = get_origin(annotation)
+    if origin is Annotated:
+        return _number_list_depth(get_args(annotation)[0])
+    if origin in _UNION_TYPES:
+        return max(_number_list_depth(a) for a in get_args(annotation))
+    if origin is list:
+        args = get_args(annotation)
+        if args and args[0] in (float, int):
+            return 1
+        depth = _number_list_depth(args[0]) if args else 0
+        return depth + 1 if depth else 0
+    return 0
+
+
+@lru_cache(maxsize=None)
+def _category(model_cls, field):
+    """Get the category of a field of an object class."""
+    if field == 'user_data':
+        return 'user_data'
+    if field in ('identifier', 'display_name'):
+        return 'identifiers'
+    if field.endswith('_parameters') or field in _PARAMETER_FIELDS:
+        return 'parameters'
+    info = model_cls.model_fields.get(field)
+    if info is not None and _number_list_depth(info.annotation) >= 2:
+        return 'coordinates'
+    return 'other'
+
+
+class _MemoryWalker:
+    """Walk the objects of a Model to add up their sizes."""
+
+    def __init__(self, resource_owners):
+        self.seen = set()
+        self.fields = Counter()
+        self.categories = Counter()
+        self.buildings = {}
+        self.stories = {}
+        self.resources = {}
+        self._resource_owners = resource_owners
+        self._building = None
+
+    def size(self, obj, key):
+        """Get the bytes of an object and all objects within it that were not seen.
+
+        Args:
+            obj: Any object of the Model.
+            key: A tuple with the class and field name of the field of obj.
+        """
+        if isinstance(obj, _SINGLETONS) or id(obj) in self.seen:
+            return 0
+        self.seen.add(id(obj))
+        size = sys.getsizeof(obj)
+        if isinstance(obj, BaseModel):
+            size += self._model_size(obj, key)
+        elif isinstance(obj, dict):
+            size += sum(self.size(k, key) + self.size(v, key) for k, v in obj.items())
+        elif isinstance(obj, (list, tuple, set, frozenset)):
+            size += sum(self.size(v, key) for v in obj)
+        elif not isinstance(obj, (str, bytes, int, float, array)):
+            size += self._other_size(obj, key)
+        self._add(key, sys.getsizeof(obj))
+        return size
+
+    def _add(self, key, size):
+        """Add the bytes of an object to the total of a field."""
+        cls, field = key
+        self.fields[f'{cls.__name__}.{field}' if field else cls.__name__] += size
+        self.categories[_category(cls, field) if field else 'other'] += size
+
+    def _model_size(self, obj, key):
+        """Get the bytes of the attributes and fields of a pydantic object."""
+        size = 0
+        for attr in ('__dict__', '__pydantic_fields_set__', '__pydantic_private__'):
+            value = getattr(obj, attr, None)
+            if value is not None and id(value) not in self.seen:
+                self.seen.add(id(value))
+                size += sys.getsizeof(value)
+                self._add(key, sys.getsizeof(value))
+                if attr == '__pydantic_private__':
+                    size += sum(self.size(v, key) for v in value.values())
+
+        building = self._building
+        if obj.__class__.__name__ == 'Building':
+            self._building = obj.identifier
+        cls, resource_ext = obj.__class__, self._resource_owners.get(id(obj))
+        for field, value in obj.__dict__.items():
+            field_size = self.size(value, (cls, field))
+            if resource_ext is not None and isinstance(value, (list, BaseModel, dict)):
+                self.resources[f'{resource_ext}.{field}'] = field_size
+            size += field_size
+        self._building = building
+
+        total = size + sys.getsizeof(obj)
+        if cls.__name__ == 'Building':
+            self.buildings[obj.identifier] = total
+        elif cls.__name__ == 'Story':
+            self.stories[f'{building}/{obj.identifier}'] = total
+        return size
+
+    def _other_size(self, obj, key):
+        """Get the bytes of the attributes of any other object."""
+        attrs = getattr(obj, '__dict__', None)
+        return self.size(attrs, key) if isinstance(attrs, dict) else 0
+
+
+def memory_report(model):
+    """Get a report of the memory retained by each part of a Model.
+
+    Args:
+        model: A validated dragonfly Model object. Extension properties that
+            were loaded as raw dictionaries (see Model.load) are included.
+
+    Returns:
+        A MemoryReport with the bytes of each Building, Story, resource list of
+        the Model extension properties, field and type of field.
+    """
+    owners = {}
+    properties = model.properties
+    for ext, value in (properties.__dict__.items()
+                       if isinstance(properties, BaseModel) else ()):
+        if isinstance(value, BaseModel):
+            owners[id(value)] = ext
+    walker = _MemoryWalker(owners)
+    total = walker.size(model, (model.__class__, None))
+    return MemoryReport(
+        total, walker.buildings, walker.stories, walker.resources,
+        dict(walker.fields.most_common()), dict(walker.categories.most_common())
+    )
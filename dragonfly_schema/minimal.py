@@ -0,0 +1,57 @@
+"""Minimal serialization profile that leaves out all default values.
+
+Most of the size of a typical DFJSON comes from default values that are
+repeated on every object (eg. has_floor, ceiling_plenum_depth, Autocalculate
+objects and the global construction and modifier sets). The minimal profile
+leaves out every value that is equal to its default except for the type of
+each object, which is needed to select the right object when the JSON is
+loaded. Since every value that is left out is restored from the same default
+on load, the minimal JSON validates into an object that is equal to the
+original one.
+
+Usage:
+
+.. code-block:: python
+
+    model_json = model.model_dump_json(minimal=True)
+    # or for any other object
+    from dragonfly_schema.minimal import minimal_dict
+    room_dict = minimal_dict(room_2d)
+"""
+from pydantic import BaseModel
+
+
+def _restore_types(obj, data):
+    """Add the type of each object back into the dictionary of an exclude-defaults dump.
+
+    Args:
+        obj: A pydantic object or a value of one of its fields.
+        data: The serialized version of obj, which may be missing some keys.
+
+    Returns:
+        The serialized data with the type of each pydantic object as its first key.
+    """
+    if isinstance(obj, BaseModel):
+        if not isinstance(data, dict):  # objects with custom serializers
+            return data
+        restored = {'type': obj.type} if 'type' in obj.__class__.model_fields else {}
+        for key, value in data.items():
+            restored[key] = _restore_types(getattr(obj, key, None), value)
+        return restored
+    if isinstance(obj, (list, tuple)) and isinstance(data, list):
+        return [_restore_types(o, d) for o, d in zip(obj, data)]
+    if isinstance(obj, dict) and isinstance(data, dict):
+        return {k: _restore_types(obj.get(k), v) for k, v in data.items()}
+    return data
+
+
+def minimal_dict(obj, **kwargs):
+    """Get a JSON-compatible dictionary of an object without any default values.
+
+    Args:
+        obj: Any dragonfly schema object (eg. a Model, Building or Room2D).
+        **kwargs: Any of the other keyword arguments accepted by the pydantic
+            model_dump method (eg. exclude, context).
+    """
+    data = obj.model_dump(mode='json', exclude_defaults=True, **kwargs)
+    return _restore_types(obj, data)
@@ -1,10 +1,19 @@
-"""Model schema and the 3 geometry objects that define it."""
-from pydantic import BaseModel, Field, model_validator
-from typing import List, Union, Literal, Annotated
+"""Model schema and the 3 geometry objects that define it.
+
+The extension properties (energy, radiance, doe2, comparison) and the honeybee
+Room are only imported, and the validators of the objects in this module are
+only built, upon first use of the objects. This keeps the import of this module
+fast for applications that never validate a Model. Use the build_models function
+to import and build everything upfront.
+"""
+import importlib
+from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
+from pydantic_core import to_json
+from typing import TYPE_CHECKING, ClassVar, List, Tuple, Union, Literal, Annotated
 from enum import Enum
 
 from honeybee_schema._base import IDdBaseModel
-from honeybee_schema.model import Room, Face3D, Mesh3D, Units
+from honeybee_schema.geometry import Face3D, Mesh3D
 from honeybee_schema.boundarycondition import Ground, Outdoors, Surface, \
     Adiabatic, OtherSideTemperature
 from honeybee_schema.altnumber import Autocalculate
@@ -15,40 +24,127 @@ from .shading_parameter import ExtrudedBorder, Overhang, LouversByDistance, \
     LouversByCount
 from .skylight_parameter import GriddedSkylightArea, GriddedSkylightRatio, \
     DetailedSkylights
+from .segment_parameter import CompactBoundaryConditions, CompactWindowParameters, \
+    CompactShadingParameters, CompactAirBoundaries
 from .roof import RoofSpecification
-from .energy.properties import Room2DEnergyPropertiesAbridged, \
-    StoryEnergyPropertiesAbridged, BuildingEnergyPropertiesAbridged, \
-    ContextShadeEnergyPropertiesAbridged, ModelEnergyProperties
-from .radiance.properties import Room2DRadiancePropertiesAbridged, \
-    StoryRadiancePropertiesAbridged, BuildingRadiancePropertiesAbridged, \
-    ContextShadeRadiancePropertiesAbridged, ModelRadianceProperties
-from .doe2.properties import Room2DDoe2Properties, ModelDoe2Properties
-from .comparison.properties import Room2DComparisonProperties, ModelComparisonProperties
-
-
+from .interning import intern_object, intern_objects, intern_identifier
+from .strict import validate_strict
+from ._rounding import coordinate_decimals, round_model_dict
+from .minimal import minimal_dict
+
+if TYPE_CHECKING:
+    from honeybee_schema.model import Room, Units
+    from .energy.properties import Room2DEnergyPropertiesAbridged, \
+        StoryEnergyPropertiesAbridged, BuildingEnergyPropertiesAbridged, \
+        ContextShadeEnergyPropertiesAbridged, ModelEnergyProperties
+    from .radiance.properties import Room2DRadiancePropertiesAbridged, \
+        StoryRadiancePropertiesAbridged, BuildingRadiancePropertiesAbridged, \
+        ContextShadeRadiancePropertiesAbridged, ModelRadianceProperties
+    from .doe2.properties import Room2DDoe2Properties, ModelDoe2Properties
+    from .comparison.properties import Room2DComparisonProperties, \
+        ModelComparisonProperties
+
+# fields of the readOnly global sets, which can be excluded upon serialization
+GLOBAL_SETS = {
+    'properties': {
+        'energy': {'global_construction_set'},
+        'radiance': {'global_modifier_set'}
+    }
+}
+
+# objects that are imported into this module only when the models are first built
+_LAZY_IMPORTS = {
+    'Room': 'honeybee_schema.model',
+    'Units': 'honeybee_schema.model',
+    'Room2DEnergyPropertiesAbridged': '.energy.properties',
+    'StoryEnergyPropertiesAbridged': '.energy.properties',
+    'BuildingEnergyPropertiesAbridged': '.energy.properties',
+    'ContextShadeEnergyPropertiesAbridged': '.energy.properties',
+    'ModelEnergyProperties': '.energy.properties',
+    'Room2DRadiancePropertiesAbridged': '.radiance.properties',
+    'StoryRadiancePropertiesAbridged': '.radiance.properties',
+    'BuildingRadiancePropertiesAbridged': '.radiance.properties',
+    'ContextShadeRadiancePropertiesAbridged': '.radiance.properties',
+    'ModelRadianceProperties': '.radiance.properties',
+    'Room2DDoe2Properties': '.doe2.properties',
+    'ModelDoe2Properties': '.doe2.properties',
+    'Room2DComparisonProperties': '.comparison.properties',
+    'ModelComparisonProperties': '.comparison.properties'
+}
+
+
+def load_extensions():
+    """Import the extension property objects and the honeybee Room into this module.
+
+    This is called automatically the first time that any object of this module
+    is built (eg. upon first validation or JSON schema generation).
+    """
+    module_globals = globals()
+    for name, module in _LAZY_IMPORTS.items():
+        if name not in module_globals:
+            module_obj = importlib.import_module(module, __package__)
+            module_globals[name] = getattr(module_obj, name)
+
+
+def __getattr__(name):
+    """Import the extension property objects when they are requested from this module."""
+    if name in _LAZY_IMPORTS:
+        load_extensions()
+        return globals()[name]
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+
+def _default_units():
+    """Get the default Units of a Model, loading the extensions if necessary."""
+    load_extensions()
+    return Units.meters
+
+
+def _lazy_extensions(cls):
+    """Class decorator to load the extensions before the validator of cls is built."""
+    base_rebuild = cls.model_rebuild.__func__
+
+    def model_rebuild(klass, *, force=False, raise_errors=True, **_private_kwargs):
+        load_extensions()
+        # the annotations only refer to the globals of this module, which hold all
+        # types once the extensions are loaded, and so the namespace of the caller
+        # (given in the private keyword arguments of pydantic) is not passed on
+        return base_rebuild(klass, force=force, raise_errors=raise_errors)
+
+    model_rebuild.__doc__ = base_rebuild.__doc__
+    cls.model_rebuild = classmethod(model_rebuild)
+    return cls
+
+
+@_lazy_extensions
 class Room2DPropertiesAbridged(BaseModel):
 
+    model_config = ConfigDict(defer_build=True)
+
     type: Literal['Room2DPropertiesAbridged'] = 'Room2DPropertiesAbridged'
 
-    energy: Union[Room2DEnergyPropertiesAbridged, None] = Field(
+    energy: Union['Room2DEnergyPropertiesAbridged', None] = Field(
         default=None
     )
 
-    radiance: Union[Room2DRadiancePropertiesAbridged, None] = Field(
+    radiance: Union['Room2DRadiancePropertiesAbridged', None] = Field(
         default=None
     )
 
-    doe2: Union[Room2DDoe2Properties, None] = Field(
+    doe2: Union['Room2DDoe2Properties', None] = Field(
         default=None
     )
 
-    comparison: Union[Room2DComparisonProperties, None] = Field(
+    comparison: Union['Room2DComparisonProperties', None] = Field(
         default=None
     )
 
 
+@_lazy_extensions
 class Room2D(IDdBaseModel):
 
+    model_config = ConfigDict(defer_build=True)
+
     type: Literal['Room2D'] = 'Room2D'
 
     floor_boundary: Annotated[
@@ -143,7 +239,7 @@ class Room2D(IDdBaseModel):
 
     boundary_conditions: Union[List[
         Union[Ground, Outdoors, Surface, Adiabatic, OtherSideTemperature]
-    ], None] = Field(
+    ], CompactBoundaryConditions, None] = Field(
         default=None,
         description='A list of boundary conditions that match the number of segments '
         'in the input floor_geometry + floor_holes. These will be used to assign '
@@ -151,35 +247,40 @@ class Room2D(IDdBaseModel):
         'model. Their order should align with the order of segments in the '
         'floor_boundary and then with each hole segment. If None, all boundary '
         'conditions will be Outdoors or Ground depending on whether ceiling '
-        'height of the room is at or below 0 (the assumed ground plane).'
+        'height of the room is at or below 0 (the assumed ground plane). '
+        'A CompactBoundaryConditions object can also be used to specify a '
+        'default boundary condition with overrides for specific segments.'
     )
 
     window_parameters: Union[List[Union[
         None, SingleWindow, SimpleWindowArea, SimpleWindowRatio, RepeatingWindowRatio,
         RectangularWindows, DetailedWindows
-    ]], None] = Field(
+    ]], CompactWindowParameters, None] = Field(
         default=None,
         description='A list of WindowParameter objects that dictate how the window '
         'geometries will be generated for each of the walls. If None, no windows '
-        'will exist over the entire Room2D.'
+        'will exist over the entire Room2D. A CompactWindowParameters object can '
+        'also be used to specify a default with overrides for specific segments.'
     )
 
     shading_parameters: Union[List[Union[
         None, ExtrudedBorder, Overhang, LouversByDistance, LouversByCount
-    ]], None] = Field(
+    ]], CompactShadingParameters, None] = Field(
         default=None,
         description='A list of ShadingParameter objects that dictate how the shade '
         'geometries will be generated for each of the walls. If None, no shades '
-        'will exist over the entire Room2D.'
+        'will exist over the entire Room2D. A CompactShadingParameters object can '
+        'also be used to specify a default with overrides for specific segments.'
     )
 
-    air_boundaries: Union[List[bool], None] = Field(
+    air_boundaries: Union[List[bool], CompactAirBoundaries, None] = Field(
         default=None,
         description='A list of booleans for whether each wall has an air boundary type. '
         'False values indicate a standard opaque type while True values indicate '
         'an AirBoundary type. All walls will be False by default. Note that any '
         'walls with a True air boundary must have a Surface boundary condition '
-        'without any windows.'
+        'without any windows. A CompactAirBoundaries object can also be used '
+        'to specify a default with overrides for specific segments.'
     )
 
     skylight_parameters: Union[
@@ -196,33 +297,75 @@ class Room2D(IDdBaseModel):
         '(Radiance, EnergyPlus).'
     )
 
+    @field_validator('zone')
+    @classmethod
+    def intern_zone(cls, v):
+        "Intern zone identifiers that are shared across many Room2Ds."
+        return intern_identifier(v)
+
+    @field_validator('boundary_conditions', 'window_parameters',
+                     'shading_parameters', 'skylight_parameters')
+    @classmethod
+    def intern_parameters(cls, v):
+        "Share identical parameter objects in memory when interning is active."
+        if isinstance(v, list):
+            return intern_objects(v)
+        if hasattr(v, 'indices'):  # compact segment parameters
+            v.default = intern_object(v.default)
+            intern_objects(v.values)
+        return intern_object(v)
+
+    _SEGMENT_ATTRIBUTES: ClassVar[Tuple[str, ...]] = (
+        'boundary_conditions', 'window_parameters',
+        'shading_parameters', 'air_boundaries'
+    )
+
     @model_validator(mode='after')
     def check_segment_count(self):
         "Ensure len of boundary_conditions, window par, shading par match segment count."
-        floor_bound = self.floor_boundary
-        floor_holes = self.floor_holes
-        bcs = self.boundary_conditions
-        win_par = self.window_parameters
-        shd_par = self.shading_parameters
-        air_bnd = self.air_boundaries
-
-        seg_count = len(floor_bound) if floor_holes is None else \
-            len(floor_bound) + sum(len(hole) for hole in floor_holes)
-
-        if bcs is not None:
-            assert len(bcs) == seg_count, 'Length of Room2D boundary_conditions ' \
-                f'must match number of floor segments. {len(bcs)} != {seg_count}'
-        if win_par is not None:
-            assert len(win_par) == seg_count, 'Length of Room2D window_parameters ' \
-                f'must match number of floor segments. {len(win_par)} != {seg_count}'
-        if shd_par is not None:
-            assert len(shd_par) == seg_count, 'Length of Room2D shading_parameters ' \
-                f'must match number of floor segments. {len(shd_par)} != {seg_count}'
-        if air_bnd is not None:
-            assert len(air_bnd) == seg_count, 'Length of Room2D air_boundaries ' \
-                f'must match number of floor segments. {len(air_bnd)} != {seg_count}'
+        seg_count = self.segment_count
+        for attr in self._SEGMENT_ATTRIBUTES:
+            values = getattr(self, attr)
+            if values is None:
+                continue
+            if isinstance(values, list):
+                assert len(values) == seg_count, f'Length of Room2D {attr} ' \
+                    f'must match number of floor segments. {len(values)} != {seg_count}'
+            elif values.indices:
+                max_i = max(values.indices)
+                assert max_i < seg_count, f'Room2D {attr} index {max_i} is out ' \
+                    f'of range for the number of floor segments ({seg_count}).'
         return self
 
+    @property
+    def segment_count(self):
+        """The number of segments in the floor_boundary and floor_holes."""
+        floor_holes = self.floor_holes
+        return len(self.floor_boundary) if floor_holes is None else \
+            len(self.floor_boundary) + sum(len(hole) for hole in floor_holes)
+
+    def segment_list(self, attr):
+        """Get one of the per-segment attributes as a list with an item per segment.
+
+        Compact (default-plus-override) values are expanded to a new list on each
+        request, which leaves the compact object unchanged.
+
+        Args:
+            attr: Text for the name of the per-segment attribute. Choose from
+                boundary_conditions, window_parameters, shading_parameters
+                and air_boundaries.
+
+        Returns:
+            A list with one item for each floor segment. None if the attribute
+            has not been specified for the Room2D.
+        """
+        assert attr in self._SEGMENT_ATTRIBUTES, \
+            f'"{attr}" is not a per-segment attribute of Room2D.'
+        values = getattr(self, attr)
+        if values is None or isinstance(values, list):
+            return values
+        return values.expand(self.segment_count)
+
 
 class StoryType(str, Enum):
     standard = 'Standard'
@@ -230,21 +373,27 @@ class StoryType(str, Enum):
     floor_plenum = 'FloorPlenum'
 
 
+@_lazy_extensions
 class StoryPropertiesAbridged(BaseModel):
 
+    model_config = ConfigDict(defer_build=True)
+
     type: Literal['StoryPropertiesAbridged'] = 'StoryPropertiesAbridged'
 
-    energy: Union[StoryEnergyPropertiesAbridged, None] = Field(
+    energy: Union['StoryEnergyPropertiesAbridged', None] = Field(
         default=None
     )
 
-    radiance: Union[StoryRadiancePropertiesAbridged, None] = Field(
+    radiance: Union['StoryRadiancePropertiesAbridged', None] = Field(
         default=None
     )
 
 
+@_lazy_extensions
 class Story(IDdBaseModel):
 
+    model_config = ConfigDict(defer_build=True)
+
     type: Literal['Story'] = 'Story'
 
     room_2ds: List[Room2D] = Field(
@@ -296,22 +445,52 @@ class Story(IDdBaseModel):
         '(Radiance, EnergyPlus).'
     )
 
-
+    def resolve_heights(self):
+        """Get a tuple of (floor_height, floor_to_floor_height) with no Autocalculate.
+
+        Autocalculated values are derived from the room_2ds in a single loop.
+        Nothing is cached on the Story so that the result always reflects the
+        current room_2ds. Use heights.resolve_story_heights to resolve all
+        Stories of a Building or Model at once.
+        """
+        flr_hgt, ftf_hgt = self.floor_height, self.floor_to_floor_height
+        auto_flr = isinstance(flr_hgt, Autocalculate)
+        auto_ftf = isinstance(ftf_hgt, Autocalculate)
+        if auto_flr or auto_ftf:
+            min_flr, max_ftc = float('inf'), 0.0
+            for room in self.room_2ds:
+                if room.floor_height < min_flr:
+                    min_flr = room.floor_height
+                if room.floor_to_ceiling_height > max_ftc:
+                    max_ftc = room.floor_to_ceiling_height
+            if auto_flr:
+                flr_hgt = min_flr if self.room_2ds else 0.0
+            if auto_ftf:
+                ftf_hgt = max_ftc
+        return flr_hgt, ftf_hgt
+
+
+@_lazy_extensions
 class BuildingPropertiesAbridged(BaseModel):
 
+    model_config = ConfigDict(defer_build=True)
+
     type: Literal['BuildingPropertiesAbridged'] = 'BuildingPropertiesAbridged'
 
-    energy: Union[BuildingEnergyPropertiesAbridged, None] = Field(
+    energy: Union['BuildingEnergyPropertiesAbridged', None] = Field(
         default=None
     )
 
-    radiance: Union[BuildingRadiancePropertiesAbridged, None] = Field(
+    radiance: Union['BuildingRadiancePropertiesAbridged', None] = Field(
         default=None
     )
 
 
+@_lazy_extensions
 class Building(IDdBaseModel):
 
+    model_config = ConfigDict(defer_build=True)
+
     type: Literal['Building'] = 'Building'
 
     unique_stories: Union[List[Story], None] = Field(
@@ -324,7 +503,7 @@ class Building(IDdBaseModel):
         'list should be the first (lowest) story of the repeated floors.'
     )
 
-    room_3ds: Union[List[Room], None] = Field(
+    room_3ds: Union[List['Room'], None] = Field(
         default=None,
         description='An optional array of 3D Honeybee Room objects for additional '
         'Rooms that are a part of the Building but are not represented within '
@@ -366,22 +545,48 @@ class Building(IDdBaseModel):
         '(Radiance, EnergyPlus).'
     )
 
+    def validate_room_3ds(self):
+        """Validate any room_3ds that were loaded as raw JSON dictionaries.
 
+        The room_3ds are only kept as dictionaries when the Building is loaded
+        with a parsing profile that excludes them (see Model.load) and this
+        method is the way to get them as Rooms. The dictionaries are replaced
+        with the validated Rooms, which are left as they are in later calls.
+
+        Returns:
+            The list of validated Honeybee Rooms or None if the Building has
+            no room_3ds.
+        """
+        rooms = self.__dict__['room_3ds']
+        if rooms is not None and any(isinstance(r, dict) for r in rooms):
+            load_extensions()  # the Building may have been built without validation
+            rooms = [Room.model_validate(r) if isinstance(r, dict) else r
+                     for r in rooms]
+            self.__dict__['room_3ds'] = rooms
+        return rooms
+
+
+@_lazy_extensions
 class ContextShadePropertiesAbridged(BaseModel):
 
+    model_config = ConfigDict(defer_build=True)
+
     type: Literal['ContextShadePropertiesAbridged'] = 'ContextShadePropertiesAbridged'
 
-    energy: Union[ContextShadeEnergyPropertiesAbridged, None] = Field(
+    energy: Union['ContextShadeEnergyPropertiesAbridged', None] = Field(
         default=None
     )
 
-    radiance: Union[ContextShadeRadiancePropertiesAbridged, None] = Field(
+    radiance: Union['ContextShadeRadiancePropertiesAbridged', None] = Field(
         default=None
     )
 
 
+@_lazy_extensions
 class ContextShade(IDdBaseModel):
 
+    model_config = ConfigDict(defer_build=True)
+
     type: Literal['ContextShade'] = 'ContextShade'
 
     geometry: List[Union[Face3D, Mesh3D]] = Field(
@@ -404,29 +609,35 @@ class ContextShade(IDdBaseModel):
     )
 
 
+@_lazy_extensions
 class ModelProperties(BaseModel):
 
+    model_config = ConfigDict(defer_build=True)
+
     type: Literal['ModelProperties'] = 'ModelProperties'
 
-    energy: Union[ModelEnergyProperties, None] = Field(
+    energy: Union['ModelEnergyProperties', None] = Field(
         default=None
     )
 
-    radiance: Union[ModelRadianceProperties, None] = Field(
+    radiance: Union['ModelRadianceProperties', None] = Field(
         default=None
     )
 
-    doe2: Union[ModelDoe2Properties, None] = Field(
+    doe2: Union['ModelDoe2Properties', None] = Field(
         default=None
     )
 
-    comparison: Union[ModelComparisonProperties, None] = Field(
+    comparison: Union['ModelComparisonProperties', None] = Field(
         default=None
     )
 
 
+@_lazy_extensions
 class Model(IDdBaseModel):
 
+    model_config = ConfigDict(defer_build=True)
+
     type: Literal['Model'] = 'Model'
 
     version: str = Field(
@@ -445,8 +656,9 @@ class Model(IDdBaseModel):
         description='A list of ContextShades in the model.'
     )
 
-    units: Units = Field(
-        default=Units.meters,
+    units: 'Units' = Field(
+        default_factory=_default_units,
+        json_schema_extra={'default': 'Meters'},
         description='Text indicating the units in which the model geometry exists. '
         'This is used to scale the geometry to the correct units for simulation '
         'engines like EnergyPlus, which requires all geometry be in meters.'
@@ -491,3 +703,111 @@ class Model(IDdBaseModel):
         description='Extension properties for particular simulation engines '
         '(Radiance, EnergyPlus).'
     )
+
+    @model_validator(mode='after')
+    def check_strict_geometry(self):
+        "Ensure the geometry checks pass when strict validation is active."
+        validate_strict(self)
+        return self
+
+    @classmethod
+    def model_json_schema(cls, *args, **kwargs):
+        """Get the JSON schema of the Model.
+
+        When called with the default arguments, the schema is read from the
+        prebuilt cache if it exists (see the schema_cache module). Otherwise,
+        it is generated by pydantic.
+        """
+        if cls is Model and not args and not kwargs:
+            from .schema_cache import json_schema
+            return json_schema()
+        return super().model_json_schema(*args, **kwargs)
+
+    @classmethod
+    def load(cls, path, include=None):
+        """Load a Model from a DFJSON file with an option to validate only some parts.
+
+        Args:
+            path: Path to a DFJSON file.
+            include: An optional list of text for the parts of the Model to be
+                validated. Choose from geometry, room_3ds, energy, radiance, doe2
+                and comparison. The geometry is always validated and any
+                extension that is not included is kept as a raw JSON dictionary,
+                which is written back out unchanged when the Model is serialized.
+                When room_3ds is not included, the Building room_3ds are kept as
+                the dictionaries parsed from the JSON until
+                Building.validate_room_3ds is called. For example,
+                include=('geometry',) skips the validation of all extension
+                properties and of the room_3ds. If None, the full Model will be
+                validated. (Default: None).
+        """
+        from .profile import model_class
+        with open(path, 'rb') as f:
+            return model_class(include).model_validate_json(f.read())
+
+    def model_dump_json(
+        self, *, round_coordinates=False, exclude_global_sets=False, minimal=False,
+        **kwargs
+    ):
+        """Get a JSON string of the Model with options to make it more compact.
+
+        Args:
+            round_coordinates: Boolean to note whether the coordinates of the
+                Room2D floors, DetailedWindows, DetailedSkylights, RoofSpecifications,
+                DetailedClearstories and ContextShades should be rounded to the number
+                of decimals implied by the Model tolerance. This means that no
+                vertex moves by more than half of the tolerance while the file size
+                is reduced. (Default: False).
+            exclude_global_sets: Boolean to note whether the readOnly
+                global_construction_set and global_modifier_set should be left
+                out of the Model properties. These are the same for every Model
+                and they are restored when the JSON is loaded. (Default: False).
+            minimal: Boolean to note whether all values that are equal to their
+                defaults should be left out of the JSON, except for the type of
+                each object. Loading the resulting JSON produces a Model that is
+                equal to this one. See the minimal module for details and for
+                the minimal serialization of other objects. (Default: False).
+            **kwargs: Any of the other keyword arguments accepted by the pydantic
+                model_dump_json method (eg. indent, exclude_none).
+        """
+        if exclude_global_sets:
+            kwargs['exclude'] = _merge_exclude(kwargs.get('exclude'), GLOBAL_SETS)
+        decimals = coordinate_decimals(self.tolerance) if round_coordinates else None
+        if decimals is None and not minimal:
+            return super().model_dump_json(**kwargs)
+        indent = kwargs.pop('indent', None)
+        model_dict = minimal_dict(self, **kwargs) if minimal \
+            else self.model_dump(mode='json', **kwargs)
+        if decimals is not None:
+            round_model_dict(model_dict, decimals)
+        return to_json(model_dict, indent=indent).decode('utf-8')
+
+
+def _merge_exclude(exclude, other):
+    """Merge two pydantic exclude inputs (sets or nested dictionaries of fields)."""
+    if exclude is None:
+        return other
+    exclude = {k: True for k in exclude} if not isinstance(exclude, dict) \
+        else dict(exclude)
+    other = {k: True for k in other} if not isinstance(other, dict) else other
+    for key, value in other.items():
+        current = exclude.get(key)
+        if current is None or value is True:
+            exclude[key] = value
+        elif current is not True:
+            exclude[key] = _merge_exclude(current, value)
+    return exclude
+
+
+def build_models():
+    """Import all extensions and build the validators of all objects in this module.
+
+    This is useful for applications that prefer to pay the cost of building
+    the models upfront (eg. when a worker process starts) rather than upon
+    the first validation.
+    """
+    load_extensions()
+    for model_cls in (Room2DPropertiesAbridged, Room2D, StoryPropertiesAbridged, Story,
+                      BuildingPropertiesAbridged, Building, ContextShadePropertiesAbridged,
+                      ContextShade, ModelProperties, Model):
+        model_cls.model_rebuild()
@@ -0,0 +1,124 @@
+"""Parsing profiles that validate only part of a dragonfly Model.
+
+Many applications only need the geometry of a Model (eg. massing viewers or
+area takeoffs) and so they do not need to validate the extension properties,
+which are often the largest part of a DFJSON. A parsing profile is a set of
+subclasses of the objects in the model module where the excluded extension
+properties are kept as raw JSON dictionaries. The loaded objects are still
+instances of Model, Building, Story, Room2D, etc. and the raw properties are
+written back out unchanged when the Model is serialized.
+
+The Building room_3ds can also be excluded, in which case each room_3d is kept
+as the dictionary that was parsed from the JSON and it is only validated against
+the honeybee Room schema when Building.validate_room_3ds is called, which also
+replaces the dictionaries with the validated Rooms. The rooms are kept as
+parsed dictionaries rather than as the raw bytes of the JSON such that they
+are written back out with the rest of the Model without a custom serializer.
+Until validate_room_3ds is called, the room_3ds attribute returns the
+dictionaries and so any code that needs Rooms should call it first.
+"""
+import copy
+import functools
+from typing import List, Union, Annotated
+
+from pydantic import Field, create_model
+
+from . import model
+
+GEOMETRY = 'geometry'
+ROOM_3DS = 'room_3ds'
+EXTENSIONS = ('energy', 'radiance', 'doe2', 'comparison')
+
+
+def _field(model_cls, name, annotation):
+    """Get a field definition for create_model that swaps the type of a field."""
+    return annotation, copy.copy(model_cls.model_fields[name])
+
+
+def _subclass(model_cls, **fields):
+    """Create a subclass of model_cls with new field definitions."""
+    return create_model(
+        model_cls.__name__, __base__=model_cls, __module__=model.__name__, **fields
+    )
+
+
+def _properties_class(model_cls, raw_extensions):
+    """Create a subclass of a Properties object with the raw_extensions as dictionaries.
+    """
+    fields = {
+        ext: (Union[dict, None], None)
+        for ext in raw_extensions if ext in model_cls.model_fields
+    }
+    return _subclass(model_cls, **fields) if fields else model_cls
+
+
+@functools.lru_cache(maxsize=None)
+def _profile_model(raw_extensions, raw_room_3ds=False):
+    """Create the Model class that keeps a set of extensions as raw dictionaries."""
+    model.build_models()
+    m = model
+    room_props = _properties_class(m.Room2DPropertiesAbridged, raw_extensions)
+    room_2d = _subclass(
+        m.Room2D, properties=_field(m.Room2D, 'properties', room_props))
+    story_props = _properties_class(m.StoryPropertiesAbridged, raw_extensions)
+    story = _subclass(
+        m.Story,
+        room_2ds=_field(m.Story, 'room_2ds', List[room_2d]),
+        properties=_field(m.Story, 'properties', story_props)
+    )
+    bldg_props = _properties_class(m.BuildingPropertiesAbridged, raw_extensions)
+    bldg_fields = dict(
+        unique_stories=_field(m.Building, 'unique_stories', Union[List[story], None]),
+        properties=_field(m.Building, 'properties', bldg_props)
+    )
+    if raw_room_3ds:  # dictionaries from JSON and Rooms once they are validated
+        room_3d = Annotated[Union[dict, m.Room], Field(union_mode='left_to_right')]
+        bldg_fields['room_3ds'] = \
+            _field(m.Building, 'room_3ds', Union[List[room_3d], None])
+    building = _subclass(m.Building, **bldg_fields)
+    shade_props = _properties_class(m.ContextShadePropertiesAbridged, raw_extensions)
+    context_shade = _subclass(
+        m.ContextShade,
+        properties=_field(m.ContextShade, 'properties', shade_props)
+    )
+    model_props = _properties_class(m.ModelProperties, raw_extensions)
+    return _subclass(
+        m.Model,
+        buildings=_field(m.Model, 'buildings', Union[List[building], None]),
+        context_shades=_field(
+            m.Model, 'context_shades', Union[List[context_shade], None]),
+        properties=_field(m.Model, 'properties', model_props)
+    )
+
+
+def model_class(include=None):
+    """Get the Model class that validates only the parts of a Model in include.
+
+    Args:
+        include: An optional list of text for the parts of the Model to be
+            validated. Choose from geometry, room_3ds, energy, radiance, doe2
+            and comparison. The geometry is always validated and any extension
+            that is not included is kept as a raw JSON dictionary. When room_3ds
+            is not included, they are kept as parsed dictionaries until
+            Building.validate_room_3ds is called. If None,
+            the full Model will be validated. (Default: None).
+
+    Returns:
+        A subclass of Model (or Model itself if include is None or includes
+        all parts).
+    """
+    if include is None:
+        return model.Model
+    include = set(include)
+    parts = (GEOMETRY, ROOM_3DS) + EXTENSIONS
+    unknown = include.difference(parts)
+    if unknown:
+        raise ValueError(
+            'Unrecognized Model parts {}. Choose from: {}.'.format(
+                ', '.join(sorted(unknown)), ', '.join(parts))
+        )
+    raw_extensions = tuple(ext for ext in EXTENSIONS if ext not in include)
+    raw_room_3ds = ROOM_3DS not in include
+    if not raw_extensions and not raw_room_3ds:
+        return model.Model
+    return _profile_model(raw_extensions, raw_room_3ds)
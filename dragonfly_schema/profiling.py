@@ -0,0 +1,327 @@
+"""Profile the time spent in each object, field and validator during validation.
+
+Most of the validation of a Model happens in pydantic-core (Rust), which is
+invisible to Python profilers. The ValidationProfile context manager in this
+module instead swaps the validator of each top-level class for one that is
+built from an instrumented copy of its core schema. Within the context, every
+object (eg. Room2D), every non-scalar field (eg. Room2D.window_parameters)
+and every custom validator (eg. Room2D.check_segment_count or the Face3D
+validators of honeybee-schema) records its number of calls, its cumulative
+time and its self time (the cumulative time without the time of the objects,
+fields and validators nested within it).
+
+The results can be printed as a table or exported in the evented format of
+speedscope (https://www.speedscope.app), which shows the nesting of each call
+over time. Note that the instrumentation adds a Python call around each object
+and field, which makes validation several times slower than normal. The
+times are best used to compare the parts of a Model with one another.
+
+The instrumented validators are assigned to the profiled classes for as long as
+any ValidationProfile is open but they only record in the context (eg. the
+thread) where the profile was entered. Validation in any other context runs
+the instrumented validators without recording anything.
+
+Usage:
+
+.. code-block:: python
+
+    from dragonfly_schema.profiling import ValidationProfile
+
+    with ValidationProfile() as profile:
+        Model.model_validate_json(model_json)
+    print(profile.table(limit=20))
+    profile.write_speedscope('validation.speedscope.json')
+"""
+import json
+import time
+import threading
+from contextvars import ContextVar
+from functools import lru_cache
+from typing import NamedTuple
+
+from pydantic_core import SchemaValidator
+
+from . import model
+
+# core schema types of the custom validators
+_FUNCTION_TYPES = (
+    'function-before', 'function-after', 'function-wrap', 'function-plain')
+# core schema types of simple values, which are not worth timing as fields
+_SIMPLE_TYPES = (
+    'any', 'none', 'bool', 'int', 'float', 'str', 'literal', 'enum', 'decimal')
+# keys of core schemas that never hold schemas to be instrumented
+_SKIPPED_KEYS = (
+    'serialization', 'metadata', 'cls', 'config', 'default', 'default_factory',
+    'expected', 'members', 'sub_type', 'function', 'ref', 'schema_ref'
+)
+
+# the profile that is recording in the current context (None if no profile is active)
+_ACTIVE_PROFILE = ContextVar('_ACTIVE_PROFILE', default=None)
+# lock for the validators and completion flags that are changed on the classes
+_CLASS_LOCK = threading.RLock()
+# class to a list with its original validator and the number of profiles using it
+_SWAPPED = {}
+
+
+class FrameStats(NamedTuple):
+    """Timing of an object, field or validator during a validation run."""
+
+    name: str
+    """Text for the name (eg. Room2D, Room2D.window_parameters)."""
+
+    kind: str
+    """Text for the kind of frame. Either model, field or validator."""
+
+    calls: int
+    """Integer for the number of times that it was called."""
+
+    total_time: float
+    """Cumulative time in seconds, including nested frames."""
+
+    self_time: float
+    """Time in seconds excluding the nested frames."""
+
+
+def _timed(frame, function):
+    """Get a version of a validator function that records its time in the profile."""
+    def timed(*args):
+        profile = _ACTIVE_PROFILE.get()
+        if profile is None or (frame[1] == 'field' and not profile._fields):
+            return function(*args)
+        profile._open(frame)
+        try:
+            return function(*args)
+        finally:
+            profile._close(frame)
+    return timed
+
+
+def _call_handler(value, handler):
+    """Wrap validator function that only calls the inner validator."""
+    return handler(value)
+
+
+def _wrap(schema, frame):
+    """Wrap a core schema with a function that times its validation."""
+    return {
+        'type': 'function-wrap', 'schema': schema,
+        'function': {'type': 'no-info', 'function': _timed(frame, _call_handler)}
+    }
+
+
+def _is_simple(schema):
+    """Check whether a core schema is for a simple value."""
+    while schema.get('type') in ('default', 'nullable'):
+        schema = schema['schema']
+    return schema.get('type') in _SIMPLE_TYPES
+
+
+def _instrument(schema, fields, classes):
+    """Get a copy of a core schema where objects and validators record their time.
+
+    Args:
+        schema: A pydantic core schema.
+        fields: Boolean to note whether non-scalar fields should be timed.
+        classes: A set to which the class of each object in the schema is added.
+    """
+    if isinstance(schema, list):
+        return [_instrument(s, fields, classes) for s in schema]
+    if not isinstance(schema, dict):
+        return schema
+    new = {k: v if k in _SKIPPED_KEYS else _instrument(v, fields, classes)
+           for k, v in schema.items()}
+    kind = schema.get('type')
+    if not isinstance(kind, str):  # eg. a dictionary of model fields
+        return new
+    if kind in _FUNCTION_TYPES and callable(schema['function'].get('function')):
+        function = schema['function']['function']
+        name = getattr(function, '__qualname__', repr(function))
+        new['function'] = dict(
+            schema['function'], function=_timed((name, 'validator'), function))
+    elif kind == 'model-fields' and fields:
+        model_name = schema.get('model_name')
+        for f_name, field in new['fields'].items():
+            if field.get('type') != 'model-field' or _is_simple(field['schema']):
+                continue
+            frame = (f'{model_name}.{f_name}', 'field')
+            inner = field['schema']
+            if inner['type'] == 'default':  # defaults must stay around the field
+                inner = dict(inner, schema=_wrap(inner['schema'], frame))
+            else:
+                inner = _wrap(inner, frame)
+            new['fields'][f_name] = dict(field, schema=inner)
+    elif kind == 'model':
+        classes.add(schema['cls'])
+        ref = new.pop('ref', None)
+        new = _wrap(new, (schema['cls'].__name__, 'model'))
+        if ref is not None:  # references must point to the timed object
+            new['ref'] = ref
+    return new
+
+
+@lru_cache(maxsize=None)
+def _instrumented_validator(model_cls, fields):
+    """Get a SchemaValidator of a class that records the time of each part."""
+    classes = set()
+    schema = _instrument(model_cls.__pydantic_core_schema__, fields, classes)
+    # pydantic-core reuses the validators of complete classes for nested objects,
+    # which would skip the instrumented schema of the nested objects, and so the
+    # classes are only marked as incomplete while the validator is built
+    with _CLASS_LOCK:
+        complete = [cls for cls in classes if cls.__dict__.get('__pydantic_complete__')]
+        try:
+            for cls in complete:
+                cls.__pydantic_complete__ = False
+            return SchemaValidator(schema)
+        finally:
+            for cls in complete:
+                cls.__pydantic_complete__ = True
+
+
+class ValidationProfile:
+    """Context manager to record the time of each part of the validation of objects.
+
+    Only validation with the pydantic methods of the profiled classes (eg.
+    Model.model_validate_json or Building.model_validate) in the context where
+    the profile is entered is recorded. The instrumented validators are built
+    the first time that each class is profiled, which can take a few seconds
+    for the Model. Profiles can be open in several threads at once but not
+    nested within one another in the same context.
+
+    Args:
+        classes: An optional list of pydantic classes to be profiled. If None,
+            the Model, Building, Story, Room2D and ContextShade classes will
+            be profiled.
+        fields: Boolean to note whether the time of each field that does not hold
+            a simple value (eg. a number or text) should be recorded. (Default: True).
+    """
+
+    def __init__(self, classes=None, fields=True):
+        model.build_models()
+        if classes is None:
+            classes = (model.Model, model.Building, model.Story, model.Room2D,
+                       model.ContextShade)
+        for cls in classes:  # build the core schema of classes with deferred builds
+            cls.model_rebuild()
+        self._classes = tuple(classes)
+        self._fields = fields
+        self._token = None
+        self._frames = {}  # frame to its index
+        self._stats = []  # [calls, total_ns, self_ns] of each frame
+        self._depths = []  # number of times that each frame is on the stack
+        self._stack = []  # [frame index, start_ns, nested_ns]
+        self._events = []  # (type, frame index, ns since the start)
+        self._start = None
+        self._end = None
+
+    def __enter__(self):
+        if _ACTIVE_PROFILE.get() is not None:
+            raise RuntimeError('Another ValidationProfile is already recording.')
+        validators = [_instrumented_validator(cls, self._fields) for cls in self._classes]
+        with _CLASS_LOCK:
+            for cls, validator in zip(self._classes, validators):
+                if cls not in _SWAPPED:  # the first profile assigns its validator
+                    _SWAPPED[cls] = [cls.__dict__.get('__pydantic_validator__'), 0]
+                    cls.__pydantic_validator__ = validator
+                _SWAPPED[cls][1] += 1
+        self._start = time.perf_counter_ns()
+        self._token = _ACTIVE_PROFILE.set(self)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        _ACTIVE_PROFILE.reset(self._token)
+        self._token = None
+        self._end = time.perf_counter_ns()
+        with _CLASS_LOCK:
+            for cls in self._classes:
+                _SWAPPED[cls][1] -= 1
+                if not _SWAPPED[cls][1]:  # the last profile restores the validator
+                    cls.__pydantic_validator__ = _SWAPPED.pop(cls)[0]
+
+    def _open(self, frame):
+        """Record the start of a frame."""
+        try:
+            index = self._frames[frame]
+        except KeyError:
+            index = self._frames[frame] = len(self._frames)
+            self._stats.append([0, 0, 0])
+            self._depths.append(0)
+        now = time.perf_counter_ns()
+        self._stack.append([index, now, 0])
+        self._depths[index] += 1
+        self._events.append(('O', index, now - self._start))
+
+    def _close(self, frame):
+        """Record the end of the frame at the top of the stack."""
+        now = time.perf_counter_ns()
+        index, start, nested = self._stack.pop()
+        elapsed = now - start
+        stats = self._stats[index]
+        stats[0] += 1
+        self._depths[index] -= 1
+        if not self._depths[index]:  # recursive calls are already in the outer call
+            stats[1] += elapsed
+        stats[2] += elapsed - nested
+        if self._stack:
+            self._stack[-1][2] += elapsed
+        self._events.append(('C', index, now - self._start))
+
+    def results(self):
+        """Get a list of FrameStats for each frame, sorted by their cumulative time."""
+        results = [
+            FrameStats(name, kind, calls, total / 1e9, self_time / 1e9)
+            for (name, kind), (calls, total, self_time)
+            in zip(self._frames, self._stats)
+        ]
+        return sorted(results, key=lambda r: r.total_time, reverse=True)
+
+    def table(self, limit=None, sort_by='total_time'):
+        """Get text for a table of the results.
+
+        Args:
+            limit: An optional integer for the maximum number of rows.
+            sort_by: Text for the column to sort the rows by. Choose from
+                total_time, self_time and calls. (Default: total_time).
+        """
+        results = sorted(
+            self.results(), key=lambda r: getattr(r, sort_by), reverse=True)[:limit]
+        width = max([len(r.name) for r in results] + [4])
+        lines = [f'{"name":{width}}  {"kind":9}  {"calls":>8}  '
+                 f'{"total ms":>10}  {"self ms":>10}']
+        lines.extend(
+            f'{r.name:{width}}  {r.kind:9}  {r.calls:>8}  '
+            f'{r.total_time * 1000:>10.3f}  {r.self_time * 1000:>10.3f}'
+            for r in results)
+        return '\n'.join(lines)
+
+    def speedscope(self, name='dragonfly-schema validation'):
+        """Get a dictionary of the recorded calls in the speedscope file format.
+
+        Args:
+            name: Text for the name of the profile.
+        """
+        end = (self._end or time.perf_counter_ns()) - self._start
+        return {
+            '$schema': 'https://www.speedscope.app/file-format-schema.json',
+            'name': name,
+            'exporter': 'dragonfly-schema',
+            'activeProfileIndex': 0,
+            'shared': {'frames': [
+                {'name': frame_name, 'file': kind} for frame_name, kind in self._frames
+            ]},
+            'profiles': [{
+                'type': 'evented', 'name': name, 'unit': 'nanoseconds',
+                'startValue': 0, 'endValue': end,
+                'events': [{'type': t, 'frame': i, 'at': at} for t, i, at in self._events]
+            }]
+        }
+
+    def write_speedscope(self, path, name='dragonfly-schema validation'):
+        """Write the recorded calls to a speedscope JSON file.
+
+        Args:
+            path: The path to the file, which can be opened at https://www.speedscope.app.
+            name: Text for the name of the profile.
+        """
+        with open(path, 'w') as f:
+            json.dump(self.speedscope(name), f)
@@ -1,5 +1,6 @@
 """Model radiance properties."""
-from pydantic import Field
+from functools import partial
+from pydantic import Field, field_validator
 from typing import List, Union, Literal
 
 from honeybee_schema._base import NoExtraBaseModel
@@ -7,6 +8,9 @@ from honeybee_schema.radiance.modifier import _REFERENCE_UNION_MODIFIERS
 from honeybee_schema.radiance.modifierset import ModifierSet, ModifierSetAbridged
 from honeybee_schema.radiance.global_modifierset import GlobalModifierSet
 
+from ..interning import intern_identifier, shared_default, share_default, \
+    shared_default_schema, validate_shared_default
+from .._construct import register_finalizer
 from .gridpar import RoomGridParameter, RoomRadialGridParameter, \
     ExteriorFaceGridParameter, ExteriorApertureGridParameter
 
@@ -32,6 +36,12 @@ class Room2DRadiancePropertiesAbridged(NoExtraBaseModel):
         'how sensor grids should be generated for the Room2D.'
     )
 
+    @field_validator('modifier_set')
+    @classmethod
+    def intern_identifiers(cls, v):
+        "Intern resource identifiers that are shared across many Room2Ds."
+        return intern_identifier(v)
+
 
 class StoryRadiancePropertiesAbridged(NoExtraBaseModel):
 
@@ -45,6 +55,12 @@ class StoryRadiancePropertiesAbridged(NoExtraBaseModel):
         'assigned here will override those assigned to the parent objects.'
     )
 
+    @field_validator('modifier_set')
+    @classmethod
+    def intern_identifiers(cls, v):
+        "Intern resource identifiers that are shared across many Stories."
+        return intern_identifier(v)
+
 
 class BuildingRadiancePropertiesAbridged(NoExtraBaseModel):
 
@@ -74,11 +90,17 @@ class ModelRadianceProperties(NoExtraBaseModel):
     type: Literal['ModelRadianceProperties'] = 'ModelRadianceProperties'
 
     global_modifier_set: GlobalModifierSet = Field(
-        default=GlobalModifierSet(),
+        default_factory=partial(shared_default, GlobalModifierSet),
         description='Global Radiance modifier set.',
-        json_schema_extra={'readOnly': True}
+        json_schema_extra=partial(shared_default_schema, GlobalModifierSet)
     )
 
+    @field_validator('global_modifier_set', mode='wrap')
+    @classmethod
+    def share_global_modifier_set(cls, v, handler):
+        "Use one shared GlobalModifierSet for all Models with the default one."
+        return validate_shared_default(v, handler, GlobalModifierSet)
+
     modifier_sets: Union[List[Union[ModifierSetAbridged, ModifierSet]], None] = Field(
         default=None,
         description='List of all ModifierSets in the Model.'
@@ -89,3 +111,12 @@ class ModelRadianceProperties(NoExtraBaseModel):
         description='A list of all unique modifiers in the model. This includes '
         'modifiers across all the Model modifier_sets.'
     )
+
+
+def _share_global_set(properties):
+    """Use the shared GlobalModifierSet for properties built without validation."""
+    properties.__dict__['global_modifier_set'] = \
+        share_default(properties.global_modifier_set, GlobalModifierSet)
+
+
+register_finalizer(ModelRadianceProperties, _share_global_set)
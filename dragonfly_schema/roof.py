@@ -3,7 +3,7 @@ from pydantic import Field
 from typing import Union, List, Literal, Annotated
 
 from honeybee_schema._base import NoExtraBaseModel
-from honeybee_schema.model import Face3D, Mesh3D
+from honeybee_schema.geometry import Face3D, Mesh3D
 
 from .clearstory_parameter import DetailedClearstory
 
@@ -0,0 +1,146 @@
+"""Prebuilt cache of the JSON schema of the dragonfly Model.
+
+Generating the JSON schema of the full Model tree is expensive and this cost
+is paid again by every new process that needs it (eg. workers that publish
+or check against the schema). This module writes the schema to a cache file
+once in a build step (eg. while building a worker image) and every process
+then reads this file whenever Model.model_json_schema() is called with its
+default arguments.
+
+The cache is keyed by the versions of dragonfly-schema, honeybee-schema and
+pydantic along with a hash of the contents of the dragonfly_schema source
+files. The key does not depend on file paths or modification times and so a
+cache that is built in an image remains valid when the image is copied. Any
+change to the versions or the sources results in a new cache file rather
+than a stale one.
+
+By default, the cache is written into the installed package. Set the
+DRAGONFLY_SCHEMA_CACHE_DIR environment variable to use another folder
+(eg. when the package folder is read-only).
+
+Usage:
+
+.. code-block:: console
+
+    # run in the build step after the package is installed
+    python -m dragonfly_schema.schema_cache
+
+.. code-block:: python
+
+    from dragonfly_schema.model import Model
+    schema = Model.model_json_schema()  # read from the cache if it was built
+"""
+import os
+import sys
+import json
+import hashlib
+from functools import lru_cache
+from importlib import metadata
+
+from pydantic import VERSION as _pydantic_version
+
+PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__))
+CACHE_DIR = os.path.join(PACKAGE_DIR, '_schema_cache')
+
+
+def _version(distribution):
+    """Get the version of an installed distribution or 'dev' if it is not installed."""
+    try:
+        return metadata.version(distribution)
+    except metadata.PackageNotFoundError:
+        return 'dev'
+
+
+def schema_version():
+    """Get text for the versions of dragonfly-schema and honeybee-schema."""
+    return 'df{}-hb{}'.format(_version('dragonfly-schema'), _version('honeybee-schema'))
+
+
+@lru_cache(maxsize=None)
+def cache_key():
+    """Get text for the key of the cache in the current environment.
+
+    The key is only computed once per process.
+    """
+    content_hash = hashlib.sha256()
+    for root, dirs, files in os.walk(PACKAGE_DIR):
+        dirs.sort()
+        for f_name in sorted(files):
+            if f_name.endswith('.py'):
+                f_path = os.path.join(root, f_name)
+                content_hash.update(os.path.relpath(f_path, PACKAGE_DIR).encode())
+                with open(f_path, 'rb') as f:
+                    content_hash.update(f.read())
+    return '{}-pydantic{}-{}'.format(
+        schema_version(), _pydantic_version, content_hash.hexdigest()[:12])
+
+
+def cache_path(root=None):
+    """Get the path to the JSON schema file of the cache for the current environment.
+
+    Args:
+        root: Optional path to a folder for the cache. If None, the
+            DRAGONFLY_SCHEMA_CACHE_DIR environment variable will be used if it
+            is set. Otherwise, the _schema_cache folder of the package is used.
+    """
+    if root is None:
+        root = os.environ.get('DRAGONFLY_SCHEMA_CACHE_DIR') or CACHE_DIR
+    return os.path.join(root, 'model_json_schema-{}.json'.format(cache_key()))
+
+
+def generate_json_schema():
+    """Generate the JSON schema of the Model without using the cache."""
+    from pydantic.json_schema import model_json_schema
+    from . import model
+    model.build_models()
+    return model_json_schema(model.Model)
+
+
+def build_cache(root=None):
+    """Generate the JSON schema of the Model and write it to the cache.
+
+    This is intended to be run in the build step of an environment (eg. an
+    image of workers) after the package is installed.
+
+    Args:
+        root: Optional path to a folder for the cache. (Default: None).
+
+    Returns:
+        The path to the JSON schema file that was written.
+    """
+    f_path = cache_path(root)
+    os.makedirs(os.path.dirname(f_path), exist_ok=True)
+    # write to a temporary file first so other processes never read a partial file
+    temp_path = f'{f_path}.{os.getpid()}.tmp'
+    with open(temp_path, 'w') as f:
+        json.dump(generate_json_schema(), f)
+    os.replace(temp_path, f_path)
+    _cached_schema.cache_clear()
+    return f_path
+
+
+@lru_cache(maxsize=None)
+def _cached_schema(f_path):
+    """Get the text of the JSON schema in a cache file or None if it does not exist."""
+    try:
+        with open(f_path) as f:
+            return f.read()
+    except OSError:
+        return None
+
+
+def json_schema(root=None):
+    """Get the JSON schema of the dragonfly Model, using the cache when it exists.
+
+    The cache file is only read once per process. If the cache has not been
+    built, the JSON schema is generated without writing anything.
+
+    Args:
+        root: Optional path to a folder for the cache. (Default: None).
+    """
+    schema = _cached_schema(cache_path(root))
+    return generate_json_schema() if schema is None else json.loads(schema)
+
+
+if __name__ == '__main__':
+    print(build_cache(sys.argv[1] if len(sys.argv) > 1 else None))
@@ -0,0 +1,291 @@
+"""Load and validate a single section of a DFJSON file using a JSON pointer.
+
+Services that only need part of a Model (eg. the schedules or the modifiers of
+a resource library) can use the load_section function instead of validating the
+whole Model. The file is read in chunks and everything before the requested
+section is skipped by a tokenizer that only tracks string and bracket
+boundaries. So no Python objects are created for the rest of the document and
+only the requested section is parsed and validated against its type in the
+Model schema.
+
+Usage:
+
+.. code-block:: python
+
+    from dragonfly_schema.section import load_section
+    programs = load_section('model.dfjson', '/properties/energy/program_types')
+"""
+import re
+import json
+import types
+import operator
+import itertools
+import functools
+from typing import Any, Union, Annotated, get_args, get_origin
+
+from pydantic import BaseModel, TypeAdapter
+
+from . import model
+
+CHUNK_SIZE = 1 << 18
+
+_STRUCTURE = re.compile(rb'["\[\]{}]')
+_STRING_END = re.compile(rb'["\\]')
+_SCALAR_END = re.compile(rb'[,\]}\s]')
+_WHITESPACE = b' \t\r\n'
+_NOT_BRACKETS = bytes(c for c in range(256) if c not in b'[]{}')
+_BRACKET_STEPS = bytes.maketrans(b'[]{}', b'\x02\x00\x02\x00')
+_UNION_TYPES = (Union, getattr(types, 'UnionType', Union))  # X | Y in Python 3.10+
+
+
+class _JSONScanner:
+    """Tokenizer that moves through a JSON byte stream without parsing the values.
+
+    Args:
+        stream: A binary file-like object.
+        chunk_size: An integer for the number of bytes read at a time.
+    """
+
+    def __init__(self, stream, chunk_size=CHUNK_SIZE):
+        self._stream = stream
+        self._chunk_size = chunk_size
+        self._buffer = b''
+        self._pos = 0
+        self._captured = None  # list of bytes that have been captured so far
+        self._capture_start = 0
+
+    def _fill(self):
+        """Read the next chunk into the buffer. Return False at the end of the file."""
+        chunk = self._stream.read(self._chunk_size)
+        if not chunk:
+            return False
+        if self._captured is not None:
+            self._captured.append(self._buffer[self._capture_start:self._pos])
+            self._capture_start = 0
+        self._buffer = self._buffer[self._pos:] + chunk
+        self._pos = 0
+        return True
+
+    def _ensure(self, count):
+        """Ensure that the buffer has count bytes after the current position."""
+        while len(self._buffer) - self._pos < count:
+            if not self._fill():
+                raise ValueError('Unexpected end of the JSON document.')
+
+    def next_char(self):
+        """Skip whitespace and get the next character without consuming it."""
+        while True:
+            self._ensure(1)
+            char = self._buffer[self._pos:self._pos + 1]
+            if char not in _WHITESPACE:
+                return char
+            self._pos += 1
+
+    def expect(self, char):
+        """Consume the next character, which must be char."""
+        found = self.next_char()
+        if found != char:
+            raise ValueError('Expected {!r} in JSON document but found {!r}.'.format(
+                char.decode(), found.decode()))
+        self._pos += 1
+
+    def skip_string(self):
+        """Move past a string, starting at its opening quote."""
+        self._pos += 1
+        while True:
+            match = _STRING_END.search(self._buffer, self._pos)
+            if match is None:
+                self._pos = len(self._buffer)
+                self._ensure(1)
+                continue
+            self._pos = match.end()
+            if match.group() == b'"':
+                return
+            self._ensure(1)  # skip the escaped character
+            self._pos += 1
+
+    def skip_value(self):
+        """Move past the next JSON value."""
+        char = self.next_char()
+        if char == b'"':
+            return self.skip_string()
+        if char not in b'[{':
+            while True:
+                match = _SCALAR_END.search(self._buffer, self._pos)
+                if match is not None:
+                    self._pos = match.start()
+                    return
+                self._pos = len(self._buffer)
+                if not self._fill():  # a scalar at the end of the document
+                    return
+        self._pos += 1
+        depth = 1
+        while True:
+            # skip whole chunks where the value cannot end by only counting brackets
+            end = self._chunk_end()
+            if end is not None:
+                outside = b''.join(self._buffer[self._pos:end].split(b'"')[::2])
+                # opening brackets count as 2 and closing ones as 0 such that the
+                # depth after the nth bracket is depth + (running total - n)
+                steps = outside.translate(_BRACKET_STEPS, _NOT_BRACKETS)
+                if not steps or depth + min(map(
+                        operator.sub, itertools.accumulate(steps),
+                        itertools.count(1))) > 0:
+                    depth += sum(steps) - len(steps)
+                    self._pos = end
+                    if not self._fill():
+                        raise ValueError('Unexpected end of the JSON document.')
+                    continue
+            # otherwise move through the chunk one string or bracket at a time
+            while depth:
+                match = _STRUCTURE.search(self._buffer, self._pos)
+                if match is None:
+                    self._pos = len(self._buffer)
+                    break
+                char = match.group()
+                if char == b'"':
+                    self._pos = match.start()
+                    self.skip_string()
+                    continue
+                depth += 1 if char in b'[{' else -1
+                self._pos = match.end()
+            if not depth:
+                return
+            self._ensure(1)
+
+    def _chunk_end(self):
+        """Get the end of the buffer up to which strings can be found by counting quotes.
+
+        This is the end of the buffer or the start of a string that continues into
+        the next chunk. None is returned if the buffer has escaped characters, in
+        which case quotes cannot be counted to find strings.
+        """
+        region = self._buffer[self._pos:]
+        if b'\\' in region:
+            return None
+        if region.count(b'"') % 2:
+            return self._pos + region.rfind(b'"')
+        return len(self._buffer)
+
+    def capture_value(self):
+        """Get the bytes of the next JSON value and move past it."""
+        self.next_char()
+        self._captured, self._capture_start = [], self._pos
+        try:
+            self.skip_value()
+            self._captured.append(self._buffer[self._capture_start:self._pos])
+            return b''.join(self._captured)
+        finally:
+            self._captured = None
+
+    def seek_key(self, key):
+        """Move to the value of a key in the object that starts at the current position.
+        """
+        self.expect(b'{')
+        while True:
+            char = self.next_char()
+            if char == b'}':
+                raise KeyError(key)
+            if char == b',':
+                self._pos += 1
+                continue
+            found = json.loads(self.capture_value())
+            self.expect(b':')
+            if found == key:
+                return
+            self.skip_value()
+
+    def seek_index(self, index):
+        """Move to an item of the array that starts at the current position."""
+        self.expect(b'[')
+        for _ in range(index):
+            if self.next_char() == b']':
+                raise IndexError(index)
+            self.skip_value()
+            self.expect(b',')
+        if self.next_char() == b']':
+            raise IndexError(index)
+
+
+def _pointer_tokens(pointer):
+    """Split a JSON pointer (RFC 6901) into a tuple of reference tokens."""
+    if pointer == '':
+        return ()
+    if not pointer.startswith('/'):
+        raise ValueError(f'JSON pointer "{pointer}" must start with "/".')
+    return tuple(t.replace('~1', '/').replace('~0', '~')
+                 for t in pointer[1:].split('/'))
+
+
+def _options(annotation):
+    """Get the list of types that an annotation may be, without None or Annotated."""
+    origin = get_origin(annotation)
+    if origin is Annotated:
+        return _options(get_args(annotation)[0])
+    if origin in _UNION_TYPES:
+        return [opt for arg in get_args(annotation) for opt in _options(arg)]
+    return [] if annotation is type(None) else [annotation]
+
+
+def _child_type(annotation, token):
+    """Get the type of the item at a reference token within an annotation."""
+    children = []
+    for option in _options(annotation):
+        origin = get_origin(option)
+        if origin is list and token.isdigit():
+            args = get_args(option)
+            children.append(args[0] if args else Any)
+        elif isinstance(option, type) and issubclass(option, BaseModel):
+            field = option.model_fields.get(token)
+            if field is not None:
+                children.append(Annotated[(field.annotation, *field.metadata)]
+                                if field.metadata else field.annotation)
+        elif option is dict or origin is dict or option is Any:
+            children.append(Any)
+    children = list(dict.fromkeys(children))
+    if not children:
+        raise ValueError(f'"{token}" is not a part of the {annotation} schema.')
+    return children[0] if len(children) == 1 else Union[tuple(children)]
+
+
+@functools.lru_cache(maxsize=None)
+def section_adapter(pointer):
+    """Get a pydantic TypeAdapter for the section of a Model at a JSON pointer.
+
+    Args:
+        pointer: Text for a JSON pointer to a section of a Model
+            (eg. "/properties/energy/program_types").
+    """
+    model.build_models()
+    annotation = model.Model
+    for token in _pointer_tokens(pointer):
+        annotation = _child_type(annotation, token)
+    return TypeAdapter(annotation)
+
+
+def load_section(path, pointer):
+    """Load and validate the section of a DFJSON file at a JSON pointer.
+
+    Args:
+        path: Path to a DFJSON file.
+        pointer: Text for a JSON pointer (RFC 6901) to a section of the Model.
+            For example "/properties/energy/program_types" or
+            "/buildings/0/unique_stories".
+
+    Returns:
+        The validated section, which has the type of the section in the Model
+        schema (eg. a list of ProgramTypes).
+    """
+    adapter = section_adapter(pointer)
+    with open(path, 'rb') as f:
+        scanner = _JSONScanner(f)
+        try:
+            for token in _pointer_tokens(pointer):
+                if token.isdigit():
+                    scanner.seek_index(int(token))
+                else:
+                    scanner.seek_key(token)
+        except (KeyError, IndexError):
+            raise ValueError(
+                f'JSON pointer "{pointer}" was not found in "{path}".') from None
+        return adapter.validate_json(scanner.capture_value())
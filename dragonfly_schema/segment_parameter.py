@@ -0,0 +1,132 @@
+"""Compact default-plus-override encodings for per-segment Room2D lists."""
+from pydantic import Field, model_validator
+from typing import List, Union, Literal, Annotated
+
+from honeybee_schema._base import NoExtraBaseModel
+from honeybee_schema.boundarycondition import Ground, Outdoors, Surface, \
+    Adiabatic, OtherSideTemperature
+
+from .window_parameter import SingleWindow, SimpleWindowArea, SimpleWindowRatio, \
+    RepeatingWindowRatio, RectangularWindows, DetailedWindows
+from .shading_parameter import ExtrudedBorder, Overhang, LouversByDistance, \
+    LouversByCount
+
+
+class _CompactSegmentBase(NoExtraBaseModel):
+    """Base class for a default value with sparse overrides at segment indices."""
+
+    indices: List[Annotated[int, Field(ge=0)]] = Field(
+        default=[],
+        description='A list of integers for the indices of the floor segments '
+        'that do not use the default value. The length of this list must match '
+        'the length of the values and each index should be unique.'
+    )
+
+    @model_validator(mode='after')
+    def check_indices_values(self):
+        "Ensure indices and values are aligned and that indices are unique."
+        assert len(self.indices) == len(self.values), 'Length of ' \
+            f'{self.type} indices and values must match. ' \
+            f'{len(self.indices)} != {len(self.values)}'
+        assert len(set(self.indices)) == len(self.indices), \
+            f'{self.type} indices must be unique.'
+        return self
+
+    def expand(self, segment_count):
+        """Get a full list with one item for each floor segment.
+
+        The list is built on each call and nothing is cached on the object. Every
+        item of the default value is the same object.
+
+        Args:
+            segment_count: An integer for the number of segments in the floor
+                of the parent Room2D (including the segments of any floor_holes).
+        """
+        expanded = [self.default] * segment_count
+        for i, val in zip(self.indices, self.values):
+            expanded[i] = val
+        return expanded
+
+
+class CompactBoundaryConditions(_CompactSegmentBase):
+    """Boundary conditions for each floor segment as a default with overrides."""
+
+    type: Literal['CompactBoundaryConditions'] = 'CompactBoundaryConditions'
+
+    default: Union[Ground, Outdoors, Surface, Adiabatic, OtherSideTemperature] = Field(
+        ...,
+        description='The boundary condition used by all floor segments that are '
+        'not included in the indices.'
+    )
+
+    values: List[
+        Union[Ground, Outdoors, Surface, Adiabatic, OtherSideTemperature]
+    ] = Field(
+        default=[],
+        description='A list of boundary conditions that align with the indices and '
+        'override the default value for the corresponding floor segments.'
+    )
+
+
+class CompactWindowParameters(_CompactSegmentBase):
+    """Window parameters for each floor segment as a default with overrides."""
+
+    type: Literal['CompactWindowParameters'] = 'CompactWindowParameters'
+
+    default: Union[
+        None, SingleWindow, SimpleWindowArea, SimpleWindowRatio, RepeatingWindowRatio,
+        RectangularWindows, DetailedWindows
+    ] = Field(
+        default=None,
+        description='The WindowParameter used by all floor segments that are '
+        'not included in the indices. If None, these segments will have no windows.'
+    )
+
+    values: List[Union[
+        None, SingleWindow, SimpleWindowArea, SimpleWindowRatio, RepeatingWindowRatio,
+        RectangularWindows, DetailedWindows
+    ]] = Field(
+        default=[],
+        description='A list of WindowParameters that align with the indices and '
+        'override the default value for the corresponding floor segments.'
+    )
+
+
+class CompactShadingParameters(_CompactSegmentBase):
+    """Shading parameters for each floor segment as a default with overrides."""
+
+    type: Literal['CompactShadingParameters'] = 'CompactShadingParameters'
+
+    default: Union[
+        None, ExtrudedBorder, Overhang, LouversByDistance, LouversByCount
+    ] = Field(
+        default=None,
+        description='The ShadingParameter used by all floor segments that are '
+        'not included in the indices. If None, these segments will have no shades.'
+    )
+
+    values: List[Union[
+        None, ExtrudedBorder, Overhang, LouversByDistance, LouversByCount
+    ]] = Field(
+        default=[],
+        description='A list of ShadingParameters that align with the indices and '
+        'override the default value for the corresponding floor segments.'
+    )
+
+
+class CompactAirBoundaries(_CompactSegmentBase):
+    """Air boundary booleans for each floor segment as a default with overrides."""
+
+    type: Literal['CompactAirBoundaries'] = 'CompactAirBoundaries'
+
+    default: bool = Field(
+        False,
+        description='A boolean for whether the floor segments that are not '
+        'included in the indices have an air boundary type.'
+    )
+
+    values: List[bool] = Field(
+        default=[],
+        description='A list of booleans that align with the indices and '
+        'override the default value for the corresponding floor segments.'
+    )
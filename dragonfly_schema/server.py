@@ -0,0 +1,341 @@
+"""Local HTTP (or Unix socket) server to validate DFJSON with a warm process pool.
+
+Tools that validate a Model on every save pay the cost of starting Python and
+building the schema validators on each call when they run a new process.
+The ValidationServer in this module instead keeps a pool of worker processes
+with the validators already built and validates each request in one of them.
+It only uses the Python standard library (asyncio) and it understands just
+enough HTTP/1.1 for local clients, including keep-alive connections.
+
+Endpoints:
+
+* POST /validate - Validate the request body, which is the JSON of a Model,
+    Building, Story, Room2D or ContextShade. The body can be gzip compressed
+    with a Content-Encoding: gzip header. The response is the report
+    dictionary of batch.validate_data along with the latency of the request.
+* GET /metrics - Get summary metrics of all of the requests to the server.
+* GET /health - Check that the server is running.
+
+Requests with a body larger than the max_size are rejected with a 413 before
+the body is read (and so are gzip bodies that decompress to more than the
+max_size). When the number of requests that are being validated or waiting
+for a worker reaches max_pending, new requests are rejected with a 503 and a
+Retry-After header instead of being queued without limit.
+
+Usage:
+
+.. code-block:: console
+
+    dragonfly-schema serve --port 8080
+    curl --data-binary @model.dfjson http://127.0.0.1:8080/validate
+
+.. code-block:: python
+
+    from dragonfly_schema.server import serve
+    serve(path='/tmp/dragonfly-schema.sock')
+"""
+import os
+import time
+import json
+import zlib
+import asyncio
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from http import HTTPStatus
+
+from .batch import top_level_adapter, validate_data
+
+# default maximum size in bytes of a (decompressed) request body
+MAX_BODY_SIZE = 256 * 1024 * 1024
+# maximum size in bytes of the request line and headers
+MAX_HEADER_SIZE = 64 * 1024
+
+
+def _validate_request(data, gzipped, max_size, memory):
+    """Decompress and validate a request body within a worker process.
+
+    Returns:
+        A tuple with the HTTP status code and the report dictionary.
+    """
+    if gzipped:
+        decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+        try:
+            data = decompressor.decompress(data, max_size + 1)
+        except zlib.error as e:
+            return 400, _error_report(f'Invalid gzip body: {e}')
+        if len(data) > max_size:
+            return 413, _error_report(
+                f'The decompressed body is larger than {max_size} bytes.')
+    return 200, validate_data(data, memory)
+
+
+def _warm_up():
+    """Build the validators of a worker process."""
+    top_level_adapter()
+
+
+def _error_report(message):
+    """Get a report dictionary for a request that could not be validated."""
+    return {'status': 'error', 'errors': [{'path': '', 'message': message}]}
+
+
+class ValidationServer:
+    """Server to validate DFJSON requests in a pool of warm worker processes.
+
+    Args:
+        processes: An integer for the number of worker processes. If None, the
+            number of CPUs will be used. (Default: None).
+        max_size: An integer for the maximum size in bytes of a request body
+            (after it is decompressed). (Default: 256 MB).
+        max_pending: An integer for the maximum number of requests that can be
+            validating or waiting for a worker at once. Any further requests are
+            rejected with a 503. If None, it will be twice the number of
+            processes. (Default: None).
+        memory: Boolean to note whether the peak memory of the validation of
+            each request should be measured. (Default: False).
+    """
+
+    def __init__(self, processes=None, max_size=MAX_BODY_SIZE, max_pending=None,
+                 memory=False):
+        self._processes = processes or os.cpu_count() or 1
+        self._pool = self._new_pool()
+        self.max_size = max_size
+        self.max_pending = max_pending or 2 * self._processes
+        self.memory = memory
+        self._server = None
+        self._pending = 0
+        self._start_time = time.time()
+        self._metrics = {
+            'requests': 0, 'valid': 0, 'invalid': 0, 'error': 0, 'rejected': 0,
+            'parse_time': 0.0, 'max_parse_time': 0.0, 'latency': 0.0,
+            'max_latency': 0.0, 'bytes': 0
+        }
+
+    def _new_pool(self, mp_context=None):
+        """Get a new pool of worker processes."""
+        return ProcessPoolExecutor(
+            max_workers=self._processes, mp_context=mp_context,
+            initializer=top_level_adapter)
+
+    def _restart_pool(self, pool):
+        """Replace a broken pool of worker processes with a new one.
+
+        Args:
+            pool: The pool that is broken, which is only replaced if it has not
+                already been replaced after the failure of another request.
+        """
+        if pool is self._pool:
+            pool.shutdown(wait=False)
+            # this process now runs threads of the broken pool, which makes fork unsafe
+            self._pool = self._new_pool(multiprocessing.get_context('spawn'))
+
+    @property
+    def address(self):
+        """Get the (host, port) or the socket path on which the server is listening."""
+        return self._server.sockets[0].getsockname()
+
+    @property
+    def metrics(self):
+        """Get a dictionary of summary metrics of all of the requests to the server."""
+        metrics = dict(self._metrics)
+        validated = metrics['valid'] + metrics['invalid']
+        metrics['mean_parse_time'] = \
+            round(metrics['parse_time'] / validated, 6) if validated else None
+        metrics['mean_latency'] = \
+            round(metrics['latency'] / validated, 6) if validated else None
+        metrics['pending'] = self._pending
+        metrics['max_pending'] = self.max_pending
+        metrics['processes'] = self._processes
+        metrics['uptime'] = round(time.time() - self._start_time, 3)
+        return metrics
+
+    async def start(self, host='127.0.0.1', port=8080, path=None):
+        """Warm up the worker processes and start listening for requests.
+
+        Args:
+            host: Text for the host on which the server listens. (Default: 127.0.0.1).
+            port: An integer for the port. Use 0 to pick any free port, which
+                can then be found with the address property. (Default: 8080).
+            path: Optional path to a Unix socket. If specified, the server will
+                listen on this socket instead of the host and port.
+        """
+        top_level_adapter()  # build before the workers are forked from this process
+        loop = asyncio.get_running_loop()
+        await asyncio.gather(*(
+            loop.run_in_executor(self._pool, _warm_up)
+            for _ in range(self._processes)))
+        if path is not None:
+            self._server = await asyncio.start_unix_server(
+                self._handle, path=path, limit=MAX_HEADER_SIZE)
+        else:
+            self._server = await asyncio.start_server(
+                self._handle, host, port, limit=MAX_HEADER_SIZE)
+        self._start_time = time.time()
+        return self
+
+    async def serve_forever(self):
+        """Handle requests until the server is closed."""
+        await self._server.serve_forever()
+
+    async def close(self):
+        """Stop listening for requests and shut down the worker processes."""
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+        self._pool.shutdown(wait=False)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    async def _handle(self, reader, writer):
+        """Handle all of the requests of a client connection."""
+        try:
+            while True:
+                try:
+                    head = await reader.readuntil(b'\r\n\r\n')
+                except asyncio.IncompleteReadError:  # the client closed the connection
+                    break
+                except asyncio.LimitOverrunError:
+                    await self._respond(writer, 431, _error_report(
+                        'The request headers are too large.'), close=True)
+                    break
+                try:
+                    method, target, version, headers = _parse_head(head)
+                except ValueError:
+                    await self._respond(
+                        writer, 400, _error_report('Malformed request.'), close=True)
+                    break
+                keep_alive = version == 'HTTP/1.1' and \
+                    headers.get('connection', '').lower() != 'close'
+                status, body, close = await self._route(method, target, headers, reader)
+                close = close or not keep_alive
+                await self._respond(writer, status, body, close=close)
+                if close:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def _route(self, method, target, headers, reader):
+        """Get the status, body and whether to close the connection for a request."""
+        path = target.split('?', 1)[0]
+        if path == '/validate':
+            if method != 'POST':
+                return 405, _error_report('Use POST to validate.'), False
+            return await self._validate(headers, reader)
+        if path in ('/metrics', '/health'):
+            if method != 'GET':
+                return 405, _error_report(f'Use GET for {path}.'), False
+            body = self.metrics if path == '/metrics' else {'status': 'ok'}
+            return 200, body, False
+        return 404, _error_report(f'Unknown path {path}.'), False
+
+    async def _validate(self, headers, reader):
+        """Read and validate the body of a request."""
+        self._metrics['requests'] += 1
+        if 'chunked' in headers.get('transfer-encoding', '').lower() or \
+                'content-length' not in headers:
+            return 411, _error_report('A Content-Length header is required.'), True
+        try:
+            length = int(headers['content-length'])
+        except ValueError:
+            length = -1
+        if length < 0:
+            return 400, _error_report('Invalid Content-Length header.'), True
+        if length > self.max_size:
+            self._metrics['rejected'] += 1
+            return 413, _error_report(
+                f'The body is larger than {self.max_size} bytes.'), True
+        encoding = headers.get('content-encoding', 'identity').lower()
+        if encoding not in ('identity', 'gzip'):
+            return 415, _error_report(f'Unsupported encoding {encoding}.'), True
+        if self._pending >= self.max_pending:
+            self._metrics['rejected'] += 1
+            return 503, _error_report('The server is busy. Try again later.'), True
+
+        self._pending += 1
+        start = time.perf_counter()
+        pool = self._pool
+        try:
+            data = await reader.readexactly(length)
+            status, report = await asyncio.get_running_loop().run_in_executor(
+                pool, _validate_request,
+                data, encoding == 'gzip', self.max_size, self.memory)
+        except BrokenProcessPool:  # a worker died (eg. it ran out of memory)
+            self._restart_pool(pool)
+            status, report = 500, _error_report(
+                'A worker process ended unexpectedly while validating the request.')
+        except Exception as e:  # any other failure of the worker
+            status, report = 500, _error_report(
+                f'The request could not be validated: {type(e).__name__}: {e}')
+        finally:
+            self._pending -= 1
+        latency = time.perf_counter() - start
+        report['latency'] = round(latency, 6)
+
+        metrics = self._metrics
+        if status != 200:
+            metrics['rejected' if status == 413 else 'error'] += 1
+            return status, report, False
+        metrics[report['status']] += 1
+        if report['status'] != 'error':
+            metrics['parse_time'] += report['parse_time']
+            metrics['max_parse_time'] = max(
+                metrics['max_parse_time'], report['parse_time'])
+            metrics['latency'] += latency
+            metrics['max_latency'] = max(metrics['max_latency'], latency)
+            metrics['bytes'] += report['size']
+        return status, report, False
+
+    @staticmethod
+    async def _respond(writer, status, body, close=False):
+        """Write a JSON response to a client."""
+        content = json.dumps(body).encode('utf-8')
+        lines = [
+            f'HTTP/1.1 {status} {HTTPStatus(status).phrase}',
+            'Content-Type: application/json',
+            f'Content-Length: {len(content)}',
+            'Connection: {}'.format('close' if close else 'keep-alive')
+        ]
+        if status == 503:
+            lines.append('Retry-After: 1')
+        writer.write('\r\n'.join(lines).encode('latin-1') + b'\r\n\r\n' + content)
+        await writer.drain()
+
+
+def _parse_head(head):
+    """Get the method, target, HTTP version and headers from the head of a request."""
+    lines = head.decode('latin-1').split('\r\n')
+    method, target, version = lines[0].split(' ')
+    headers = {}
+    for line in lines[1:]:
+        if line:
+            key, value = line.split(':', 1)
+            headers[key.strip().lower()] = value.strip()
+    return method, target, version, headers
+
+
+def serve(host='127.0.0.1', port=8080, path=None, **kwargs):
+    """Run a ValidationServer until the process is interrupted.
+
+    Args:
+        host: Text for the host on which the server listens. (Default: 127.0.0.1).
+        port: An integer for the port. (Default: 8080).
+        path: Optional path to a Unix socket. If specified, the server will
+            listen on this socket instead of the host and port.
+        **kwargs: Any of the arguments of the ValidationServer (eg. processes,
+            max_size, max_pending, memory).
+    """
+    async def run():
+        async with ValidationServer(**kwargs) as server:
+            await server.start(host, port, path)
+            await server.serve_forever()
+    try:
+        asyncio.run(run())
+    except KeyboardInterrupt:
+        pass
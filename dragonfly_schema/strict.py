@@ -0,0 +1,72 @@
+"""Strict validation of Models with additional checks of their geometry.
+
+The schema only checks the structure of each object and so a Model with
+self-intersecting floors or skylights outside of their Room2D floor is
+valid until it fails in translation. Within the strict_validation context
+manager, the validation of every Model also runs these geometry checks and
+fails with a message for each Room2D that does not pass them. The checks
+are fast enough to run on every Model (see the intersection and geometry
+modules) but the skylight check requires NumPy.
+
+Usage:
+
+.. code-block:: python
+
+    from dragonfly_schema.strict import strict_validation
+
+    with strict_validation():
+        model = Model.model_validate_json(model_json)
+"""
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+# a tuple with the settings of the active strict validation (None if inactive)
+_STRICT_SETTINGS = ContextVar('_STRICT_SETTINGS', default=None)
+
+
+@contextmanager
+def strict_validation(tolerance=None, floor_intersections=True, skylights=True):
+    """Context manager to check the geometry of every Model that is validated.
+
+    Args:
+        tolerance: The tolerance of the geometry checks. If None, the tolerance
+            of each Model will be used.
+        floor_intersections: Boolean to note whether Room2D floors with segments
+            that intersect one another should fail validation (see the
+            intersection module). (Default: True).
+        skylights: Boolean to note whether Room2Ds with DetailedSkylights that
+            are outside of their floor should fail validation (see the
+            check_skylight_containment function of the geometry module).
+            This check requires NumPy. (Default: True).
+    """
+    if skylights:  # fail upfront rather than within the validation of a Model
+        from . import geometry  # noqa: F401
+    token = _STRICT_SETTINGS.set((tolerance, floor_intersections, skylights))
+    try:
+        yield
+    finally:
+        _STRICT_SETTINGS.reset(token)
+
+
+def validate_strict(model):
+    """Raise a ValueError if a Model fails the geometry checks of strict validation.
+
+    This is called by the validator of the Model and it does nothing outside
+    of the strict_validation context manager.
+
+    Args:
+        model: A dragonfly Model object.
+    """
+    settings = _STRICT_SETTINGS.get()
+    if settings is None:
+        return
+    tolerance, floor_intersections, skylights = settings
+    errors = []
+    if floor_intersections:
+        from .intersection import check_floor_intersections
+        errors.extend(check_floor_intersections(model, tolerance))
+    if skylights:
+        from .geometry import check_skylight_containment
+        errors.extend(check_skylight_containment(model, tolerance))
+    if errors:
+        raise ValueError(' '.join(error.message for error in errors))
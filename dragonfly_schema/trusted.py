@@ -0,0 +1,144 @@
+"""Write and load DFJSON files that can skip validation when they are unchanged.
+
+Validating a large Model can take longer than parsing its JSON. Files that were
+written by this module carry a signature as the first key of the user_data of
+the Model with the versions of dragonfly-schema and honeybee-schema that wrote them and a
+SHA-256 checksum of their content. When a file is loaded in an environment
+with the same schema versions and its checksum matches, its objects are built
+without validation since they were already validated before they were written.
+Otherwise, the file is fully validated.
+
+Note that the checksum only protects against files that were edited or corrupted
+after they were written. Anyone can write a file with a matching checksum and
+so only files from trusted sources should be loaded with load_trusted.
+
+Usage:
+
+.. code-block:: python
+
+    from dragonfly_schema.trusted import write_trusted, load_trusted
+
+    write_trusted(model, 'model.dfjson')
+    model = load_trusted('model.dfjson')
+"""
+import re
+import json
+import hashlib
+
+from . import model
+from ._construct import construct
+from .schema_cache import schema_version
+
+SIGNATURE_KEY = 'dragonfly_schema_signature'
+_PLACEHOLDER = '0' * 64
+_STRING = rb'"(?:[^"\\]|\\.)*"'
+# the signature is matched only at the start of the Model user_data, which follows
+# the identifier and display_name of the Model and comes before all other objects
+_SIGNATURE_PATTERN = re.compile(
+    rb'\s*\{\s*"identifier":\s*' + _STRING + rb'\s*,'
+    rb'(?:\s*"display_name":\s*(?:null|' + _STRING + rb')\s*,)?'
+    rb'\s*"user_data":\s*\{\s*'
+    rb'"' + SIGNATURE_KEY.encode() + rb'":\s*\{\s*"schema_version":\s*"([^"\\]*)",'
+    rb'\s*"checksum":\s*"([0-9a-f]{64})"\s*\}'
+)
+
+
+def _checksum(data, start, end):
+    """Get the checksum of JSON bytes with the checksum at start:end set to zeros."""
+    data = memoryview(data)
+    digest = hashlib.sha256(data[:start])
+    digest.update(_PLACEHOLDER.encode())
+    digest.update(data[end:])
+    return digest.hexdigest()
+
+
+def dump_trusted_json(dragonfly_model, **kwargs):
+    """Get the JSON text of a Model with a signature that allows it to skip validation.
+
+    Args:
+        dragonfly_model: A dragonfly Model object.
+        **kwargs: Any of the keyword arguments accepted by Model.model_dump_json
+            (eg. indent, exclude_global_sets, minimal). Arguments that exclude
+            the user_data or the identifier of the Model are not accepted.
+    """
+    user_data = {SIGNATURE_KEY: {'schema_version': schema_version(),
+                                 'checksum': _PLACEHOLDER}}
+    user_data.update((key, val) for key, val in (dragonfly_model.user_data or {}).items()
+                     if key != SIGNATURE_KEY)
+    signed = dragonfly_model.model_copy(update={'user_data': user_data})
+    data = signed.model_dump_json(**kwargs).encode('utf-8')
+    match = _SIGNATURE_PATTERN.match(data)
+    if match is None:
+        raise ValueError(
+            'The signature could not be written to the user_data of the Model. '
+            'Make sure that the keyword arguments do not exclude the user_data '
+            'or the identifier of the Model.')
+    start, end = match.span(2)
+    return (data[:start] + _checksum(data, start, end).encode() + data[end:]).decode()
+
+
+def write_trusted(dragonfly_model, path, **kwargs):
+    """Write a Model to a DFJSON file with a signature that allows it to skip validation.
+
+    Args:
+        dragonfly_model: A dragonfly Model object.
+        path: The path to the DFJSON file to be written.
+        **kwargs: Any of the keyword arguments accepted by Model.model_dump_json
+            (eg. indent, exclude_global_sets, minimal).
+    """
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(dump_trusted_json(dragonfly_model, **kwargs))
+
+
+def verify_signature(data):
+    """Check whether the signature of DFJSON data matches its content and this schema.
+
+    Args:
+        data: The bytes (or text) of a DFJSON file.
+
+    Returns:
+        True if the data has a signature with the schema versions of the current
+        environment and a checksum that matches its content. False otherwise.
+    """
+    if isinstance(data, str):
+        data = data.encode('utf-8')
+    match = _SIGNATURE_PATTERN.match(data)
+    if match is None or match.group(1).decode() != schema_version():
+        return False
+    start, end = match.span(2)
+    return _checksum(data, start, end) == match.group(2).decode()
+
+
+def _remove_signature(user_data):
+    """Remove the signature from the user_data of a Model and get what remains."""
+    if isinstance(user_data, dict):
+        user_data.pop(SIGNATURE_KEY, None)
+    return user_data or None
+
+
+def load_trusted(path):
+    """Load a DFJSON file, skipping validation if it has a matching signature.
+
+    Files without a signature (or with one that does not match) are loaded with
+    full validation. The signature is removed from the user_data of the
+    loaded Model.
+
+    Args:
+        path: The path to a DFJSON file.
+
+    Returns:
+        A dragonfly Model object.
+    """
+    model.build_models()
+    with open(path, 'rb') as f:
+        data = f.read()
+    if verify_signature(data):
+        model_dict = json.loads(data)
+        model_dict['user_data'] = _remove_signature(model_dict.get('user_data'))
+        if model_dict['user_data'] is None:
+            del model_dict['user_data']
+        return construct(model.Model, model_dict)
+    dragonfly_model = model.Model.model_validate_json(data)
+    if dragonfly_model.user_data is not None:
+        dragonfly_model.user_data = _remove_signature(dragonfly_model.user_data)
+    return dragonfly_model
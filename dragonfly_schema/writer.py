@@ -0,0 +1,138 @@
+"""Write a dragonfly Model to a file one Building and ContextShade at a time.
+
+Model.model_dump_json needs all of the Buildings of a Model in memory and it
+builds the JSON string of the whole Model before it can be written. The
+ModelWriter in this module instead writes each Building to the file as soon as
+it is added such that the memory used to write a Model is bounded by its
+largest Building. The written JSON is identical to the model_dump_json of the
+Model with the same Buildings and ContextShades.
+
+Usage:
+
+.. code-block:: python
+
+    from dragonfly_schema.writer import ModelWriter
+
+    with ModelWriter('model.dfjson', 'My_Model', properties=properties) as writer:
+        for building in generate_buildings():
+            writer.add_building(building)
+        writer.add_context_shade(shade)
+"""
+import os
+import shutil
+import tempfile
+
+from . import model
+
+# ContextShades are kept in memory up to this size before they are spooled to disk
+SHADE_SPOOL_SIZE = 1 << 20
+
+
+class ModelWriter:
+    """Context manager to stream the Buildings and ContextShades of a Model to a file.
+
+    The fields of the Model other than the buildings and context_shades are
+    validated as soon as the writer is created, which ensures that errors are
+    raised before anything is written. The buildings and context_shades are
+    always written as lists, which are empty if no objects were added.
+
+    Args:
+        file: A path to the file to be written or a text file object. Paths are
+            written through a temporary file in the same folder, which replaces
+            the file at the path only when the writer exits without an error.
+            This means that an error never leaves a partial file at the path.
+        identifier: Text for the identifier of the Model.
+        properties: A ModelProperties object (or a dictionary of one) for the
+            extension properties of the Model.
+        **kwargs: Any of the other fields of the Model (eg. display_name, units,
+            tolerance) except buildings and context_shades.
+    """
+
+    def __init__(self, file, identifier, properties, **kwargs):
+        model.build_models()
+        for field in ('buildings', 'context_shades'):
+            if field in kwargs:
+                raise ValueError(
+                    f'{field} must be added to the ModelWriter one at a time.')
+        self._model = model.Model(
+            identifier=identifier, properties=properties, **kwargs)
+        self._file = file
+        self._temp_path = None
+        self._stream = None
+        self._shades = None
+        self._building_count = 0
+        self._shade_count = 0
+
+    @property
+    def building_count(self):
+        """Get the number of Buildings that have been written."""
+        return self._building_count
+
+    @property
+    def shade_count(self):
+        """Get the number of ContextShades that have been added."""
+        return self._shade_count
+
+    def _json_members(self, fields):
+        """Get the JSON of some fields of the Model without the enclosing braces."""
+        return self._model.model_dump_json(include=set(fields))[1:-1]
+
+    def __enter__(self):
+        if isinstance(self._file, (str, os.PathLike)):
+            self._temp_path = f'{os.fspath(self._file)}.{os.getpid()}.tmp'
+            self._stream = open(self._temp_path, 'w', encoding='utf-8')
+        else:
+            self._stream = self._file
+        self._shades = tempfile.SpooledTemporaryFile(
+            max_size=SHADE_SPOOL_SIZE, mode='w+', encoding='utf-8')
+        fields = list(model.Model.model_fields)
+        header = self._json_members(fields[:fields.index('buildings')])
+        self._stream.write('{' + header + (',' if header else '') + '"buildings":[')
+        return self
+
+    def add_building(self, building):
+        """Write a Building to the file.
+
+        Args:
+            building: A Building object or a dictionary of one, which will be
+                validated before it is written.
+        """
+        building = model.Building.model_validate(building)
+        if self._building_count:
+            self._stream.write(',')
+        self._stream.write(building.model_dump_json())
+        self._building_count += 1
+
+    def add_context_shade(self, context_shade):
+        """Add a ContextShade to be written after all of the Buildings.
+
+        Args:
+            context_shade: A ContextShade object or a dictionary of one, which will
+                be validated before it is added.
+        """
+        context_shade = model.ContextShade.model_validate(context_shade)
+        if self._shade_count:
+            self._shades.write(',')
+        self._shades.write(context_shade.model_dump_json())
+        self._shade_count += 1
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        complete = False
+        try:
+            if exc_type is None:
+                self._stream.write('],"context_shades":[')
+                self._shades.seek(0)
+                shutil.copyfileobj(self._shades, self._stream)
+                fields = list(model.Model.model_fields)
+                footer = self._json_members(fields[fields.index('context_shades') + 1:])
+                self._stream.write(']' + (',' if footer else '') + footer + '}')
+                complete = True
+        finally:
+            self._shades.close()
+            if self._temp_path is not None:
+                self._stream.close()
+                if complete:
+                    os.replace(self._temp_path, self._file)
+                else:
+                    os.remove(self._temp_path)
+                self._temp_path = None
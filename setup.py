@@ -16,8 +16,12 @@ setuptools.setup(
     long_description=long_description,
     long_description_content_type="text/markdown",
     url="https://github.com/ladybug-tools/dragonfly-schema",
-    packages=setuptools.find_packages(exclude=["tests", "scripts", "samples"]),
+    packages=setuptools.find_packages(exclude=["tests", "scripts", "samples", "benchmarks"]),
     install_requires=requirements,
+    extras_require={'cli': ['click>=7.1.2'], 'geometry': ['numpy>=1.17']},
+    entry_points={
+        'console_scripts': ['dragonfly-schema = dragonfly_schema.cli:main']
+    },
     include_package_data=True,
     classifiers=[
         "Programming Language :: Python :: 3.7",
@@ -0,0 +1,86 @@
+from dragonfly_schema.batch import collect_files, validate_files, validate_file, \
+    write_report
+import os
+import io
+import json
+import shutil
+
+# target folder where all of the samples live
+root = os.path.dirname(os.path.dirname(__file__))
+target_folder = os.path.join(root, 'samples')
+
+
+def _sample_folder(folder):
+    """Write a folder with valid and invalid files of several top-level objects."""
+    for sample in ('model_complete_simple.dfjson', 'building_simple.json',
+                   'story_simple.json', 'room2d_simple.json'):
+        shutil.copy(os.path.join(target_folder, sample), str(folder / sample))
+    with open(os.path.join(target_folder, 'model_complete_simple.dfjson')) as f:
+        model_dict = json.load(f)
+    room = model_dict['buildings'][0]['unique_stories'][0]['room_2ds'][0]
+    room['floor_to_ceiling_height'] = 'tall'
+    (folder / 'nested').mkdir()
+    with open(str(folder / 'nested' / 'invalid.dfjson'), 'w') as f:
+        json.dump(model_dict, f)
+    with open(str(folder / 'nested' / 'broken.json'), 'w') as f:
+        f.write('{"type": "Model", ')
+    with open(str(folder / 'nested' / 'notes.txt'), 'w') as f:
+        f.write('not a model')
+
+
+def test_collect_files(tmp_path):
+    _sample_folder(tmp_path)
+    files = collect_files([str(tmp_path)])
+    assert len(files) == 6
+    assert files == sorted(files)
+    assert collect_files([str(tmp_path / '**' / '*.dfjson')]) == [
+        str(tmp_path / 'model_complete_simple.dfjson'),
+        str(tmp_path / 'nested' / 'invalid.dfjson')
+    ]
+    assert collect_files([str(tmp_path / 'nested' / 'notes.txt')]) == \
+        [str(tmp_path / 'nested' / 'notes.txt')]
+
+
+def test_validate_file(tmp_path):
+    _sample_folder(tmp_path)
+    report = validate_file(str(tmp_path / 'story_simple.json'))
+    assert report['type'] == 'Story'
+    assert report['status'] == 'valid'
+    assert report['size'] == os.path.getsize(str(tmp_path / 'story_simple.json'))
+    assert report['parse_time'] > 0
+    assert report['peak_memory'] > 0
+
+    report = validate_file(str(tmp_path / 'nested' / 'invalid.dfjson'), memory=False)
+    assert report['type'] == 'Model'
+    assert report['status'] == 'invalid'
+    assert report['peak_memory'] is None
+    assert report['errors'][0]['path'] == \
+        '/buildings/0/unique_stories/0/room_2ds/0/floor_to_ceiling_height'
+
+    report = validate_file(str(tmp_path / 'nested' / 'broken.json'))
+    assert report['status'] == 'error'
+    report = validate_file(str(tmp_path / 'missing.json'))
+    assert report['status'] == 'error'
+
+
+def test_validate_files(tmp_path):
+    _sample_folder(tmp_path)
+    files = collect_files([str(tmp_path / '**' / '*.*json')])
+    reports = list(validate_files(files, processes=2, memory=False))
+    assert [r['path'] for r in reports] == files
+    assert list(validate_files(files, processes=1, memory=False)) != []
+    types = {os.path.basename(r['path']): r['type'] for r in reports}
+    assert types['building_simple.json'] == 'Building'
+    assert types['room2d_simple.json'] == 'Room2D'
+
+    output = io.StringIO()
+    assert write_report(reports, output) == 2
+    report = json.loads(output.getvalue())
+    assert report['summary']['file_count'] == 6
+    assert report['summary']['invalid_count'] == 2
+
+    output = io.StringIO()
+    assert write_report(reports, output, ndjson=True) == 2
+    lines = output.getvalue().splitlines()
+    assert [json.loads(line)['status'] for line in lines] == \
+        [r['status'] for r in reports]
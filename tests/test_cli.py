@@ -0,0 +1,68 @@
+from click.testing import CliRunner
+from dragonfly_schema import cli
+import os
+import json
+import shutil
+
+# target folder where all of the samples live
+root = os.path.dirname(os.path.dirname(__file__))
+target_folder = os.path.join(root, 'samples')
+
+
+def _sample_files(folder):
+    """Write a valid and an invalid DFJSON file to a folder and get their paths."""
+    valid = str(folder / 'valid.dfjson')
+    shutil.copy(os.path.join(target_folder, 'model_complete_simple.dfjson'), valid)
+    with open(valid) as f:
+        model_dict = json.load(f)
+    model_dict['buildings'][0]['unique_stories'][0]['room_2ds'][0][
+        'floor_to_ceiling_height'] = 'tall'
+    invalid = str(folder / 'invalid.dfjson')
+    with open(invalid, 'w') as f:
+        json.dump(model_dict, f)
+    return valid, invalid
+
+
+def test_validate_ndjson(tmp_path):
+    valid, invalid = _sample_files(tmp_path)
+    runner = CliRunner()
+    result = runner.invoke(cli.main, ['validate', valid, '-p', '1', '--no-memory'])
+    assert result.exit_code == 0
+    reports = [json.loads(line) for line in result.output.splitlines()]
+    assert len(reports) == 1
+    assert reports[0]['status'] == 'valid'
+    assert reports[0]['peak_memory'] is None
+
+    result = runner.invoke(cli.main, ['validate', str(tmp_path), '-p', '1'])
+    assert result.exit_code == 1
+    reports = {r['path']: r for r in map(json.loads, result.output.splitlines())}
+    assert reports[valid]['status'] == 'valid'
+    assert reports[invalid]['status'] == 'invalid'
+
+
+def test_validate_json(tmp_path):
+    valid, invalid = _sample_files(tmp_path)
+    output_file = str(tmp_path / 'report.json')
+    runner = CliRunner()
+    result = runner.invoke(
+        cli.main, ['validate', valid, invalid, '--json', '-p', '1', '-f', output_file])
+    assert result.exit_code == 1
+    with open(output_file) as f:
+        report = json.load(f)
+    assert report['summary']['file_count'] == 2
+    assert report['summary']['invalid_count'] == 1
+
+    result = runner.invoke(cli.main, ['validate', str(tmp_path / '*.missing')])
+    assert result.exit_code == 2
+    assert 'No files were found' in result.output
+
+
+def test_serve(monkeypatch):
+    calls = []
+    monkeypatch.setattr(cli, '_serve', lambda *args, **kwargs: calls.append((args, kwargs)))
+    result = CliRunner().invoke(
+        cli.main, ['serve', '--port', '9000', '-w', '2', '--max-pending', '8'])
+    assert result.exit_code == 0
+    args, kwargs = calls[0]
+    assert args == ('127.0.0.1', 9000, None)
+    assert kwargs['processes'] == 2 and kwargs['max_pending'] == 8
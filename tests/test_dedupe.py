@@ -0,0 +1,106 @@
+from dragonfly_schema.model import Model
+from dragonfly_schema.energy.dedupe import dedupe_energy_resources, content_hash
+import os
+import copy
+import json
+
+# target folder where all of the samples live
+root = os.path.dirname(os.path.dirname(__file__))
+target_folder = os.path.join(root, 'samples')
+
+
+def _renamed(resource, suffix):
+    """Get a copy of a resource dictionary with new identifiers for it and its loads."""
+    new_res = copy.deepcopy(resource)
+    new_res['identifier'] = resource['identifier'] + suffix
+    new_res['display_name'] = 'Copy of {}'.format(resource['identifier'])
+    for value in new_res.values():
+        if isinstance(value, dict) and 'identifier' in value:
+            value['identifier'] = value['identifier'] + suffix
+    return new_res
+
+
+def test_content_hash():
+    file_path = os.path.join(target_folder, 'model_complete_simple.dfjson')
+    with open(file_path) as f:
+        model_dict = json.load(f)
+    schedule = model_dict['properties']['energy']['schedules'][0]
+    assert content_hash(schedule) == content_hash(_renamed(schedule, '_Copy'))
+
+    # day schedules that are referenced differently are not the same content
+    swapped = copy.deepcopy(schedule)
+    if len(swapped['day_schedules']) > 1:
+        day_1, day_2 = swapped['day_schedules'][:2]
+        day_1['identifier'], day_2['identifier'] = \
+            day_2['identifier'], day_1['identifier']
+        assert content_hash(swapped) != content_hash(schedule)
+    swapped['day_schedules'][0]['values'][0] += 0.5
+    assert content_hash(swapped) != content_hash(schedule)
+
+
+def test_dedupe_energy_resources():
+    file_path = os.path.join(target_folder, 'model_complete_simple.dfjson')
+    with open(file_path) as f:
+        model_dict = json.load(f)
+    original = copy.deepcopy(model_dict)
+    model_energy = model_dict['properties']['energy']
+
+    # copy a material and the construction that uses it under new identifiers
+    material = model_energy['materials'][0]
+    construction = next(c for c in model_energy['constructions']
+                        if material['identifier'] in c.get('materials', ()))
+    new_material = _renamed(material, '_Copy')
+    new_construction = _renamed(construction, '_Copy')
+    new_construction['materials'] = [
+        new_material['identifier'] if m == material['identifier'] else m
+        for m in construction['materials']]
+    model_energy['materials'].append(new_material)
+    model_energy['constructions'].append(new_construction)
+    # copy a program type and assign it to a Room2D
+    program = model_energy['program_types'][0]
+    new_program = _renamed(program, '_Copy')
+    model_energy['program_types'].append(new_program)
+    room = model_dict['buildings'][0]['unique_stories'][0]['room_2ds'][0]
+    room['properties']['energy']['program_type'] = new_program['identifier']
+
+    report = dedupe_energy_resources(model_dict)
+    assert report.object_count == 3
+    assert report.removed == {
+        'materials': {new_material['identifier']: material['identifier']},
+        'constructions': {new_construction['identifier']: construction['identifier']},
+        'program_types': {new_program['identifier']: program['identifier']}
+    }
+    assert report.bytes_saved > 0
+    for key in ('materials', 'constructions', 'program_types'):
+        assert model_energy[key] == original['properties']['energy'][key]
+    assert room['properties']['energy']['program_type'] == program['identifier']
+    Model.model_validate(model_dict)
+
+    assert dedupe_energy_resources(model_dict).object_count == 0
+
+
+def test_dedupe_energy_resources_types():
+    file_path = os.path.join(target_folder, 'model_complete_simple.dfjson')
+    with open(file_path) as f:
+        model_dict = json.load(f)
+    model_energy = model_dict['properties']['energy']
+
+    # copy a schedule under the identifier of a program type
+    schedule = model_energy['schedules'][0]
+    program_id = model_energy['program_types'][0]['identifier']
+    new_schedule = _renamed(schedule, '_Copy')
+    new_schedule['identifier'] = program_id
+    model_energy['schedules'].append(new_schedule)
+    rooms = [rm for bldg in model_dict['buildings'] for story in bldg['unique_stories']
+             for rm in story['room_2ds']
+             if rm['properties']['energy'].get('program_type') == program_id]
+    assert rooms
+    # reference the copied schedule from an ideal air system
+    hvac = next(h for h in model_energy['hvacs'] if h['type'] == 'IdealAirSystemAbridged')
+    hvac['heating_availability'] = program_id
+
+    report = dedupe_energy_resources(model_dict)
+    assert report.removed == {'schedules': {program_id: schedule['identifier']}}
+    assert all(rm['properties']['energy']['program_type'] == program_id for rm in rooms)
+    assert hvac['heating_availability'] == schedule['identifier']
+    Model.model_validate(model_dict)
@@ -0,0 +1,169 @@
+from dragonfly_schema.model import Model, Story
+from dragonfly_schema.geometry import check_floor_polygons, check_skylight_containment, \
+    DUPLICATE_VERTICES_CODE, COLINEAR_VERTICES_CODE, CLOCKWISE_FLOOR_CODE, \
+    DEGENERATE_FLOOR_CODE, SKYLIGHT_OUTSIDE_FLOOR_CODE
+from dragonfly_schema.strict import strict_validation
+import os
+import json
+
+import pytest
+from pydantic import ValidationError
+
+# target folder where all of the samples live
+root = os.path.dirname(os.path.dirname(__file__))
+target_folder = os.path.join(root, 'samples')
+
+OUTDOORS = {'type': 'Outdoors'}
+GROUND = {'type': 'Ground'}
+
+
+def _story(floor_boundary, **room_attributes):
+    """Get a Story with a single Room2D of a given floor_boundary."""
+    with open(os.path.join(target_folder, 'story_simple.json')) as f:
+        story_dict = json.load(f)
+    room_dict = story_dict['room_2ds'][0]
+    for attr in ('boundary_conditions', 'window_parameters', 'shading_parameters'):
+        room_dict.pop(attr, None)
+    room_dict['floor_boundary'] = floor_boundary
+    room_dict.update(room_attributes)
+    story_dict['room_2ds'] = [room_dict]
+    return Story.model_validate(story_dict)
+
+
+def test_check_floor_polygons_samples():
+    for name in ('model_multiple_buildings.dfjson', 'model_with_doors_skylights.dfjson'):
+        model = Model.load(os.path.join(target_folder, name))
+        assert check_floor_polygons(model) == []
+
+
+def test_check_floor_polygons_clean():
+    # a clockwise square with a colinear vertex and a duplicate vertex
+    floor = [[0, 0], [0, 10], [5, 10], [10, 10], [10, 0], [10, 0.001]]
+    rect_windows = {'type': 'RectangularWindows', 'origins': [[1, 0.5]],
+                    'widths': [2], 'heights': [1]}
+    ratio_windows = {'type': 'SimpleWindowRatio', 'window_ratio': 0.4}
+    story = _story(
+        floor,
+        boundary_conditions={'type': 'CompactBoundaryConditions', 'default': OUTDOORS,
+                             'indices': [1, 2, 4, 5], 'values': [GROUND] * 4},
+        window_parameters=[rect_windows, None, None, ratio_windows, None, None]
+    )
+    room = story.room_2ds[0]
+
+    errors = check_floor_polygons(story)
+    codes = {e.code: e for e in errors}
+    assert set(codes) == \
+        {DUPLICATE_VERTICES_CODE, COLINEAR_VERTICES_CODE, CLOCKWISE_FLOOR_CODE}
+    assert 'segments [4]' in codes[DUPLICATE_VERTICES_CODE].message
+    assert 'segments [2]' in codes[COLINEAR_VERTICES_CODE].message
+    assert codes[COLINEAR_VERTICES_CODE].helper_geometry[0].x == 5
+    assert codes[COLINEAR_VERTICES_CODE].parents[0][0].id == story.identifier
+    assert room.floor_boundary == floor  # the room is only changed with clean
+
+    assert check_floor_polygons(story, clean=True) == []
+    assert check_floor_polygons(story) == []
+    assert room.floor_boundary == [[0, 0], [10, 0.001], [10, 10], [0, 10]]
+    assert room.boundary_conditions.type == 'CompactBoundaryConditions'
+    assert room.boundary_conditions.indices == [0, 2]
+    win_pars = room.window_parameters
+    assert win_pars[0] is None and win_pars[2] is None
+    assert win_pars[1].type == 'SimpleWindowRatio'
+    assert win_pars[3].origins == [[7, 0.5]]  # mirrored on the reversed segment
+    Story.model_validate(story.model_dump())
+
+
+def test_check_floor_polygons_properties():
+    # colinear vertices between segments with different properties are kept
+    floor = [[0, 0], [5, 0], [10, 0], [10, 10], [0, 10]]
+    story = _story(floor, boundary_conditions=[OUTDOORS, GROUND, OUTDOORS, OUTDOORS,
+                                               OUTDOORS])
+    assert check_floor_polygons(story, clean=True) == []
+    assert story.room_2ds[0].floor_boundary == floor
+
+
+def _surface(room_id, face_i):
+    """Get a Surface boundary condition for a face of a Room2D."""
+    return {'type': 'Surface',
+            'boundary_condition_objects': ['{}..Face{}'.format(room_id, face_i), room_id]}
+
+
+def test_check_floor_polygons_clean_surfaces():
+    # a clockwise room with a duplicate vertex that shares a wall with another room
+    floor_a = [[0, 0], [0, 10], [10, 10], [10, 10], [10, 0]]
+    floor_b = [[10, 0], [20, 0], [20, 10], [10, 10]]
+    story = _story(floor_a)
+    story_dict = story.model_dump()
+    room_a, room_b = story_dict['room_2ds'][0], dict(story_dict['room_2ds'][0])
+    room_b['identifier'], room_b['floor_boundary'] = 'Room_B', floor_b
+    room_a['boundary_conditions'] = [OUTDOORS] * 3 + [_surface('Room_B', 4), OUTDOORS]
+    room_b['boundary_conditions'] = [OUTDOORS] * 3 + [_surface(room_a['identifier'], 4)]
+    story_dict['room_2ds'] = [room_a, room_b]
+    story = Story.model_validate(story_dict)
+
+    assert check_floor_polygons(story, clean=True) == []
+    room_a, room_b = story.room_2ds
+    assert room_a.floor_boundary == [[0, 0], [10, 0], [10, 10], [0, 10]]
+    assert room_a.boundary_conditions[1].boundary_condition_objects == \
+        ['Room_B..Face4', 'Room_B']
+    assert room_b.boundary_conditions[3].boundary_condition_objects == \
+        ['{}..Face2'.format(room_a.identifier), room_a.identifier]
+
+    # rooms are not cleaned when a removed segment is referenced by another room
+    story_dict['room_2ds'][1]['boundary_conditions'] = \
+        [OUTDOORS] * 3 + [_surface(room_a.identifier, 3)]
+    story = Story.model_validate(story_dict)
+    errors = check_floor_polygons(story, clean=True)
+    assert {e.code for e in errors} == {DUPLICATE_VERTICES_CODE, CLOCKWISE_FLOOR_CODE}
+    assert story.room_2ds[0].floor_boundary == floor_a
+
+
+def test_check_floor_polygons_degenerate():
+    floor = [[0, 0], [10, 0], [10, 0.001]]
+    story = _story(floor)
+    codes = {e.code for e in check_floor_polygons(story)}
+    assert DUPLICATE_VERTICES_CODE in codes
+    # the degenerate floor is not changed and all of its issues are reported
+    errors = check_floor_polygons(story, clean=True)
+    assert {e.code for e in errors} == codes | {DEGENERATE_FLOOR_CODE}
+    assert story.room_2ds[0].floor_boundary == floor
+
+
+def test_check_skylight_containment():
+    file_path = os.path.join(target_folder, 'model_with_doors_skylights.dfjson')
+    with open(file_path) as f:
+        model_dict = json.load(f)
+    assert check_skylight_containment(Model.model_validate(model_dict)) == []
+    with strict_validation():
+        Model.model_validate(model_dict)
+
+    room = next(rm for bldg in model_dict['buildings'] for story in bldg['unique_stories']
+                for rm in story['room_2ds'] if rm.get('skylight_parameters'))
+    polygon = room['skylight_parameters']['polygons'][0]
+    polygon[0] = [polygon[0][0] + 1000, polygon[0][1]]
+    model = Model.model_validate(model_dict)
+    errors = check_skylight_containment(model)
+    assert len(errors) == 1
+    assert errors[0].code == SKYLIGHT_OUTSIDE_FLOOR_CODE
+    assert errors[0].element_id == [room['identifier']]
+    assert errors[0].helper_geometry[0].x == polygon[0][0]
+    with strict_validation():
+        with pytest.raises(ValidationError, match='outside of its floor'):
+            Model.model_validate(model_dict)
+    with strict_validation(skylights=False):
+        Model.model_validate(model_dict)
+
+
+def test_check_skylight_containment_holes():
+    floor = [[0, 0], [10, 0], [10, 10], [0, 10]]
+    hole = [[4, 4], [4, 6], [6, 6], [6, 4]]
+    on_edge = [[0, 0], [2, 0], [2, 2]]
+    in_hole = [[4.5, 4.5], [5.5, 4.5], [5.5, 5.5]]
+    skylights = {'type': 'DetailedSkylights', 'polygons': [on_edge, in_hole]}
+    story = _story(floor, floor_holes=[hole], skylight_parameters=skylights)
+    errors = check_skylight_containment(story)
+    assert len(errors) == 1
+    assert 'polygons [1]' in errors[0].message
+    assert len(errors[0].helper_geometry) == 3
+    skylights['polygons'] = [on_edge]
+    story = _story(floor, floor_holes=[hole], skylight_parameters=skylights)
+    assert check_skylight_containment(story) == []
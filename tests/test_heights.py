@@ -0,0 +1,48 @@
+from dragonfly_schema.model import Building, Model
+from dragonfly_schema.heights import resolve_story_heights, check_overlapping_stories
+from honeybee_schema.altnumber import Autocalculate
+import os
+
+# target folder where all of the samples live
+root = os.path.dirname(os.path.dirname(__file__))
+target_folder = os.path.join(root, 'samples')
+
+
+def test_resolve_story_heights_model():
+    file_path = os.path.join(target_folder, 'model_multiple_buildings.dfjson')
+    with open(file_path, 'r') as f:
+        model = Model.model_validate_json(f.read())
+    with open(file_path, 'r') as f:
+        other_model = Model.model_validate_json(f.read())
+    heights = resolve_story_heights(model)
+    assert check_overlapping_stories(model, heights=heights) == []
+    for bldg in model.buildings:
+        for story in bldg.unique_stories:
+            flr_hgt, ftf_hgt = heights[story.identifier]
+            assert isinstance(flr_hgt, float)
+            assert isinstance(ftf_hgt, float)
+    assert model == other_model  # resolving the heights does not change the Model
+
+
+def test_resolve_story_heights_autocalculate():
+    file_path = os.path.join(target_folder, 'building_simple.json')
+    with open(file_path, 'r') as f:
+        building = Building.model_validate_json(f.read())
+    story = building.unique_stories[0]
+    story.floor_height = story.floor_to_floor_height = Autocalculate()
+    flr_hgt, ftf_hgt = story.resolve_heights()
+    assert flr_hgt == min(rm.floor_height for rm in story.room_2ds)
+    assert ftf_hgt == max(rm.floor_to_ceiling_height for rm in story.room_2ds)
+
+
+def test_resolve_story_heights_overlapping():
+    file_path = os.path.join(target_folder, 'building_simple.json')
+    with open(file_path, 'r') as f:
+        building = Building.model_validate_json(f.read())
+    assert check_overlapping_stories(building) == []
+    stories = building.unique_stories
+    stories[-1].floor_height = stories[0].floor_height
+    errors = check_overlapping_stories(building)
+    assert len(errors) == 1
+    assert errors[0].element_type == 'Story'
+    assert stories[-1].identifier in errors[0].element_id
@@ -0,0 +1,108 @@
+from dragonfly_schema.model import Model
+from dragonfly_schema.intersection import check_floor_intersections, \
+    segment_intersections, segments_intersect, validate_floor_intersections, \
+    SELF_INTERSECTING_FLOOR_CODE
+import os
+import json
+import math
+import random
+
+import pytest
+from pydantic import ValidationError
+
+# target folder where all of the samples live
+root = os.path.dirname(os.path.dirname(__file__))
+target_folder = os.path.join(root, 'samples')
+
+
+def test_segment_intersections():
+    square = [[0, 0], [10, 0], [10, 10], [0, 10]]
+    assert segment_intersections([square]) == []
+    bowtie = [[0, 0], [10, 10], [10, 0], [0, 10]]
+    assert segment_intersections([bowtie]) == [(0, 2)]
+    # a hole that touches the boundary and one that crosses the other hole
+    hole_1 = [[2, 0], [4, 2], [6, 2]]
+    hole_2 = [[5, 1], [8, 1], [8, 8], [5, 8]]
+    assert segment_intersections([square, hole_1]) == [(0, 4), (0, 6)]
+    assert segment_intersections([square, hole_1, hole_2]) == \
+        [(0, 4), (0, 6), (5, 10), (6, 10)]
+    # segments that are within the tolerance of one another are touching
+    sliver = [[0, 0], [10, 0], [10, 0.005], [5, 0.001], [0, 0.005]]
+    assert segment_intersections([sliver], 0.01) == [(0, 2), (0, 3)]
+    assert segment_intersections([sliver], 0.0001) == []
+    # segments that are only separated by duplicate vertices are adjacent
+    duplicates = [[0, 0], [10, 0], [10, 0], [10, 0.005], [10, 10], [0, 10], [0, 0.001]]
+    assert segment_intersections([duplicates]) == []
+    assert segment_intersections([duplicates], 0.0001) == []
+    fold = [[0, 0], [10, 0], [10, 0], [4, 0.001], [4, 5], [0, 5]]
+    assert segment_intersections([fold]) == [(0, 2), (0, 3)]
+
+
+def test_segment_intersections_large():
+    count = 5000
+    angles = [2 * math.pi * i / count for i in range(count)]
+    ring = [[100 * math.cos(a), 100 * math.sin(a)] for a in angles]
+    assert segment_intersections([ring]) == []
+    ring[10] = [-150, 0]  # makes segments 9 and 10 cross the other side of the circle
+    intersections = segment_intersections([ring])
+    assert len(intersections) >= 2
+    assert {i for i, _ in intersections} == {9, 10}
+    assert all(abs(j - count / 2) < 10 for _, j in intersections)
+
+
+def test_segment_intersections_comb():
+    # long teeth that are all active in the sweep at once
+    count = 2000
+    ring = []
+    for k in range(count):
+        ring.extend([[1, 2 * k], [1000, 2 * k], [1000, 2 * k + 1], [1, 2 * k + 1]])
+    ring.extend([[0, 2 * count - 1], [0, 0]])
+    assert len(ring) > 8000
+    assert segment_intersections([ring]) == []
+    ring[4 * 1000 + 1] = [1000, 2 * 1000 + 2.5]  # the tip of a tooth in the next one
+    intersections = segment_intersections([ring])
+    assert intersections and all(4 * 1000 <= i <= 4 * 1000 + 1 for i, _ in intersections)
+
+
+def test_segment_intersections_all_pairs():
+    # random rings are checked against a test of every pair of segments
+    rand = random.Random(0)
+    for _ in range(20):
+        rings = [[[rand.uniform(0, 10), rand.uniform(0, 10)] for _ in range(8)]
+                 for _ in range(3)]
+        segs, starts = [], []
+        for ring in rings:
+            for i, pt in enumerate(ring):
+                segs.append((pt, ring[(i + 1) % len(ring)]))
+                starts.append(len(segs) - 1 - i)
+        expected = [
+            (i, j) for i in range(len(segs)) for j in range(i + 1, len(segs))
+            if not (starts[i] == starts[j] and
+                    (j - i == 1 or (i == starts[i] and j == starts[i] + 7)))
+            and segments_intersect(*segs[i], *segs[j], 0.01)
+        ]
+        assert segment_intersections(rings) == expected
+
+
+def test_check_floor_intersections():
+    file_path = os.path.join(target_folder, 'model_with_doors_skylights.dfjson')
+    with open(file_path) as f:
+        model_dict = json.load(f)
+    model = Model.model_validate(model_dict)
+    assert check_floor_intersections(model) == []
+
+    room = model_dict['buildings'][0]['unique_stories'][0]['room_2ds'][0]
+    room['floor_boundary'][0], room['floor_boundary'][1] = \
+        room['floor_boundary'][1], room['floor_boundary'][0]
+    model = Model.model_validate(model_dict)
+    errors = check_floor_intersections(model)
+    assert len(errors) == 1
+    assert errors[0].code == SELF_INTERSECTING_FLOOR_CODE
+    assert errors[0].element_id == [room['identifier']]
+    assert errors[0].parents[0][-1].parent_type == 'Building'
+
+    with validate_floor_intersections():
+        with pytest.raises(ValidationError, match='self-intersecting floor'):
+            Model.model_validate(model_dict)
+        assert len(check_floor_intersections(model)) == 1
+    Model.model_validate(model_dict)  # the check is only active in the context
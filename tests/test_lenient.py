@@ -0,0 +1,75 @@
+from dragonfly_schema.model import Model
+from dragonfly_schema.lenient import validate_lenient, load_lenient, \
+    INVALID_OBJECT_CODE
+from dragonfly_schema.strict import strict_validation
+import os
+import json
+
+# target folder where all of the samples live
+root = os.path.dirname(os.path.dirname(__file__))
+target_folder = os.path.join(root, 'samples')
+
+
+def test_load_lenient_valid():
+    file_path = os.path.join(target_folder, 'model_multiple_buildings.dfjson')
+    result = load_lenient(file_path)
+    assert result.valid
+    assert result.errors == {} and result.quarantined == {}
+    assert result.model == Model.load(file_path)
+
+
+def test_validate_lenient_quarantine():
+    file_path = os.path.join(target_folder, 'model_multiple_buildings.dfjson')
+    with open(file_path) as f:
+        model_dict = json.load(f)
+    bldg_count = len(model_dict['buildings'])
+    room = model_dict['buildings'][0]['unique_stories'][0]['room_2ds'][0]
+    room['boundary_conditions'] = room['boundary_conditions'][:-1]
+    model_dict['buildings'][2]['unique_stories'][0]['room_2ds'][1].pop('floor_boundary')
+    bad_ids = [model_dict['buildings'][i]['identifier'] for i in (0, 2)]
+
+    result = validate_lenient(json.dumps(model_dict))
+    assert not result.valid
+    assert result.fatal_error == ''
+    assert list(result.quarantined) == ['/buildings/0', '/buildings/2']
+    assert result.quarantined['/buildings/0'] == model_dict['buildings'][0]
+    assert len(result.model.buildings) == bldg_count - 2
+    assert not any(b.identifier in bad_ids for b in result.model.buildings)
+
+    seg_pointer = '/buildings/0/unique_stories/0/room_2ds/0'
+    flr_pointer = '/buildings/2/unique_stories/0/room_2ds/1/floor_boundary'
+    assert list(result.errors) == [seg_pointer, flr_pointer]
+    seg_error = result.errors[seg_pointer]
+    assert seg_error.code == INVALID_OBJECT_CODE
+    assert seg_error.element_type == 'Room2D'
+    assert seg_error.element_id == [room['identifier']]
+    assert [p.parent_type for p in seg_error.parents[0]] == ['Story', 'Building']
+    assert seg_error.parents[0][1].id == bad_ids[0]
+    assert 'boundary_conditions' in seg_error.message
+    assert result.errors[flr_pointer].message.startswith(flr_pointer)
+
+    # errors outside of the buildings cannot be quarantined
+    model_dict['tolerance'] = -1
+    result = validate_lenient(model_dict)
+    assert result.model is None
+    assert len(result.errors) == 2
+    assert result.fatal_error.startswith('/tolerance')
+
+
+def test_validate_lenient_model_checks():
+    file_path = os.path.join(target_folder, 'model_multiple_buildings.dfjson')
+    with open(file_path) as f:
+        model_dict = json.load(f)
+    model_dict['buildings'][0]['unique_stories'][0]['room_2ds'][0].pop('floor_boundary')
+    # a self-intersecting floor in a Building that is kept
+    room = model_dict['buildings'][1]['unique_stories'][0]['room_2ds'][0]
+    floor = room['floor_boundary']
+    floor[0], floor[1] = floor[1], floor[0]
+
+    assert validate_lenient(model_dict).model is not None
+    with strict_validation(skylights=False):
+        result = validate_lenient(model_dict)
+    assert result.model is None
+    assert list(result.quarantined) == ['/buildings/0']
+    assert len(result.errors) == 1
+    assert 'self-intersecting floor' in result.fatal_error
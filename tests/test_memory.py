@@ -0,0 +1,44 @@
+from dragonfly_schema.model import Model
+from dragonfly_schema.memory import memory_report
+import os
+
+# target folder where all of the samples live
+root = os.path.dirname(os.path.dirname(__file__))
+target_folder = os.path.join(root, 'samples')
+
+
+def test_memory_report():
+    file_path = os.path.join(target_folder, 'model_with_doors_skylights.dfjson')
+    model = Model.load(file_path)
+    report = memory_report(model)
+
+    assert report.total > 0
+    assert sum(report.fields.values()) == report.total
+    assert sum(report.categories.values()) == report.total
+    for category in ('coordinates', 'parameters', 'user_data', 'identifiers'):
+        assert report.categories[category] > 0
+    assert 'Room2D.floor_boundary' in report.fields
+    assert list(report.fields.values()) == sorted(report.fields.values(), reverse=True)
+
+    assert set(report.buildings) == {bldg.identifier for bldg in model.buildings}
+    assert sum(report.buildings.values()) < report.total
+    bldg = model.buildings[0]
+    story_keys = ['{}/{}'.format(bldg.identifier, s.identifier)
+                  for s in bldg.unique_stories]
+    assert set(story_keys) == set(report.stories)
+    assert sum(report.stories.values()) < report.buildings[bldg.identifier]
+    assert report.resources['energy.schedules'] > 0
+    assert 'radiance.modifiers' in report.resources
+    assert 'Room2D.floor_boundary' in report.table(limit=100)
+
+    # the report is the same every time and does not count shared objects twice
+    assert memory_report(model) == report
+
+
+def test_memory_report_unvalidated_extensions():
+    file_path = os.path.join(target_folder, 'model_multiple_buildings.dfjson')
+    full_report = memory_report(Model.load(file_path))
+    report = memory_report(Model.load(file_path, include=('geometry',)))
+    assert len(report.buildings) == len(full_report.buildings) == 13
+    assert not report.resources
+    assert report.total > 0
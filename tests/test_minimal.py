@@ -0,0 +1,46 @@
+from dragonfly_schema import model, window_parameter, shading_parameter
+from dragonfly_schema.minimal import minimal_dict
+import os
+import json
+
+# target folder where all of the samples live
+root = os.path.dirname(os.path.dirname(__file__))
+target_folder = os.path.join(root, 'samples')
+
+
+def _classes():
+    """Get a dictionary of the classes of the samples by their type."""
+    model.build_models()
+    classes = {}
+    for module in (model, window_parameter, shading_parameter):
+        for name, cls in vars(module).items():
+            if isinstance(cls, type) and hasattr(cls, 'model_fields'):
+                classes[name] = cls
+    return classes
+
+
+def test_minimal_round_trip():
+    classes = _classes()
+    for f_name in sorted(os.listdir(target_folder)):
+        with open(os.path.join(target_folder, f_name)) as f:
+            sample_json = f.read()
+        cls = classes[json.loads(sample_json)['type']]
+        obj = cls.model_validate_json(sample_json)
+        full_json = obj.model_dump_json()
+        minimal_json = json.dumps(minimal_dict(obj), separators=(',', ':'))
+        assert len(minimal_json) <= len(full_json), f_name
+        new_obj = cls.model_validate_json(minimal_json)
+        assert new_obj == obj, f_name
+        assert new_obj.model_dump_json() == full_json, f_name
+
+
+def test_model_dump_json_minimal():
+    file_path = os.path.join(target_folder, 'model_complete_simple.dfjson')
+    dfmodel = model.Model.load(file_path)
+    minimal_json = dfmodel.model_dump_json(minimal=True)
+    assert len(minimal_json) < len(dfmodel.model_dump_json()) / 2
+    room = json.loads(minimal_json)['buildings'][0]['unique_stories'][0]['room_2ds'][0]
+    assert room['type'] == 'Room2D'
+    assert 'has_floor' not in room and 'ceiling_plenum_depth' not in room
+    assert room['properties']['type'] == 'Room2DPropertiesAbridged'
+    assert model.Model.model_validate_json(minimal_json) == dfmodel
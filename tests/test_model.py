@@ -1,5 +1,12 @@
 from dragonfly_schema.model import Room2D, Story, Building, ContextShade, Model
+from dragonfly_schema.interning import intern_parameters, thaw
+from dragonfly_schema.radiance.properties import ModelRadianceProperties
 import os
+import json
+import pickle
+
+import pytest
+from pydantic import ValidationError
 
 # target folder where all of the samples live
 root = os.path.dirname(os.path.dirname(__file__))
@@ -46,3 +53,224 @@ def test_model_with_doors_skylights_and_roof():
     file_path = os.path.join(target_folder, 'model_with_doors_skylights.dfjson')
     with open(file_path, 'r') as f:
         Model.model_validate_json(f.read())
+
+
+def test_model_intern_parameters():
+    file_path = os.path.join(target_folder, 'model_multiple_buildings.dfjson')
+    with open(file_path, 'r') as f:
+        model_json = f.read()
+    with intern_parameters() as interned:
+        model = Model.model_validate_json(model_json)
+    assert len(interned) > 0
+    win_pars = [
+        win_par for bldg in model.buildings for story in bldg.unique_stories
+        for room in story.room_2ds for win_par in room.window_parameters or ()
+        if win_par is not None
+    ]
+    assert len(set(id(w) for w in win_pars)) < len(win_pars)
+    assert len(set(id(w) for w in win_pars)) == \
+        len(set(w.model_dump_json() for w in win_pars))
+
+    # check that nothing is shared outside of the context
+    model = Model.model_validate_json(model_json)
+    win_pars = [
+        win_par for bldg in model.buildings for story in bldg.unique_stories
+        for room in story.room_2ds for win_par in room.window_parameters or ()
+        if win_par is not None
+    ]
+    assert len(set(id(w) for w in win_pars)) == len(win_pars)
+
+
+def test_model_interned_identifiers():
+    file_path = os.path.join(target_folder, 'model_multiple_buildings.dfjson')
+    with open(file_path, 'r') as f:
+        model = Model.model_validate_json(f.read())
+    programs = [
+        room.properties.energy.program_type for bldg in model.buildings
+        for story in bldg.unique_stories for room in story.room_2ds
+        if room.properties.energy.program_type is not None
+    ]
+    assert len(set(id(p) for p in programs)) == len(set(programs))
+
+
+def _assert_close(original, rounded, max_diff):
+    """Assert that all numbers in two nested structures differ by less than max_diff."""
+    if isinstance(original, dict):
+        assert original.keys() == rounded.keys()
+        for key in original:
+            _assert_close(original[key], rounded[key], max_diff)
+    elif isinstance(original, list):
+        assert len(original) == len(rounded)
+        for orig, rnd in zip(original, rounded):
+            _assert_close(orig, rnd, max_diff)
+    elif isinstance(original, float):
+        assert abs(original - rounded) <= max_diff
+    else:
+        assert original == rounded
+
+
+def test_model_dump_json_round_coordinates():
+    for sample in ('model_complete_simple.dfjson', 'model_multiple_buildings.dfjson',
+                   'model_with_doors_skylights.dfjson'):
+        file_path = os.path.join(target_folder, sample)
+        with open(file_path, 'r') as f:
+            model = Model.model_validate_json(f.read())
+        model_json = model.model_dump_json()
+        rounded_json = model.model_dump_json(round_coordinates=True)
+        assert len(rounded_json) <= len(model_json)
+        new_model = Model.model_validate_json(rounded_json)
+        _assert_close(model.model_dump(mode='json'), new_model.model_dump(mode='json'),
+                      model.tolerance / 2)
+        assert model.model_dump_json() == model_json
+
+
+def test_model_load_geometry_only():
+    for sample in ('model_complete_simple.dfjson', 'model_multiple_buildings.dfjson',
+                   'model_with_doors_skylights.dfjson'):
+        file_path = os.path.join(target_folder, sample)
+        with open(file_path) as f:
+            model_dict = json.load(f)
+        model = Model.load(file_path)
+        geo_model = Model.load(file_path, include=('geometry',))
+        assert isinstance(geo_model, Model)
+        assert geo_model.properties.energy == model_dict['properties']['energy']
+        room = geo_model.buildings[0].unique_stories[0].room_2ds[0]
+        room_dict = model_dict['buildings'][0]['unique_stories'][0]['room_2ds'][0]
+        assert isinstance(room, Room2D)
+        assert room.properties.energy == room_dict['properties']['energy']
+        assert room.floor_boundary == model.buildings[0].unique_stories[0].\
+            room_2ds[0].floor_boundary
+
+        # the raw extension properties are written back out unchanged
+        geo_dict = json.loads(geo_model.model_dump_json(exclude_unset=True))
+        for key in ('energy', 'radiance'):
+            assert geo_dict['properties'].get(key) == \
+                model_dict['properties'].get(key)
+            assert geo_dict['buildings'][0]['properties'].get(key) == \
+                model_dict['buildings'][0]['properties'].get(key)
+
+        en_model = Model.load(file_path, include=('geometry', 'energy'))
+        assert en_model.properties.energy == model.properties.energy
+        assert en_model.properties.radiance == model_dict['properties'].get('radiance')
+
+    with pytest.raises(ValueError):
+        Model.load(file_path, include=('geometry', 'acoustics'))
+
+
+def _box_room(identifier):
+    """Get a dictionary for a simple Honeybee Room to be used as a room_3d."""
+    faces = []
+    for i in range(6):
+        faces.append({
+            'type': 'Face', 'identifier': '{}_Face{}'.format(identifier, i),
+            'geometry': {
+                'type': 'Face3D',
+                'boundary': [[0, 0, 0], [1, 0, 0], [1, 1, 0], [0, 1, 0]]
+            },
+            'face_type': 'Wall', 'boundary_condition': {'type': 'Outdoors'},
+            'properties': {'type': 'FacePropertiesAbridged'}
+        })
+    return {
+        'type': 'Room', 'identifier': identifier, 'faces': faces,
+        'properties': {'type': 'RoomPropertiesAbridged'}
+    }
+
+
+def test_model_load_raw_room_3ds(tmp_path):
+    file_path = os.path.join(target_folder, 'model_complete_simple.dfjson')
+    with open(file_path) as f:
+        model_dict = json.load(f)
+    room_dicts = [_box_room('Room3D_{}'.format(i)) for i in range(3)]
+    model_dict['buildings'][0]['room_3ds'] = room_dicts
+    file_path = str(tmp_path / 'model_room_3ds.dfjson')
+    with open(file_path, 'w') as f:
+        json.dump(model_dict, f)
+
+    model = Model.load(file_path, include=('geometry', 'energy', 'radiance'))
+    bldg = model.buildings[0]
+    assert isinstance(bldg, Building)
+    assert all(isinstance(r, dict) for r in bldg.__dict__['room_3ds'])
+    dumped = json.loads(model.model_dump_json(exclude_unset=True))
+    assert dumped['buildings'][0]['room_3ds'] == room_dicts
+    assert bldg.room_3ds == room_dicts  # reading the attribute validates nothing
+    assert [r.identifier for r in bldg.validate_room_3ds()] == \
+        ['Room3D_0', 'Room3D_1', 'Room3D_2']
+    assert not any(isinstance(r, dict) for r in bldg.room_3ds)
+
+    model = Model.load(file_path, include=('geometry',))
+    rooms = model.buildings[0].validate_room_3ds()
+    assert len(rooms) == 3 and not isinstance(rooms[0], dict)
+    full_model = Model.load(file_path)
+    assert model.model_dump_json(exclude_unset=True) == \
+        Model.load(file_path, include=('geometry', 'room_3ds')).\
+        model_dump_json(exclude_unset=True)
+    assert full_model.buildings[0].room_3ds[0].identifier == 'Room3D_0'
+
+
+def test_model_dump_json_exclude_global_sets():
+    file_path = os.path.join(target_folder, 'model_complete_simple.dfjson')
+    model = Model.load(file_path)
+    full_json = model.model_dump_json()
+    model_json = model.model_dump_json(exclude_global_sets=True)
+    assert len(model_json) < len(full_json)
+    model_dict = json.loads(model_json)
+    assert 'global_construction_set' not in model_dict['properties']['energy']
+
+    # the global sets are restored upon loading and one instance is shared
+    new_model = Model.model_validate_json(model_json)
+    assert new_model.model_dump_json() == full_json
+    other_model = Model.model_validate_json(full_json)
+    assert new_model.properties.energy.global_construction_set is \
+        other_model.properties.energy.global_construction_set
+
+    model_json = model.model_dump_json(
+        exclude_global_sets=True, exclude={'properties': {'energy': {'hvacs'}}})
+    assert set(json.loads(model_json)['properties']['energy']).isdisjoint(
+        ('global_construction_set', 'hvacs'))
+
+
+def test_model_global_sets_frozen():
+    file_path = os.path.join(target_folder, 'model_complete_simple.dfjson')
+    model, other_model = Model.load(file_path), Model.load(file_path)
+    global_set = model.properties.energy.global_construction_set
+    with pytest.raises(ValidationError):
+        global_set.wall_set.exterior_construction = 'Other Construction'
+    with pytest.raises(TypeError):
+        global_set.materials.append(global_set.materials[0])
+    with pytest.raises(ValidationError):
+        ModelRadianceProperties().global_modifier_set.modifiers[0].r_reflectance = 1
+    assert model == other_model
+    assert pickle.loads(pickle.dumps(model)) == model
+
+    # an editable copy can be assigned to a Model without changing other Models
+    new_set = thaw(global_set)
+    new_set.wall_set.exterior_construction = 'Other Construction'
+    model.properties.energy.global_construction_set = new_set
+    assert model != other_model
+    assert other_model.properties.energy.global_construction_set.wall_set \
+        .exterior_construction != 'Other Construction'
+
+
+def test_model_construct_units():
+    model = Model.model_construct(identifier='Constructed_Model')
+    assert model.units == 'Meters'
+    assert type(model.units).__name__ == 'Units'
+    assert json.loads(model.model_dump_json())['units'] == 'Meters'
+
+
+def test_model_global_sets_schema():
+    schema = ModelRadianceProperties.model_json_schema()
+    field_schema = schema['properties']['global_modifier_set']
+    assert field_schema['readOnly']
+    assert field_schema['default'] == \
+        ModelRadianceProperties().global_modifier_set.model_dump(mode='json')
+
+
+def test_model_rebuild_lazy_extensions():
+    from dragonfly_schema.model import Room2DPropertiesAbridged
+    Room = None  # noqa: F841 names in the calling frame do not affect the types
+    assert Room2DPropertiesAbridged.model_rebuild(force=True)
+    with open(os.path.join(target_folder, 'room2d_simple.json')) as f:
+        room = Room2D.model_validate_json(f.read())
+    assert Room2DPropertiesAbridged.model_validate(room.properties.model_dump())
+    assert Model.model_rebuild() is None
@@ -0,0 +1,102 @@
+from dragonfly_schema.model import Model, Room2D
+from dragonfly_schema import profiling
+from dragonfly_schema.profiling import ValidationProfile
+import os
+import json
+import threading
+
+import pytest
+
+# target folder where all of the samples live
+root = os.path.dirname(os.path.dirname(__file__))
+target_folder = os.path.join(root, 'samples')
+
+
+def test_validation_profile(tmp_path):
+    file_path = os.path.join(target_folder, 'model_multiple_buildings.dfjson')
+    with open(file_path, 'rb') as f:
+        model_json = f.read()
+    model = Model.model_validate_json(model_json)
+    validator = Model.__pydantic_validator__
+
+    with ValidationProfile() as profile:
+        profiled_model = Model.model_validate_json(model_json)
+    assert profiled_model == model
+    assert Model.__pydantic_validator__ is validator
+
+    room_count = sum(len(story.room_2ds) for bldg in model.buildings
+                     for story in bldg.unique_stories)
+    results = {r.name: r for r in profile.results()}
+    assert results['Model'].calls == 1
+    assert results['Building'].calls == len(model.buildings)
+    assert results['Room2D'].calls == room_count
+    assert results['Room2D'].kind == 'model'
+    assert results['Room2D.check_segment_count'].calls == room_count
+    assert results['Room2D.check_segment_count'].kind == 'validator'
+    assert results['Room2D.window_parameters'].kind == 'field'
+    assert results['Model'].total_time >= results['Building'].total_time
+    assert results['Room2D'].total_time >= results['Room2D'].self_time
+    assert 'Room2D.check_segment_count' in profile.table(limit=100)
+    assert len(profile.table(limit=5).splitlines()) == 6
+
+    out_path = str(tmp_path / 'validation.speedscope.json')
+    profile.write_speedscope(out_path)
+    with open(out_path) as f:
+        speedscope = json.load(f)
+    frames = speedscope['shared']['frames']
+    events = speedscope['profiles'][0]['events']
+    assert len(events) == 2 * sum(r.calls for r in profile.results())
+    stack = []
+    for event in events:  # events must be nested
+        if event['type'] == 'O':
+            stack.append(event['frame'])
+        else:
+            assert stack.pop() == event['frame']
+    assert not stack
+    assert frames[events[0]['frame']]['name'] == 'Model'
+
+
+def test_validation_profile_classes():
+    file_path = os.path.join(target_folder, 'room2d_simple.json')
+    with open(file_path) as f:
+        room_dict = json.load(f)
+    with ValidationProfile(classes=[Room2D], fields=False) as profile:
+        Room2D.model_validate(room_dict)
+        with pytest.raises(RuntimeError):
+            with ValidationProfile(classes=[Room2D]):
+                pass
+    names = [r.name for r in profile.results()]
+    assert 'Room2D' in names
+    assert not any(r.kind == 'field' for r in profile.results())
+
+
+def test_validation_profile_threads():
+    file_path = os.path.join(target_folder, 'room2d_simple.json')
+    with open(file_path) as f:
+        room_dict = json.load(f)
+    validator = Room2D.__pydantic_validator__
+    other_profiles = []
+
+    def validate_in_thread():
+        Room2D.model_validate(room_dict)  # not recorded in the profile of the test
+        with ValidationProfile(classes=[Room2D]) as other_profile:
+            Room2D.model_validate(room_dict)
+        other_profiles.append(other_profile)
+
+    with ValidationProfile(classes=[Room2D]) as profile:
+        thread = threading.Thread(target=validate_in_thread)
+        thread.start()
+        thread.join()
+        assert Room2D.__pydantic_validator__ is not validator
+    assert Room2D.__pydantic_validator__ is validator
+    assert {r.name: r for r in profile.results()}.get('Room2D') is None
+    assert {r.name: r for r in other_profiles[0].results()}['Room2D'].calls == 1
+
+
+def test_validation_profile_build_error(monkeypatch):
+    def fail(schema):
+        raise RuntimeError('Failed to build the validator.')
+    monkeypatch.setattr(profiling, 'SchemaValidator', fail)
+    with pytest.raises(RuntimeError):
+        profiling._instrumented_validator.__wrapped__(Room2D, True)
+    assert Room2D.__pydantic_complete__ and Model.__pydantic_complete__
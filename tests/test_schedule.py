@@ -0,0 +1,65 @@
+from dragonfly_schema.energy.schedule import ScheduleFixedIntervalAbridged, \
+    encode_values
+from array import array
+import json
+
+import pytest
+from pydantic import ValidationError
+
+
+def _schedule_dict(values):
+    """Get a dictionary of a ScheduleFixedIntervalAbridged."""
+    return {
+        'type': 'ScheduleFixedIntervalAbridged',
+        'identifier': 'Hourly_Occupancy',
+        'values': values
+    }
+
+
+def test_schedule_fixed_interval_list():
+    values = [(i % 24) / 24 for i in range(8760)]
+    schedule = ScheduleFixedIntervalAbridged.model_validate(_schedule_dict(values))
+    assert isinstance(schedule.values, array)
+    assert schedule.values.typecode == 'd'
+    assert json.loads(schedule.model_dump_json())['values'] == values
+
+    encoded = json.loads(
+        schedule.model_dump_json(context={'schedule_values': 'float64'}))
+    assert encoded['values']['type'] == 'EncodedValues'
+    assert len(json.dumps(encoded)) < len(json.dumps(_schedule_dict(values)))
+
+    with pytest.raises(ValidationError):
+        ScheduleFixedIntervalAbridged.model_validate(_schedule_dict(values[:25]))
+
+
+def test_schedule_fixed_interval_encoded():
+    values = [(i % 24) / 24 for i in range(8760)]
+    for dtype in ('float64', 'float32'):
+        sch_dict = _schedule_dict(encode_values(values, dtype).model_dump())
+        schedule = ScheduleFixedIntervalAbridged.model_validate_json(
+            json.dumps(sch_dict))
+        assert schedule.values == array('d' if dtype == 'float64' else 'f', values)
+        # encoded values are written back out in the same way by default
+        assert json.loads(schedule.model_dump_json()) == \
+            ScheduleFixedIntervalAbridged.model_validate(sch_dict).model_dump()
+        assert schedule.model_dump()['values']['dtype'] == dtype
+        list_values = schedule.model_dump(context={'schedule_values': 'list'})['values']
+        assert list_values == pytest.approx(values)
+
+    # raw binary values from binary formats
+    schedule = ScheduleFixedIntervalAbridged.model_validate(
+        _schedule_dict(array('d', values).tobytes()))
+    assert schedule.values == array('d', values)
+    # the encoding of the input values does not affect equality
+    list_schedule = ScheduleFixedIntervalAbridged.model_validate(_schedule_dict(values))
+    assert schedule == list_schedule
+    assert schedule != ScheduleFixedIntervalAbridged.model_validate(
+        _schedule_dict(values[::-1]))
+
+
+def test_schedule_fixed_interval_json_schema():
+    schema = ScheduleFixedIntervalAbridged.model_json_schema()
+    list_schema = next(
+        s for s in schema['properties']['values']['anyOf'] if s.get('type') == 'array')
+    assert list_schema['minItems'] == 24
+    assert list_schema['maxItems'] == 527040
@@ -0,0 +1,24 @@
+from dragonfly_schema.model import Model
+from dragonfly_schema.schema_cache import json_schema, build_cache, cache_path, \
+    generate_json_schema
+import os
+
+
+def test_json_schema_cache(tmp_path):
+    root = str(tmp_path)
+    cache_file = cache_path(root)
+    schema = json_schema(root)
+    assert not os.path.isfile(cache_file)  # nothing is written without a build
+    assert schema == generate_json_schema()
+    assert build_cache(root) == cache_file
+    assert os.path.isfile(cache_file)
+    assert json_schema(root) == schema
+
+
+def test_model_json_schema_prebuilt(tmp_path, monkeypatch):
+    monkeypatch.setenv('DRAGONFLY_SCHEMA_CACHE_DIR', str(tmp_path))
+    build_cache()
+    with open(cache_path(), 'w') as f:
+        f.write('{"title": "Cached"}')
+    assert Model.model_json_schema() == {'title': 'Cached'}
+    assert Model.model_json_schema(mode='validation')['title'] == 'Model'
@@ -0,0 +1,55 @@
+from dragonfly_schema.model import Model
+from dragonfly_schema.section import load_section, _JSONScanner
+import os
+import io
+import json
+
+import pytest
+
+# target folder where all of the samples live
+root = os.path.dirname(os.path.dirname(__file__))
+target_folder = os.path.join(root, 'samples')
+
+
+def test_load_section():
+    file_path = os.path.join(target_folder, 'model_multiple_buildings.dfjson')
+    with open(file_path, 'rb') as f:
+        model = Model.model_validate_json(f.read())
+
+    programs = load_section(file_path, '/properties/energy/program_types')
+    assert programs == model.properties.energy.program_types
+    modifiers = load_section(file_path, '/properties/radiance/modifiers')
+    assert modifiers == model.properties.radiance.modifiers
+    room = load_section(file_path, '/buildings/1/unique_stories/0/room_2ds/0')
+    assert room == model.buildings[1].unique_stories[0].room_2ds[0]
+    assert load_section(file_path, '/tolerance') == model.tolerance
+    assert load_section(file_path, '') == model
+
+    with pytest.raises(ValueError):
+        load_section(file_path, '/properties/energy/not_a_field')
+    with pytest.raises(ValueError):
+        load_section(file_path, '/buildings/100')
+
+
+def test_json_scanner_chunks():
+    doc = {
+        'a': [{'x': 'a\\"[b}'}, '\\\\', {'y': '"]]'}],
+        'b': {'c': [1, 2.5, {'d': '}'}], 'e/f': None}
+    }
+    doc_bytes = json.dumps(doc).encode()
+    for chunk_size in range(1, 20):
+        scanner = _JSONScanner(io.BytesIO(doc_bytes), chunk_size)
+        scanner.seek_key('b')
+        scanner.seek_key('c')
+        scanner.seek_index(2)
+        assert json.loads(scanner.capture_value()) == {'d': '}'}
+
+    file_path = os.path.join(target_folder, 'model_with_doors_skylights.dfjson')
+    with open(file_path, 'rb') as f:
+        doc_bytes = f.read()
+    doc = json.loads(doc_bytes)
+    for chunk_size in (1, 7, 1000):
+        for key in doc:
+            scanner = _JSONScanner(io.BytesIO(doc_bytes), chunk_size)
+            scanner.seek_key(key)
+            assert json.loads(scanner.capture_value()) == doc[key]
@@ -0,0 +1,74 @@
+from dragonfly_schema.model import Room2D
+from dragonfly_schema.segment_parameter import CompactBoundaryConditions, \
+    CompactWindowParameters
+from honeybee_schema.boundarycondition import Ground, Outdoors
+from pydantic import ValidationError
+import os
+import json
+import pytest
+
+# target folder where all of the samples live
+root = os.path.dirname(os.path.dirname(__file__))
+target_folder = os.path.join(root, 'samples')
+
+
+def _room2d_dict():
+    file_path = os.path.join(target_folder, 'room2d_simple.json')
+    with open(file_path, 'r') as f:
+        return json.load(f)
+
+
+def test_room2d_compact_segment_lists():
+    room_dict = _room2d_dict()
+    room_dict['boundary_conditions'] = {
+        'type': 'CompactBoundaryConditions',
+        'default': {'type': 'Outdoors'},
+        'indices': [1, 3],
+        'values': [{'type': 'Ground'}, {'type': 'Ground'}]
+    }
+    room_dict['window_parameters'] = {
+        'type': 'CompactWindowParameters',
+        'default': {'type': 'SimpleWindowRatio', 'window_ratio': 0.4},
+        'indices': [1, 3],
+        'values': [None, None]
+    }
+    room_dict['air_boundaries'] = {'type': 'CompactAirBoundaries'}
+    room = Room2D.model_validate_json(json.dumps(room_dict))
+    assert isinstance(room.boundary_conditions, CompactBoundaryConditions)
+    assert isinstance(room.window_parameters, CompactWindowParameters)
+
+    bcs = room.segment_list('boundary_conditions')
+    assert len(bcs) == 4
+    assert isinstance(bcs[0], Outdoors) and isinstance(bcs[1], Ground)
+    assert bcs[0] is bcs[2]
+    assert bcs == room.segment_list('boundary_conditions')
+    assert room == Room2D.model_validate_json(json.dumps(room_dict))  # not changed
+    win_pars = room.segment_list('window_parameters')
+    assert win_pars[1] is None and win_pars[0].window_ratio == 0.4
+    assert room.segment_list('air_boundaries') == [False] * 4
+    assert len(room.segment_list('shading_parameters')) == 4
+
+    # check that the compact form round-trips
+    new_room = Room2D.model_validate_json(room.model_dump_json())
+    assert new_room.model_dump() == room.model_dump()
+
+
+def test_room2d_compact_segment_count():
+    room_dict = _room2d_dict()
+    room_dict['boundary_conditions'] = {
+        'type': 'CompactBoundaryConditions',
+        'default': {'type': 'Outdoors'},
+        'indices': [4],
+        'values': [{'type': 'Ground'}]
+    }
+    with pytest.raises(ValidationError):
+        Room2D.model_validate_json(json.dumps(room_dict))
+
+    room_dict['boundary_conditions']['indices'] = [3, 3]
+    room_dict['boundary_conditions']['values'] = [{'type': 'Ground'}] * 2
+    with pytest.raises(ValidationError):
+        Room2D.model_validate_json(json.dumps(room_dict))
+
+    room_dict['boundary_conditions']['indices'] = [3]
+    with pytest.raises(ValidationError):
+        Room2D.model_validate_json(json.dumps(room_dict))
@@ -0,0 +1,144 @@
+from dragonfly_schema import server as server_module
+from dragonfly_schema.server import ValidationServer
+import os
+import json
+import gzip
+import asyncio
+
+# target folder where all of the samples live
+root = os.path.dirname(os.path.dirname(__file__))
+target_folder = os.path.join(root, 'samples')
+
+
+async def _request(address, method, path, body=b'', headers=None, length=None):
+    """Send a single request to the server and get the status and JSON response."""
+    reader, writer = await asyncio.open_connection(*address[:2])
+    length = len(body) if length is None else length
+    head = [f'{method} {path} HTTP/1.1', 'Host: localhost', 'Connection: close',
+            f'Content-Length: {length}']
+    head.extend(f'{k}: {v}' for k, v in (headers or {}).items())
+    writer.write('\r\n'.join(head).encode() + b'\r\n\r\n' + body)
+    await writer.drain()
+    response = await reader.read()
+    writer.close()
+    head, content = response.split(b'\r\n\r\n', 1)
+    return int(head.split()[1]), json.loads(content)
+
+
+def _sample(name='model_complete_simple.dfjson'):
+    with open(os.path.join(target_folder, name), 'rb') as f:
+        return f.read()
+
+
+def test_validation_server():
+    async def run():
+        async with ValidationServer(processes=1, max_size=1_000_000) as server:
+            await server.start(port=0)
+            address = server.address
+
+            status, report = await _request(address, 'POST', '/validate', _sample())
+            assert status == 200
+            assert report['status'] == 'valid'
+            assert report['type'] == 'Model'
+            assert report['latency'] >= report['parse_time'] > 0
+
+            status, report = await _request(
+                address, 'POST', '/validate', gzip.compress(_sample('story_simple.json')),
+                {'Content-Encoding': 'gzip'})
+            assert status == 200
+            assert report['type'] == 'Story'
+
+            invalid = json.loads(_sample())
+            invalid['tolerance'] = -1
+            status, report = await _request(
+                address, 'POST', '/validate', json.dumps(invalid).encode())
+            assert status == 200
+            assert report['status'] == 'invalid'
+            assert report['errors'][0]['path'] == '/tolerance'
+
+            # bodies that are too large are rejected before they are sent
+            status, _ = await _request(address, 'POST', '/validate', length=1_000_001)
+            assert status == 413
+            status, _ = await _request(
+                address, 'POST', '/validate', gzip.compress(b' ' * 1_000_001),
+                {'Content-Encoding': 'gzip'})
+            assert status == 413
+
+            assert (await _request(address, 'GET', '/validate'))[0] == 405
+            assert (await _request(address, 'GET', '/unknown'))[0] == 404
+            assert await _request(address, 'GET', '/health') == (200, {'status': 'ok'})
+
+            status, metrics = await _request(address, 'GET', '/metrics')
+            assert status == 200
+            assert metrics['requests'] == 5
+            assert metrics['valid'] == 2
+            assert metrics['invalid'] == 1
+            assert metrics['rejected'] == 2
+            assert metrics['processes'] == 1
+
+    asyncio.run(run())
+
+
+def test_validation_server_back_pressure():
+    async def run():
+        async with ValidationServer(processes=1, max_pending=1) as server:
+            await server.start(port=0)
+            address = server.address
+
+            # a request that has sent its headers but not yet its body is pending
+            body = _sample()
+            reader, writer = await asyncio.open_connection(*address[:2])
+            writer.write('POST /validate HTTP/1.1\r\nContent-Length: {}\r\n\r\n'.format(
+                len(body)).encode())
+            await writer.drain()
+            while (await _request(address, 'GET', '/metrics'))[1]['pending'] == 0:
+                await asyncio.sleep(0.01)
+
+            status, _ = await _request(address, 'POST', '/validate', body)
+            assert status == 503
+
+            writer.write(body)
+            await writer.drain()
+            assert (await reader.readline()).split()[1] == b'200'
+            writer.close()
+
+    asyncio.run(run())
+
+
+def _crash(*args):
+    """Stand in for the validation of a request that kills the worker process."""
+    os._exit(1)
+
+
+def _fail(*args):
+    """Stand in for the validation of a request that fails unexpectedly."""
+    raise RuntimeError('Unexpected failure.')
+
+
+def test_validation_server_failures(monkeypatch):
+    async def run():
+        async with ValidationServer(processes=1) as server:
+            await server.start(port=0)
+            address = server.address
+
+            status, report = await _request(address, 'POST', '/validate', length=-5)
+            assert status == 400
+            assert report['status'] == 'error'
+
+            monkeypatch.setattr(server_module, '_validate_request', _fail)
+            status, report = await _request(address, 'POST', '/validate', _sample())
+            assert status == 500
+            assert 'RuntimeError' in report['errors'][0]['message']
+
+            monkeypatch.setattr(server_module, '_validate_request', _crash)
+            status, report = await _request(address, 'POST', '/validate', _sample())
+            assert status == 500
+            assert 'worker process ended' in report['errors'][0]['message']
+
+            # the broken pool of workers is replaced for the next requests
+            monkeypatch.undo()
+            status, report = await _request(address, 'POST', '/validate', _sample())
+            assert status == 200 and report['status'] == 'valid'
+            assert (await _request(address, 'GET', '/metrics'))[1]['error'] == 2
+
+    asyncio.run(run())
@@ -0,0 +1,89 @@
+from dragonfly_schema.model import Model
+from dragonfly_schema.energy.schedule import encode_values
+from dragonfly_schema import trusted
+from dragonfly_schema.trusted import write_trusted, load_trusted, verify_signature, \
+    SIGNATURE_KEY
+import os
+import json
+
+import pytest
+
+# target folder where all of the samples live
+root = os.path.dirname(os.path.dirname(__file__))
+target_folder = os.path.join(root, 'samples')
+
+
+def test_load_trusted(tmp_path):
+    for sample in ('model_complete_simple.dfjson', 'model_multiple_buildings.dfjson',
+                   'model_with_doors_skylights.dfjson'):
+        model = Model.load(os.path.join(target_folder, sample))
+        out_path = str(tmp_path / sample)
+        write_trusted(model, out_path)
+        with open(out_path, 'rb') as f:
+            assert verify_signature(f.read())
+        trusted_model = load_trusted(out_path)
+        assert trusted_model == model
+        assert trusted_model.model_dump_json() == model.model_dump_json()
+
+
+def test_load_trusted_schedule_values(tmp_path):
+    model_dict = Model.load(
+        os.path.join(target_folder, 'model_complete_simple.dfjson')).model_dump()
+    values = [(i % 24) / 24 for i in range(8760)]
+    model_dict['properties']['energy']['schedules'].append({
+        'type': 'ScheduleFixedIntervalAbridged',
+        'identifier': 'Hourly_Occupancy',
+        'values': encode_values(values, 'float32').model_dump()
+    })
+    model = Model.model_validate(model_dict)
+    out_path = str(tmp_path / 'model.dfjson')
+    write_trusted(model, out_path)
+    trusted_model = load_trusted(out_path)
+    assert trusted_model == model
+    assert trusted_model.model_dump_json() == model.model_dump_json()
+
+
+def test_load_trusted_fallback(tmp_path, monkeypatch):
+    model = Model.load(os.path.join(target_folder, 'model_complete_simple.dfjson'))
+    model.user_data = {'author': 'me'}
+    out_path = str(tmp_path / 'model.dfjson')
+    write_trusted(model, out_path, indent=2)
+    with open(out_path, encoding='utf-8') as f:
+        model_dict = json.load(f)
+    assert SIGNATURE_KEY in model_dict['user_data']
+
+    # an edited file is fully validated
+    model_dict['tolerance'] = 0.001
+    with open(out_path, 'w', encoding='utf-8') as f:
+        json.dump(model_dict, f)
+    with open(out_path, 'rb') as f:
+        assert not verify_signature(f.read())
+    edited_model = load_trusted(out_path)
+    assert edited_model.tolerance == 0.001
+    assert edited_model.user_data == {'author': 'me'}
+
+    # a file written by another version of the schema is fully validated
+    write_trusted(model, out_path)
+    monkeypatch.setattr(trusted, 'schema_version', lambda: 'df0.0.0-hb0.0.0')
+    with open(out_path, 'rb') as f:
+        assert not verify_signature(f.read())
+    assert load_trusted(out_path) == model
+
+
+def test_dump_trusted_json_nested_signature(tmp_path):
+    model = Model.load(os.path.join(target_folder, 'model_complete_simple.dfjson'))
+    fake = {SIGNATURE_KEY: {'schema_version': 'df0.0.0-hb0.0.0', 'checksum': '0' * 64}}
+    model.buildings[0].user_data = fake
+    model.user_data = {'nested': fake}
+    out_path = str(tmp_path / 'model.dfjson')
+    write_trusted(model, out_path, indent=2)
+    with open(out_path, 'rb') as f:
+        assert verify_signature(f.read())
+    trusted_model = load_trusted(out_path)
+    assert trusted_model.user_data == {'nested': fake}
+    assert trusted_model.buildings[0].user_data == fake
+
+    with pytest.raises(ValueError, match='user_data'):
+        trusted.dump_trusted_json(model, exclude={'user_data'})
+    with pytest.raises(ValueError, match='user_data'):
+        trusted.dump_trusted_json(model, include={'buildings'})
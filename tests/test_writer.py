@@ -0,0 +1,62 @@
+from dragonfly_schema.model import Model
+from dragonfly_schema.writer import ModelWriter
+import os
+
+import pytest
+
+# target folder where all of the samples live
+root = os.path.dirname(os.path.dirname(__file__))
+target_folder = os.path.join(root, 'samples')
+
+
+def _header_fields(model):
+    """Get a dictionary of the Model fields that are not buildings or context_shades."""
+    return {
+        field: getattr(model, field) for field in Model.model_fields
+        if field not in ('type', 'buildings', 'context_shades')
+    }
+
+
+def test_model_writer(tmp_path):
+    for sample in ('model_complete_simple.dfjson', 'model_multiple_buildings.dfjson',
+                   'model_with_doors_skylights.dfjson'):
+        file_path = os.path.join(target_folder, sample)
+        model = Model.load(file_path)
+        model.context_shades = model.context_shades or []
+        out_path = str(tmp_path / sample)
+        with ModelWriter(out_path, **_header_fields(model)) as writer:
+            # context shades can be added before the buildings are done
+            for shade in model.context_shades:
+                writer.add_context_shade(shade)
+            for bldg in model.buildings:
+                writer.add_building(bldg.model_dump())
+        assert writer.building_count == len(model.buildings)
+        assert writer.shade_count == len(model.context_shades)
+        with open(out_path, encoding='utf-8') as f:
+            assert f.read() == model.model_dump_json()
+
+
+def test_model_writer_invalid():
+    file_path = os.path.join(target_folder, 'model_complete_simple.dfjson')
+    model = Model.load(file_path)
+    fields = _header_fields(model)
+    with pytest.raises(ValueError):
+        ModelWriter(os.devnull, buildings=model.buildings, **fields)
+    fields['tolerance'] = -1
+    with pytest.raises(ValueError):
+        ModelWriter(os.devnull, **fields)
+
+
+def test_model_writer_error(tmp_path):
+    file_path = os.path.join(target_folder, 'model_complete_simple.dfjson')
+    model = Model.load(file_path)
+    out_path = str(tmp_path / 'model.dfjson')
+    with open(out_path, 'w') as f:
+        f.write('{}')
+    with pytest.raises(RuntimeError):
+        with ModelWriter(out_path, **_header_fields(model)) as writer:
+            writer.add_building(model.buildings[0])
+            raise RuntimeError('Failed to generate the next Building.')
+    with open(out_path) as f:  # the existing file is left unchanged
+        assert f.read() == '{}'
+    assert os.listdir(str(tmp_path)) == ['model.dfjson']